@@ -2,20 +2,66 @@
 API dependencies for FastAPI endpoints.
 """
 
-from typing import Generator, Optional
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, ContextManager, Generator, Iterable, Iterator, Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
-from app.core.database import get_db
-from app.core.security import verify_token
+from app.core.config import settings
+from app.core.database import get_db, get_session_factory
+from app.core.roles import ADMIN_ROLES
+from app.core.security import decode_access_token
+from app.services.feedback_form_service import FeedbackFormService
+from app.services.notification_service import NotificationService
+from app.services.performance_cycle_service import PerformanceCycleService
+from app.services.reviewer_selection_service import ReviewerSelectionService
 from app.services.user_service import UserService
 from app.models.user import User
 from app.utils.exceptions import UserNotFoundException
 
+# Opens a session-scoped ReviewerSelectionService when entered
+ReviewerSelectionServiceScope = Callable[[], ContextManager[ReviewerSelectionService]]
+
 # Security scheme
 security = HTTPBearer()
 
+# Verified bearer tokens -> (user, token expiry), so repeat requests within
+# the TTL skip both the JWT verification and the user lookup. The cache is
+# per worker process: invalidate_cached_user only clears the calling worker,
+# so other workers may keep serving a deactivated, deleted or demoted user
+# for up to AUTH_CACHE_TTL_SECONDS. That window is accepted in exchange for
+# no shared lookup per request; keep the TTL short.
+_token_cache: TTLCache = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAXSIZE, ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Build the cache key for a raw bearer token."""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """
+    Remove every cached token that resolves to the given user.
+    
+    Only this worker's cache is cleared; see the note on _token_cache.
+    
+    Args:
+        user_id: User ID whose cached entries should be dropped
+    """
+    with _token_cache_lock:
+        stale_keys = [key for key, (user, _) in list(_token_cache.items()) if user.id == user_id]
+        for key in stale_keys:
+            _token_cache.pop(key, None)
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -40,18 +86,32 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    token = credentials.credentials
+    cache_key = _token_cache_key(token)
+    
+    # Serve recently verified tokens from the cache
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at > time.time():
+            return user
+    
     # Verify token
-    user_id = verify_token(credentials.credentials)
-    if user_id is None:
+    payload = decode_access_token(token)
+    if payload is None or payload.get("sub") is None:
         raise credentials_exception
     
     # Get user from database
     user_service = UserService(db)
     try:
-        user = user_service.get_user_by_id(int(user_id))
+        user = user_service.get_user_by_id(int(payload["sub"]))
     except UserNotFoundException:
         raise credentials_exception
     
+    with _token_cache_lock:
+        _token_cache[cache_key] = (user, payload.get("exp", float("inf")))
+    
     return user
 
 
@@ -93,7 +153,7 @@ def get_current_admin(
     Raises:
         HTTPException: If user is not an admin
     """
-    if current_user.role not in ["System Administrator", "HR Lead"]:
+    if current_user.role not in ADMIN_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="The user doesn't have enough privileges"
@@ -101,6 +161,39 @@ def get_current_admin(
     return current_user
 
 
+class RoleChecker:
+    """
+    Dependency that only lets users with one of the given roles through.
+    
+    Usage:
+        current_user: User = Depends(RoleChecker(REVIEWER_ROLES))
+    """
+    
+    def __init__(self, allowed_roles: Iterable[str], detail: str = "Insufficient permissions"):
+        self.allowed_roles = frozenset(allowed_roles)
+        self.detail = detail
+    
+    def __call__(self, current_user: User = Depends(get_current_user)) -> User:
+        """
+        Check the current user's role.
+        
+        Args:
+            current_user: Current authenticated user
+            
+        Returns:
+            User: Current user if their role is allowed
+            
+        Raises:
+            HTTPException: If the user's role is not allowed
+        """
+        if current_user.role not in self.allowed_roles:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=self.detail
+            )
+        return current_user
+
+
 def get_user_service(db: Session = Depends(get_db)) -> UserService:
     """
     Get user service instance.
@@ -112,3 +205,71 @@ def get_user_service(db: Session = Depends(get_db)) -> UserService:
         UserService: User service instance
     """
     return UserService(db)
+
+
+def get_feedback_form_service(db: Session = Depends(get_db)) -> FeedbackFormService:
+    """
+    Get feedback form service instance.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        FeedbackFormService: Feedback form service instance
+    """
+    return FeedbackFormService(db)
+
+
+def get_notification_service(db: Session = Depends(get_db)) -> NotificationService:
+    """
+    Get notification service instance.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        NotificationService: Notification service instance
+    """
+    return NotificationService(db)
+
+
+def get_performance_cycle_service(db: Session = Depends(get_db)) -> PerformanceCycleService:
+    """
+    Get performance cycle service instance.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        PerformanceCycleService: Performance cycle service instance
+    """
+    return PerformanceCycleService(db)
+
+
+@contextmanager
+def _reviewer_selection_service_scope(session_factory: sessionmaker) -> Iterator[ReviewerSelectionService]:
+    """Yield a reviewer selection service bound to a new session."""
+    with session_factory() as db:
+        yield ReviewerSelectionService(db)
+
+
+def get_reviewer_selection_service(
+    session_factory: sessionmaker = Depends(get_session_factory)
+) -> ReviewerSelectionServiceScope:
+    """
+    Get a reviewer selection service scope.
+    
+    Endpoints enter the scope only around their database work, so the pooled
+    connection is released before the response is serialized and sent.
+    
+    Usage:
+        with selection_service() as service:
+            selection = service.get_my_selection(user_id)
+    
+    Args:
+        session_factory: Database session factory
+        
+    Returns:
+        ReviewerSelectionServiceScope: Callable opening the service scope
+    """
+    return partial(_reviewer_selection_service_scope, session_factory)
@@ -2,17 +2,16 @@
 Authentication endpoints.
 """
 
+import asyncio
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.core.security import create_access_token
+from app.core.security import create_access_token, password_executor
 from app.core.config import settings
 from app.services.user_service import UserService
 from app.schemas.auth import Token, LoginRequest
 from app.core.logging import get_logger
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, get_user_service
 
 logger = get_logger(__name__)
 
@@ -20,16 +19,20 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     login_data: LoginRequest,
-    db: Session = Depends(get_db)
+    user_service: UserService = Depends(get_user_service)
 ) -> Token:
     """
     Authenticate user and return access token.
     
+    Credential checking (user lookup plus argon2) runs on the dedicated
+    password executor; signing the HS256 token is cheap enough to stay on
+    the event loop.
+    
     Args:
         login_data: Login credentials
-        db: Database session
+        user_service: User service instance
         
     Returns:
         Token: Access token response
@@ -37,8 +40,10 @@ def login(
     Raises:
         HTTPException: If authentication fails
     """
-    user_service = UserService(db)
-    user = user_service.authenticate_user(login_data.email, login_data.password)
+    loop = asyncio.get_running_loop()
+    user = await loop.run_in_executor(
+        password_executor, user_service.authenticate_user, login_data.email, login_data.password
+    )
     
     if not user:
         logger.warning("Login failed: invalid credentials", email=login_data.email)
@@ -60,16 +65,17 @@ def login(
 
 
 @router.post("/refresh", response_model=Token)
-def refresh_token(
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+async def refresh_token(
+    current_user = Depends(get_current_user)
 ) -> Token:
     """
     Refresh access token for current user.
     
+    Runs on the event loop since it only signs a token; the user lookup
+    happens in the (sync) get_current_user dependency.
+    
     Args:
         current_user: Current authenticated user
-        db: Database session
         
     Returns:
         Token: New access token response
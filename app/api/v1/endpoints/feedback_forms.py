@@ -2,20 +2,24 @@
 Feedback Form API endpoints.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from typing import Iterator, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import sessionmaker
 
-from app.core.database import get_db
 from app.services.feedback_form_service import FeedbackFormService
 from app.schemas.feedback_form import (
     FeedbackFormCreate,
     FeedbackFormUpdate,
-    FeedbackFormResponse
+    FeedbackFormResponse,
+    FEEDBACK_FORM_LIST_ADAPTER
 )
-from app.api.dependencies import get_current_user, get_current_admin
+from app.api.dependencies import RoleChecker, get_current_admin, get_feedback_form_service
+from app.core.database import get_session_factory
+from app.core.roles import EMPLOYEE, REVIEWER_ROLES
 from app.models.user import User
 from app.core.logging import get_logger
+from app.utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 
 logger = get_logger(__name__)
 
@@ -24,27 +28,19 @@ router = APIRouter()
 
 @router.get("/reviewer/assignments")
 def get_assigned_employees(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    form_service: FeedbackFormService = Depends(get_feedback_form_service),
+    current_user: User = Depends(RoleChecker(REVIEWER_ROLES, "Only reviewers can view assigned employees"))
 ):
     """
     Get assigned employees for reviewer.
     
     Args:
-        db: Database session
+        form_service: Feedback form service instance
         current_user: Current authenticated user
         
     Returns:
         List of assigned employees
     """
-    # Only reviewers can view assigned employees
-    if current_user.role not in ["Mentor", "People Committee"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only reviewers can view assigned employees"
-        )
-    
-    form_service = FeedbackFormService(db)
     assignments = form_service.get_assigned_employees(current_user.id)
     
     return assignments
@@ -56,68 +52,57 @@ def get_feedback_forms(
     employee_id: Optional[int] = Query(None, description="Filter by employee ID"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-) -> List[FeedbackFormResponse]:
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header; overrides page"),
+    form_service: FeedbackFormService = Depends(get_feedback_form_service),
+    current_user: User = Depends(RoleChecker(REVIEWER_ROLES, "Only reviewers can view feedback forms"))
+) -> Response:
     """
     Get feedback forms for reviewer.
     
+    The cursor for the following page is returned in the X-Next-Cursor header.
+    
     Args:
         status: Filter by status
         employee_id: Filter by employee ID
         page: Page number
         limit: Items per page
-        db: Database session
+        cursor: Keyset cursor of the last row of the previous page
+        form_service: Feedback form service instance
         current_user: Current authenticated user
         
     Returns:
-        List[FeedbackFormResponse]: List of feedback forms
+        Response: JSON-encoded list of feedback forms
     """
-    # Only reviewers can view feedback forms
-    if current_user.role not in ["Mentor", "People Committee"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only reviewers can view feedback forms"
-        )
-    
     skip = (page - 1) * limit
-    form_service = FeedbackFormService(db)
     forms = form_service.get_forms_by_reviewer(
-        current_user.id, skip=skip, limit=limit, status=status
+        current_user.id, skip=skip, limit=limit, status=status, employee_id=employee_id, cursor=cursor
     )
     
-    # Filter by employee_id if provided
-    if employee_id:
-        forms = [form for form in forms if form.employee_id == employee_id]
+    headers = {}
+    cursor_value = next_cursor(forms, limit)
+    if cursor_value:
+        headers[NEXT_CURSOR_HEADER] = cursor_value
     
-    return forms
+    return Response(content=FEEDBACK_FORM_LIST_ADAPTER.dump_json(forms), media_type="application/json", headers=headers)
 
 
 @router.post("/reviewer/feedback-forms", response_model=FeedbackFormResponse)
 def create_feedback_form(
     form_create: FeedbackFormCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    form_service: FeedbackFormService = Depends(get_feedback_form_service),
+    current_user: User = Depends(RoleChecker(REVIEWER_ROLES, "Only reviewers can create feedback forms"))
 ) -> FeedbackFormResponse:
     """
     Create feedback form (Reviewer only).
     
     Args:
         form_create: Feedback form creation data
-        db: Database session
+        form_service: Feedback form service instance
         current_user: Current authenticated user
         
     Returns:
         FeedbackFormResponse: Created feedback form data
     """
-    # Only reviewers can create feedback forms
-    if current_user.role not in ["Mentor", "People Committee"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only reviewers can create feedback forms"
-        )
-    
-    form_service = FeedbackFormService(db)
     form = form_service.create_form(form_create, current_user.id)
     
     logger.info("Feedback form created", form_id=form.id, reviewer_id=current_user.id)
@@ -128,28 +113,20 @@ def create_feedback_form(
 @router.get("/reviewer/feedback-forms/{form_id}", response_model=FeedbackFormResponse)
 def get_feedback_form(
     form_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    form_service: FeedbackFormService = Depends(get_feedback_form_service),
+    current_user: User = Depends(RoleChecker(REVIEWER_ROLES, "Only reviewers can view feedback forms"))
 ) -> FeedbackFormResponse:
     """
     Get feedback form by ID (Reviewer only).
     
     Args:
         form_id: Feedback form ID
-        db: Database session
+        form_service: Feedback form service instance
         current_user: Current authenticated user
         
     Returns:
         FeedbackFormResponse: Feedback form data
     """
-    # Only reviewers can view feedback forms
-    if current_user.role not in ["Mentor", "People Committee"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only reviewers can view feedback forms"
-        )
-    
-    form_service = FeedbackFormService(db)
     form = form_service.get_form_by_id(form_id)
     
     # Check if the form belongs to the current user
@@ -166,8 +143,8 @@ def get_feedback_form(
 def update_feedback_form(
     form_id: int,
     form_update: FeedbackFormUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    form_service: FeedbackFormService = Depends(get_feedback_form_service),
+    current_user: User = Depends(RoleChecker(REVIEWER_ROLES, "Only reviewers can update feedback forms"))
 ) -> FeedbackFormResponse:
     """
     Update feedback form (Reviewer only).
@@ -175,20 +152,12 @@ def update_feedback_form(
     Args:
         form_id: Feedback form ID
         form_update: Feedback form update data
-        db: Database session
+        form_service: Feedback form service instance
         current_user: Current authenticated user
         
     Returns:
         FeedbackFormResponse: Updated feedback form data
     """
-    # Only reviewers can update feedback forms
-    if current_user.role not in ["Mentor", "People Committee"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only reviewers can update feedback forms"
-        )
-    
-    form_service = FeedbackFormService(db)
     form = form_service.update_form(form_id, form_update, current_user.id)
     
     logger.info("Feedback form updated", form_id=form_id, reviewer_id=current_user.id)
@@ -199,28 +168,20 @@ def update_feedback_form(
 @router.delete("/reviewer/feedback-forms/{form_id}")
 def delete_feedback_form(
     form_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    form_service: FeedbackFormService = Depends(get_feedback_form_service),
+    current_user: User = Depends(RoleChecker(REVIEWER_ROLES, "Only reviewers can delete feedback forms"))
 ):
     """
     Delete feedback form (Reviewer only).
     
     Args:
         form_id: Feedback form ID
-        db: Database session
+        form_service: Feedback form service instance
         current_user: Current authenticated user
         
     Returns:
         dict: Success message
     """
-    # Only reviewers can delete feedback forms
-    if current_user.role not in ["Mentor", "People Committee"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only reviewers can delete feedback forms"
-        )
-    
-    form_service = FeedbackFormService(db)
     success = form_service.delete_form(form_id, current_user.id)
     
     if not success:
@@ -239,33 +200,34 @@ def delete_feedback_form(
 def get_my_feedback_forms(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-) -> List[FeedbackFormResponse]:
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header; overrides page"),
+    form_service: FeedbackFormService = Depends(get_feedback_form_service),
+    current_user: User = Depends(RoleChecker({EMPLOYEE}, "Only employees can view their feedback forms"))
+) -> Response:
     """
     Get feedback forms for current employee.
     
+    The cursor for the following page is returned in the X-Next-Cursor header.
+    
     Args:
         page: Page number
         limit: Items per page
-        db: Database session
+        cursor: Keyset cursor of the last row of the previous page
+        form_service: Feedback form service instance
         current_user: Current authenticated user
         
     Returns:
-        List[FeedbackFormResponse]: List of feedback forms
+        Response: JSON-encoded list of feedback forms
     """
-    # Only employees can view their own feedback forms
-    if current_user.role != "Employee":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only employees can view their feedback forms"
-        )
-    
     skip = (page - 1) * limit
-    form_service = FeedbackFormService(db)
-    forms = form_service.get_forms_by_employee(current_user.id, skip=skip, limit=limit)
+    forms = form_service.get_forms_by_employee(current_user.id, skip=skip, limit=limit, cursor=cursor)
+    
+    headers = {}
+    cursor_value = next_cursor(forms, limit)
+    if cursor_value:
+        headers[NEXT_CURSOR_HEADER] = cursor_value
     
-    return forms
+    return Response(content=FEEDBACK_FORM_LIST_ADAPTER.dump_json(forms), media_type="application/json", headers=headers)
 
 
 # Admin endpoints
@@ -274,24 +236,67 @@ def get_all_feedback_forms(
     status: Optional[str] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header; overrides page"),
+    form_service: FeedbackFormService = Depends(get_feedback_form_service),
     current_user: User = Depends(get_current_admin)
-) -> List[FeedbackFormResponse]:
+) -> Response:
     """
     Get all feedback forms (Admin/HR only).
     
+    The cursor for the following page is returned in the X-Next-Cursor header.
+    
     Args:
         status: Filter by status
         page: Page number
         limit: Items per page
-        db: Database session
+        cursor: Keyset cursor of the last row of the previous page
+        form_service: Feedback form service instance
         current_user: Current authenticated user
         
     Returns:
-        List[FeedbackFormResponse]: List of feedback forms
+        Response: JSON-encoded list of feedback forms
     """
     skip = (page - 1) * limit
-    form_service = FeedbackFormService(db)
-    forms = form_service.get_all_forms(skip=skip, limit=limit, status=status)
+    forms = form_service.get_all_forms(skip=skip, limit=limit, status=status, cursor=cursor)
     
-    return forms
+    headers = {}
+    cursor_value = next_cursor(forms, limit)
+    if cursor_value:
+        headers[NEXT_CURSOR_HEADER] = cursor_value
+    
+    return Response(content=FEEDBACK_FORM_LIST_ADAPTER.dump_json(forms), media_type="application/json", headers=headers)
+
+
+def _export_forms_stream(session_factory: sessionmaker, status: Optional[str]) -> Iterator[bytes]:
+    """Stream the export from a session owned by the generator itself."""
+    with session_factory() as db:
+        yield from FeedbackFormService(db).export_forms(status=status)
+
+
+@router.get("/admin/feedback-forms/export")
+def export_feedback_forms(
+    status: Optional[str] = Query(None, description="Filter by status"),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    current_user: User = Depends(get_current_admin)
+) -> StreamingResponse:
+    """
+    Export all feedback forms as NDJSON (Admin/HR only).
+    
+    Rows are streamed from the database in batches, so memory use does not
+    grow with the number of forms. The stream opens its own session: the
+    request's dependencies may be torn down before the body is sent.
+    
+    Args:
+        status: Filter by status
+        session_factory: Database session factory
+        current_user: Current authenticated user
+        
+    Returns:
+        StreamingResponse: Newline-delimited JSON feedback forms
+    """
+    logger.info("Feedback forms export started", exported_by=current_user.id, status=status)
+    
+    return StreamingResponse(
+        _export_forms_stream(session_factory, status),
+        media_type="application/x-ndjson"
+    )
@@ -3,10 +3,9 @@ Health check endpoints.
 """
 
 from datetime import datetime
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Response
 
-from app.core.database import get_db
+from app.core.database import engine
 from app.core.config import settings
 from app.core.logging import get_logger
 
@@ -16,13 +15,17 @@ router = APIRouter()
 
 
 @router.get("/health")
-def health_check():
+async def health_check(response: Response):
     """
     Basic health check endpoint.
     
+    Args:
+        response: Outgoing response
+        
     Returns:
         dict: Health status information
     """
+    response.headers["Cache-Control"] = "public, max-age=5"
     return {
         "status": "healthy",
         "timestamp": datetime.utcnow().isoformat(),
@@ -33,19 +36,20 @@ def health_check():
 
 
 @router.get("/health/detailed")
-def detailed_health_check(db: Session = Depends(get_db)):
+def detailed_health_check():
     """
     Detailed health check with database connectivity test.
     
-    Args:
-        db: Database session
-        
+    Checks out a pooled connection directly instead of opening a session;
+    the engine's pre-ping validates the connection on checkout.
+    
     Returns:
         dict: Detailed health status information
     """
     try:
         # Test database connection
-        db.execute("SELECT 1")
+        with engine.connect():
+            pass
         db_status = "connected"
     except Exception as e:
         logger.error("Database health check failed", error=str(e))
@@ -59,6 +63,7 @@ def detailed_health_check(db: Session = Depends(get_db)):
         "environment": settings.ENVIRONMENT,
         "database": {
             "status": db_status,
+            "pool": engine.pool.status(),
             "url": settings.DATABASE_URL.split("@")[1].split("/")[0] if "@" in settings.DATABASE_URL else "configured"
         },
         "features": {
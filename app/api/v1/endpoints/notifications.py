@@ -2,60 +2,135 @@
 Notification API endpoints.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+import hashlib
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 
-from app.core.database import get_db
 from app.services.notification_service import NotificationService
 from app.schemas.notification import (
     NotificationCreate,
     NotificationUpdate,
-    NotificationResponse
+    NotificationMarkRead,
+    NotificationResponse,
+    NOTIFICATION_LIST_ADAPTER
 )
-from app.api.dependencies import get_current_user, get_current_admin
+from app.api.dependencies import get_current_user, get_current_admin, get_notification_service
 from app.models.user import User
 from app.core.logging import get_logger
+from app.utils.pagination import NEXT_CURSOR_HEADER, next_cursor
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Browsers may keep the badge count but must revalidate it on every poll
+UNREAD_COUNT_CACHE_CONTROL = "private, no-cache"
+
+
+def _unread_count_etag(user_id: int, count: int) -> str:
+    """Build the ETag for a user's unread notification count."""
+    return '"' + hashlib.sha1(f"{user_id}:{count}".encode()).hexdigest() + '"'
+
 
 @router.get("/", response_model=List[NotificationResponse])
 def get_user_notifications(
     unread_only: bool = Query(False, description="Get only unread notifications"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header; overrides page"),
+    notification_service: NotificationService = Depends(get_notification_service),
     current_user: User = Depends(get_current_user)
-) -> List[NotificationResponse]:
+) -> Response:
     """
     Get notifications for current user.
     
+    The cursor for the following page is returned in the X-Next-Cursor header.
+    
     Args:
         unread_only: Get only unread notifications
         page: Page number
         limit: Items per page
-        db: Database session
+        cursor: Keyset cursor of the last row of the previous page
+        notification_service: Notification service instance
         current_user: Current authenticated user
         
     Returns:
-        List[NotificationResponse]: List of notifications
+        Response: JSON-encoded list of notifications
     """
     skip = (page - 1) * limit
-    notification_service = NotificationService(db)
     notifications = notification_service.get_user_notifications(
-        current_user.id, skip=skip, limit=limit, unread_only=unread_only
+        current_user.id, skip=skip, limit=limit, unread_only=unread_only, cursor=cursor
     )
     
-    return notifications
+    headers = {}
+    cursor_value = next_cursor(notifications, limit)
+    if cursor_value:
+        headers[NEXT_CURSOR_HEADER] = cursor_value
+    
+    return Response(content=NOTIFICATION_LIST_ADAPTER.dump_json(notifications), media_type="application/json", headers=headers)
+
+
+@router.get("/unread-count", response_model=None)
+def get_unread_count(
+    request: Request,
+    response: Response,
+    notification_service: NotificationService = Depends(get_notification_service),
+    current_user: User = Depends(get_current_user)
+) -> Union[dict, Response]:
+    """
+    Get the number of unread notifications for current user.
+    
+    The count is usually served from Redis; a matching If-None-Match is
+    answered with 304 Not Modified and no body.
+    
+    Args:
+        request: Incoming request
+        response: Outgoing response
+        notification_service: Notification service instance
+        current_user: Current authenticated user
+        
+    Returns:
+        Union[dict, Response]: Unread notification count, or an empty 304 response
+    """
+    count = notification_service.get_unread_count(current_user.id)
+    
+    etag = _unread_count_etag(current_user.id, count)
+    headers = {"Cache-Control": UNREAD_COUNT_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
+    return {"unread_count": count}
+
+
+@router.get("/has-unread")
+def get_has_unread(
+    response: Response,
+    notification_service: NotificationService = Depends(get_notification_service),
+    current_user: User = Depends(get_current_user)
+) -> dict:
+    """
+    Check whether current user has any unread notification.
+    
+    Serves the badge dot, which needs no count: a cached unread count
+    answers it, otherwise an EXISTS query stops at the first unread row.
+    
+    Args:
+        response: Outgoing response
+        notification_service: Notification service instance
+        current_user: Current authenticated user
+        
+    Returns:
+        dict: Whether an unread notification exists
+    """
+    response.headers["Cache-Control"] = UNREAD_COUNT_CACHE_CONTROL
+    return {"has_unread": notification_service.has_unread(current_user.id)}
 
 
 @router.put("/{notification_id}/read", response_model=NotificationResponse)
 def mark_notification_as_read(
     notification_id: int,
-    db: Session = Depends(get_db),
+    notification_service: NotificationService = Depends(get_notification_service),
     current_user: User = Depends(get_current_user)
 ) -> NotificationResponse:
     """
@@ -63,43 +138,59 @@ def mark_notification_as_read(
     
     Args:
         notification_id: Notification ID
-        db: Database session
+        notification_service: Notification service instance
         current_user: Current authenticated user
         
     Returns:
         NotificationResponse: Updated notification data
     """
-    notification_service = NotificationService(db)
-    notification = notification_service.mark_as_read(notification_id)
-    
-    # Check if the notification belongs to the current user
-    if notification.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only mark your own notifications as read"
-        )
+    # Ownership is enforced by the UPDATE itself; other users' notifications are reported as not found
+    notification = notification_service.mark_as_read(notification_id, current_user.id)
     
     logger.info("Notification marked as read", notification_id=notification_id, user_id=current_user.id)
     
     return notification
 
 
+@router.put("/read")
+def mark_notifications_as_read(
+    mark_read: NotificationMarkRead,
+    notification_service: NotificationService = Depends(get_notification_service),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Mark several notifications of the current user as read in one request.
+    
+    Args:
+        mark_read: IDs of the notifications to mark
+        notification_service: Notification service instance
+        current_user: Current authenticated user
+        
+    Returns:
+        dict: Success message with count
+    """
+    count = notification_service.mark_many_as_read(current_user.id, mark_read.ids)
+    
+    logger.info("Notifications marked as read", user_id=current_user.id, count=count)
+    
+    return {"message": f"Marked {count} notifications as read"}
+
+
 @router.put("/read-all")
 def mark_all_notifications_as_read(
-    db: Session = Depends(get_db),
+    notification_service: NotificationService = Depends(get_notification_service),
     current_user: User = Depends(get_current_user)
 ):
     """
     Mark all notifications as read for current user.
     
     Args:
-        db: Database session
+        notification_service: Notification service instance
         current_user: Current authenticated user
         
     Returns:
         dict: Success message with count
     """
-    notification_service = NotificationService(db)
     count = notification_service.mark_all_as_read(current_user.id)
     
     logger.info("All notifications marked as read", user_id=current_user.id, count=count)
@@ -112,33 +203,41 @@ def mark_all_notifications_as_read(
 def get_all_notifications(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header; overrides page"),
+    notification_service: NotificationService = Depends(get_notification_service),
     current_user: User = Depends(get_current_admin)
-) -> List[NotificationResponse]:
+) -> Response:
     """
     Get all notifications (Admin/HR only).
     
+    The cursor for the following page is returned in the X-Next-Cursor header.
+    
     Args:
         page: Page number
         limit: Items per page
-        db: Database session
+        cursor: Keyset cursor of the last row of the previous page
+        notification_service: Notification service instance
         current_user: Current authenticated user
         
     Returns:
-        List[NotificationResponse]: List of notifications
+        Response: JSON-encoded list of notifications
     """
     skip = (page - 1) * limit
-    notification_service = NotificationService(db)
-    notifications = notification_service.get_all_notifications(skip=skip, limit=limit)
+    notifications = notification_service.get_all_notifications(skip=skip, limit=limit, cursor=cursor)
+    
+    headers = {}
+    cursor_value = next_cursor(notifications, limit)
+    if cursor_value:
+        headers[NEXT_CURSOR_HEADER] = cursor_value
     
-    return notifications
+    return Response(content=NOTIFICATION_LIST_ADAPTER.dump_json(notifications), media_type="application/json", headers=headers)
 
 
 @router.post("/admin/notifications", response_model=NotificationResponse)
 def create_notification(
     notification_create: NotificationCreate,
     user_id: int,
-    db: Session = Depends(get_db),
+    notification_service: NotificationService = Depends(get_notification_service),
     current_user: User = Depends(get_current_admin)
 ) -> NotificationResponse:
     """
@@ -147,13 +246,12 @@ def create_notification(
     Args:
         notification_create: Notification creation data
         user_id: User ID to create notification for
-        db: Database session
+        notification_service: Notification service instance
         current_user: Current authenticated user
         
     Returns:
         NotificationResponse: Created notification data
     """
-    notification_service = NotificationService(db)
     notification = notification_service.create_notification(notification_create, user_id)
     
     logger.info("Notification created", notification_id=notification.id, user_id=user_id, created_by=current_user.id)
@@ -165,7 +263,7 @@ def create_notification(
 def update_notification(
     notification_id: int,
     notification_update: NotificationUpdate,
-    db: Session = Depends(get_db),
+    notification_service: NotificationService = Depends(get_notification_service),
     current_user: User = Depends(get_current_admin)
 ) -> NotificationResponse:
     """
@@ -174,13 +272,12 @@ def update_notification(
     Args:
         notification_id: Notification ID
         notification_update: Notification update data
-        db: Database session
+        notification_service: Notification service instance
         current_user: Current authenticated user
         
     Returns:
         NotificationResponse: Updated notification data
     """
-    notification_service = NotificationService(db)
     notification = notification_service.update_notification(notification_id, notification_update)
     
     logger.info("Notification updated", notification_id=notification_id, updated_by=current_user.id)
@@ -191,7 +288,7 @@ def update_notification(
 @router.delete("/admin/notifications/{notification_id}")
 def delete_notification(
     notification_id: int,
-    db: Session = Depends(get_db),
+    notification_service: NotificationService = Depends(get_notification_service),
     current_user: User = Depends(get_current_admin)
 ):
     """
@@ -199,13 +296,12 @@ def delete_notification(
     
     Args:
         notification_id: Notification ID
-        db: Database session
+        notification_service: Notification service instance
         current_user: Current authenticated user
         
     Returns:
         dict: Success message
     """
-    notification_service = NotificationService(db)
     success = notification_service.delete_notification(notification_id)
     
     if not success:
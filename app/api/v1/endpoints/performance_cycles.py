@@ -2,18 +2,18 @@
 Performance Cycle API endpoints.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+import hashlib
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 
-from app.core.database import get_db
 from app.services.performance_cycle_service import PerformanceCycleService
 from app.schemas.performance_cycle import (
     PerformanceCycleCreate,
     PerformanceCycleUpdate,
-    PerformanceCycleResponse
+    PerformanceCycleResponse,
+    PERFORMANCE_CYCLE_LIST_ADAPTER
 )
-from app.api.dependencies import get_current_user, get_current_admin
+from app.api.dependencies import get_current_user, get_current_admin, get_performance_cycle_service
 from app.models.user import User
 from app.core.logging import get_logger
 
@@ -22,23 +22,39 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+ACTIVE_CYCLE_CACHE_CONTROL = "public, max-age=60"
+
+
+def _cycle_etag(cycle: PerformanceCycleResponse) -> str:
+    """Build the ETag for a performance cycle representation."""
+    version = (cycle.updated_at or cycle.created_at).isoformat()
+    return '"' + hashlib.sha1(f"{cycle.id}:{version}".encode()).hexdigest() + '"'
+
+
 @router.get("/active", response_model=PerformanceCycleResponse)
 def get_active_performance_cycle(
-    db: Session = Depends(get_db)
-) -> PerformanceCycleResponse:
+    request: Request,
+    response: Response,
+    cycle_service: PerformanceCycleService = Depends(get_performance_cycle_service)
+) -> Union[PerformanceCycleResponse, Response]:
     """
     Get active performance cycle.
     
+    Sets Cache-Control and ETag headers and answers a matching
+    If-None-Match with 304 Not Modified.
+    
     Args:
-        db: Database session
+        request: Incoming request
+        response: Outgoing response
+        cycle_service: Performance cycle service instance
         
     Returns:
-        PerformanceCycleResponse: Active performance cycle data
+        Union[PerformanceCycleResponse, Response]: Active performance cycle data,
+            or an empty 304 response
         
     Raises:
         HTTPException: If no active cycle found
     """
-    cycle_service = PerformanceCycleService(db)
     cycle = cycle_service.get_active_cycle()
     
     if not cycle:
@@ -47,6 +63,12 @@ def get_active_performance_cycle(
             detail="No active performance cycle found"
         )
     
+    etag = _cycle_etag(cycle)
+    headers = {"Cache-Control": ACTIVE_CYCLE_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
     return cycle
 
 
@@ -55,9 +77,9 @@ def get_performance_cycles(
     status: Optional[str] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    cycle_service: PerformanceCycleService = Depends(get_performance_cycle_service),
     current_user: User = Depends(get_current_admin)
-) -> List[PerformanceCycleResponse]:
+) -> Response:
     """
     Get all performance cycles with optional filtering (Admin/HR only).
     
@@ -65,23 +87,22 @@ def get_performance_cycles(
         status: Filter by status
         page: Page number
         limit: Items per page
-        db: Database session
+        cycle_service: Performance cycle service instance
         current_user: Current authenticated user
         
     Returns:
-        List[PerformanceCycleResponse]: List of performance cycles
+        Response: JSON-encoded list of performance cycles
     """
     skip = (page - 1) * limit
-    cycle_service = PerformanceCycleService(db)
     cycles = cycle_service.get_all_cycles(skip=skip, limit=limit, status=status)
     
-    return cycles
+    return Response(content=PERFORMANCE_CYCLE_LIST_ADAPTER.dump_json(cycles), media_type="application/json")
 
 
 @router.post("/", response_model=PerformanceCycleResponse)
 def create_performance_cycle(
     cycle_create: PerformanceCycleCreate,
-    db: Session = Depends(get_db),
+    cycle_service: PerformanceCycleService = Depends(get_performance_cycle_service),
     current_user: User = Depends(get_current_admin)
 ) -> PerformanceCycleResponse:
     """
@@ -89,13 +110,12 @@ def create_performance_cycle(
     
     Args:
         cycle_create: Performance cycle creation data
-        db: Database session
+        cycle_service: Performance cycle service instance
         current_user: Current authenticated user
         
     Returns:
         PerformanceCycleResponse: Created performance cycle data
     """
-    cycle_service = PerformanceCycleService(db)
     cycle = cycle_service.create_cycle(cycle_create)
     
     logger.info("Performance cycle created", cycle_id=cycle.id, created_by=current_user.id)
@@ -106,7 +126,7 @@ def create_performance_cycle(
 @router.get("/{cycle_id}", response_model=PerformanceCycleResponse)
 def get_performance_cycle(
     cycle_id: int,
-    db: Session = Depends(get_db),
+    cycle_service: PerformanceCycleService = Depends(get_performance_cycle_service),
     current_user: User = Depends(get_current_admin)
 ) -> PerformanceCycleResponse:
     """
@@ -114,13 +134,12 @@ def get_performance_cycle(
     
     Args:
         cycle_id: Performance cycle ID
-        db: Database session
+        cycle_service: Performance cycle service instance
         current_user: Current authenticated user
         
     Returns:
         PerformanceCycleResponse: Performance cycle data
     """
-    cycle_service = PerformanceCycleService(db)
     cycle = cycle_service.get_cycle_by_id(cycle_id)
     
     return cycle
@@ -130,7 +149,7 @@ def get_performance_cycle(
 def update_performance_cycle(
     cycle_id: int,
     cycle_update: PerformanceCycleUpdate,
-    db: Session = Depends(get_db),
+    cycle_service: PerformanceCycleService = Depends(get_performance_cycle_service),
     current_user: User = Depends(get_current_admin)
 ) -> PerformanceCycleResponse:
     """
@@ -139,13 +158,12 @@ def update_performance_cycle(
     Args:
         cycle_id: Performance cycle ID
         cycle_update: Performance cycle update data
-        db: Database session
+        cycle_service: Performance cycle service instance
         current_user: Current authenticated user
         
     Returns:
         PerformanceCycleResponse: Updated performance cycle data
     """
-    cycle_service = PerformanceCycleService(db)
     cycle = cycle_service.update_cycle(cycle_id, cycle_update)
     
     logger.info("Performance cycle updated", cycle_id=cycle_id, updated_by=current_user.id)
@@ -156,7 +174,7 @@ def update_performance_cycle(
 @router.delete("/{cycle_id}")
 def delete_performance_cycle(
     cycle_id: int,
-    db: Session = Depends(get_db),
+    cycle_service: PerformanceCycleService = Depends(get_performance_cycle_service),
     current_user: User = Depends(get_current_admin)
 ):
     """
@@ -164,13 +182,12 @@ def delete_performance_cycle(
     
     Args:
         cycle_id: Performance cycle ID
-        db: Database session
+        cycle_service: Performance cycle service instance
         current_user: Current authenticated user
         
     Returns:
         dict: Success message
     """
-    cycle_service = PerformanceCycleService(db)
     success = cycle_service.delete_cycle(cycle_id)
     
     if not success:
@@ -4,10 +4,8 @@ Reviewer Selection API endpoints.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
 
-from app.core.database import get_db
-from app.services.reviewer_selection_service import ReviewerSelectionService
+from app.core.roles import EMPLOYEE, MENTOR
 from app.schemas.reviewer_selection import (
     ReviewerSelectionCreate,
     ReviewerSelectionUpdate,
@@ -15,7 +13,11 @@ from app.schemas.reviewer_selection import (
     MentorApprovalRequest,
     MentorSendBackRequest
 )
-from app.api.dependencies import get_current_user, get_current_admin
+from app.api.dependencies import (
+    ReviewerSelectionServiceScope,
+    RoleChecker,
+    get_reviewer_selection_service,
+)
 from app.models.user import User
 from app.core.logging import get_logger
 
@@ -27,29 +29,22 @@ router = APIRouter()
 @router.post("/", response_model=ReviewerSelectionResponse)
 def submit_reviewer_selection(
     selection_create: ReviewerSelectionCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    selection_service: ReviewerSelectionServiceScope = Depends(get_reviewer_selection_service),
+    current_user: User = Depends(RoleChecker({EMPLOYEE}, "Only employees can submit reviewer selections"))
 ) -> ReviewerSelectionResponse:
     """
     Submit reviewer selection (Employee only).
     
     Args:
         selection_create: Reviewer selection creation data
-        db: Database session
+        selection_service: Reviewer selection service scope
         current_user: Current authenticated user
         
     Returns:
         ReviewerSelectionResponse: Created reviewer selection data
     """
-    # Only employees can submit reviewer selections
-    if current_user.role != "Employee":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only employees can submit reviewer selections"
-        )
-    
-    selection_service = ReviewerSelectionService(db)
-    selection = selection_service.create_selection(selection_create, current_user.id)
+    with selection_service() as service:
+        selection = service.create_selection(selection_create, current_user.id)
     
     logger.info("Reviewer selection submitted", selection_id=selection.id, user_id=current_user.id)
     
@@ -58,14 +53,14 @@ def submit_reviewer_selection(
 
 @router.get("/my-selection", response_model=ReviewerSelectionResponse)
 def get_my_reviewer_selection(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    selection_service: ReviewerSelectionServiceScope = Depends(get_reviewer_selection_service),
+    current_user: User = Depends(RoleChecker({EMPLOYEE}, "Only employees can view their reviewer selections"))
 ) -> ReviewerSelectionResponse:
     """
     Get current user's reviewer selection (Employee only).
     
     Args:
-        db: Database session
+        selection_service: Reviewer selection service scope
         current_user: Current authenticated user
         
     Returns:
@@ -74,15 +69,8 @@ def get_my_reviewer_selection(
     Raises:
         HTTPException: If no selection found
     """
-    # Only employees can view their own selections
-    if current_user.role != "Employee":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only employees can view their reviewer selections"
-        )
-    
-    selection_service = ReviewerSelectionService(db)
-    selection = selection_service.get_my_selection(current_user.id)
+    with selection_service() as service:
+        selection = service.get_my_selection(current_user.id)
     
     if not selection:
         raise HTTPException(
@@ -97,8 +85,8 @@ def get_my_reviewer_selection(
 def update_reviewer_selection(
     selection_id: int,
     selection_update: ReviewerSelectionUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    selection_service: ReviewerSelectionServiceScope = Depends(get_reviewer_selection_service),
+    current_user: User = Depends(RoleChecker({EMPLOYEE}, "Only employees can update reviewer selections"))
 ) -> ReviewerSelectionResponse:
     """
     Update reviewer selection (Employee only).
@@ -106,21 +94,14 @@ def update_reviewer_selection(
     Args:
         selection_id: Reviewer selection ID
         selection_update: Reviewer selection update data
-        db: Database session
+        selection_service: Reviewer selection service scope
         current_user: Current authenticated user
         
     Returns:
         ReviewerSelectionResponse: Updated reviewer selection data
     """
-    # Only employees can update their own selections
-    if current_user.role != "Employee":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only employees can update reviewer selections"
-        )
-    
-    selection_service = ReviewerSelectionService(db)
-    selection = selection_service.update_selection(selection_id, selection_update, current_user.id)
+    with selection_service() as service:
+        selection = service.update_selection(selection_id, selection_update, current_user.id)
     
     logger.info("Reviewer selection updated", selection_id=selection_id, user_id=current_user.id)
     
@@ -130,29 +111,22 @@ def update_reviewer_selection(
 @router.delete("/{selection_id}")
 def delete_reviewer_selection(
     selection_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    selection_service: ReviewerSelectionServiceScope = Depends(get_reviewer_selection_service),
+    current_user: User = Depends(RoleChecker({EMPLOYEE}, "Only employees can delete reviewer selections"))
 ):
     """
     Delete reviewer selection (Employee only).
     
     Args:
         selection_id: Reviewer selection ID
-        db: Database session
+        selection_service: Reviewer selection service scope
         current_user: Current authenticated user
         
     Returns:
         dict: Success message
     """
-    # Only employees can delete their own selections
-    if current_user.role != "Employee":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only employees can delete reviewer selections"
-        )
-    
-    selection_service = ReviewerSelectionService(db)
-    success = selection_service.delete_selection(selection_id, current_user.id)
+    with selection_service() as service:
+        success = service.delete_selection(selection_id, current_user.id)
     
     if not success:
         raise HTTPException(
@@ -168,28 +142,21 @@ def delete_reviewer_selection(
 # Mentor endpoints
 @router.get("/mentor/approvals/pending")
 def get_pending_approvals(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    selection_service: ReviewerSelectionServiceScope = Depends(get_reviewer_selection_service),
+    current_user: User = Depends(RoleChecker({MENTOR}, "Only mentors can view pending approvals"))
 ):
     """
     Get pending approvals for mentor.
     
     Args:
-        db: Database session
+        selection_service: Reviewer selection service scope
         current_user: Current authenticated user
         
     Returns:
         List of pending approvals
     """
-    # Only mentors can view pending approvals
-    if current_user.role != "Mentor":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only mentors can view pending approvals"
-        )
-    
-    selection_service = ReviewerSelectionService(db)
-    approvals = selection_service.get_pending_approvals(current_user.id)
+    with selection_service() as service:
+        approvals = service.get_pending_approvals(current_user.id)
     
     return approvals
 
@@ -199,8 +166,8 @@ def get_all_approvals(
     status: Optional[str] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    selection_service: ReviewerSelectionServiceScope = Depends(get_reviewer_selection_service),
+    current_user: User = Depends(RoleChecker({MENTOR}, "Only mentors can view approvals"))
 ):
     """
     Get all approvals for mentor.
@@ -209,22 +176,15 @@ def get_all_approvals(
         status: Filter by status
         page: Page number
         limit: Items per page
-        db: Database session
+        selection_service: Reviewer selection service scope
         current_user: Current authenticated user
         
     Returns:
         List of approvals
     """
-    # Only mentors can view approvals
-    if current_user.role != "Mentor":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only mentors can view approvals"
-        )
-    
     # For now, return all pending approvals (can be enhanced with filtering)
-    selection_service = ReviewerSelectionService(db)
-    approvals = selection_service.get_pending_approvals(current_user.id)
+    with selection_service() as service:
+        approvals = service.get_pending_approvals(current_user.id)
     
     return approvals
 
@@ -233,8 +193,8 @@ def get_all_approvals(
 def approve_reviewer_selection(
     selection_id: int,
     approval_request: MentorApprovalRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    selection_service: ReviewerSelectionServiceScope = Depends(get_reviewer_selection_service),
+    current_user: User = Depends(RoleChecker({MENTOR}, "Only mentors can approve reviewer selections"))
 ) -> ReviewerSelectionResponse:
     """
     Approve reviewer selection (Mentor only).
@@ -242,21 +202,14 @@ def approve_reviewer_selection(
     Args:
         selection_id: Reviewer selection ID
         approval_request: Approval request data
-        db: Database session
+        selection_service: Reviewer selection service scope
         current_user: Current authenticated user
         
     Returns:
         ReviewerSelectionResponse: Updated reviewer selection data
     """
-    # Only mentors can approve selections
-    if current_user.role != "Mentor":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only mentors can approve reviewer selections"
-        )
-    
-    selection_service = ReviewerSelectionService(db)
-    selection = selection_service.approve_selection(selection_id, approval_request)
+    with selection_service() as service:
+        selection = service.approve_selection(selection_id, approval_request)
     
     logger.info("Reviewer selection approved", selection_id=selection_id, mentor_id=current_user.id)
     
@@ -267,8 +220,8 @@ def approve_reviewer_selection(
 def send_back_reviewer_selection(
     selection_id: int,
     send_back_request: MentorSendBackRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    selection_service: ReviewerSelectionServiceScope = Depends(get_reviewer_selection_service),
+    current_user: User = Depends(RoleChecker({MENTOR}, "Only mentors can send back reviewer selections"))
 ) -> ReviewerSelectionResponse:
     """
     Send back reviewer selection for revision (Mentor only).
@@ -276,21 +229,14 @@ def send_back_reviewer_selection(
     Args:
         selection_id: Reviewer selection ID
         send_back_request: Send back request data
-        db: Database session
+        selection_service: Reviewer selection service scope
         current_user: Current authenticated user
         
     Returns:
         ReviewerSelectionResponse: Updated reviewer selection data
     """
-    # Only mentors can send back selections
-    if current_user.role != "Mentor":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only mentors can send back reviewer selections"
-        )
-    
-    selection_service = ReviewerSelectionService(db)
-    selection = selection_service.send_back_selection(selection_id, send_back_request)
+    with selection_service() as service:
+        selection = service.send_back_selection(selection_id, send_back_request)
     
     logger.info("Reviewer selection sent back", selection_id=selection_id, mentor_id=current_user.id)
     
@@ -300,36 +246,27 @@ def send_back_reviewer_selection(
 @router.get("/mentor/approvals/{selection_id}")
 def get_approval_details(
     selection_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    selection_service: ReviewerSelectionServiceScope = Depends(get_reviewer_selection_service),
+    current_user: User = Depends(RoleChecker({MENTOR}, "Only mentors can view approval details"))
 ):
     """
     Get approval details (Mentor only).
     
     Args:
         selection_id: Reviewer selection ID
-        db: Database session
+        selection_service: Reviewer selection service scope
         current_user: Current authenticated user
         
     Returns:
         Approval details
     """
-    # Only mentors can view approval details
-    if current_user.role != "Mentor":
+    with selection_service() as service:
+        approval = service.get_approval_by_id(selection_id, current_user.id)
+    
+    if not approval:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only mentors can view approval details"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Approval not found"
         )
     
-    selection_service = ReviewerSelectionService(db)
-    approvals = selection_service.get_pending_approvals(current_user.id)
-    
-    # Find the specific approval
-    for approval in approvals:
-        if approval["id"] == selection_id:
-            return approval
-    
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail="Approval not found"
-    )
+    return approval
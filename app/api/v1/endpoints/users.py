@@ -3,35 +3,56 @@ User management endpoints.
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.services.user_service import UserService
-from app.schemas.user import UserCreate, UserUpdate, UserResponse
-from app.api.dependencies import get_current_active_user, get_current_user, get_user_service
+from app.schemas.user import UserCreate, UserUpdate, UserResponse, USER_LIST_ADAPTER
+from app.api.dependencies import (
+    RoleChecker,
+    get_current_active_user,
+    get_current_user,
+    get_user_service,
+    invalidate_cached_user,
+)
 from app.models.user import User
 from app.core.logging import get_logger
+from app.core.roles import ADMIN_ROLES, MENTOR, SYSTEM_ADMINISTRATOR
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# invalidate_cached_user only clears this worker's authentication cache. Other
+# workers keep serving a changed or deleted user for up to
+# AUTH_CACHE_TTL_SECONDS, which is accepted (see app.api.dependencies).
+
+# Roles allowed to look up reviewers in addition to the admin roles
+_ADMIN_OR_MENTOR_ROLES = ADMIN_ROLES | {MENTOR}
+
+_require_admin_hr = RoleChecker(ADMIN_ROLES)
+_require_admin_hr_mentor = RoleChecker(_ADMIN_OR_MENTOR_ROLES)
+_require_admin = RoleChecker({SYSTEM_ADMINISTRATOR})
+
 
 @router.get("/me", response_model=UserResponse)
-def read_users_me(
+async def read_users_me(
     current_user: User = Depends(get_current_active_user)
-) -> UserResponse:
+) -> Response:
     """
     Get current user information.
     
+    The authenticated user already comes from the auth caches as a
+    UserResponse, so it is dumped to JSON as-is without rebuilding it.
+    
     Args:
         current_user: Current authenticated user
         
     Returns:
-        UserResponse: Current user information
+        Response: JSON-encoded current user information
     """
-    return UserResponse.from_orm(current_user)
+    return Response(content=current_user.model_dump_json(), media_type="application/json")
 
 
 @router.put("/me", response_model=UserResponse)
@@ -61,6 +82,7 @@ def update_users_me(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
+        invalidate_cached_user(current_user.id)
         return updated_user
     except ValueError as e:
         raise HTTPException(
@@ -75,9 +97,9 @@ def read_users(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     role: Optional[str] = Query(None, description="Filter by user role"),
     department: Optional[str] = Query(None, description="Filter by department"),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_require_admin_hr),
     user_service: UserService = Depends(get_user_service)
-) -> List[UserResponse]:
+) -> Response:
     """
     Get all users with optional filtering.
     
@@ -90,23 +112,16 @@ def read_users(
         user_service: User service instance
         
     Returns:
-        List[UserResponse]: List of users
+        Response: JSON-encoded list of users
     """
-    # Only Admin and HR can access this endpoint
-    if current_user.role not in ["Admin", "HR"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions"
-        )
-    
     users = user_service.get_users(skip=skip, limit=limit, role=role, department=department)
-    return users
+    return Response(content=USER_LIST_ADAPTER.dump_json(users), media_type="application/json")
 
 
 @router.post("/", response_model=UserResponse)
 def create_user(
     user_create: UserCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_require_admin_hr),
     user_service: UserService = Depends(get_user_service)
 ) -> UserResponse:
     """
@@ -123,13 +138,6 @@ def create_user(
     Raises:
         HTTPException: If user creation fails
     """
-    # Only Admin and HR can create users
-    if current_user.role not in ["Admin", "HR"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions"
-        )
-    
     try:
         user = user_service.create_user(user_create)
         return user
@@ -161,7 +169,7 @@ def read_user(
         HTTPException: If user not found or insufficient permissions
     """
     # Users can only view their own profile unless they are Admin/HR
-    if current_user.id != user_id and current_user.role not in ["Admin", "HR"]:
+    if current_user.id != user_id and current_user.role not in ADMIN_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions"
@@ -199,7 +207,7 @@ def update_user(
         HTTPException: If update fails or insufficient permissions
     """
     # Users can only update their own profile unless they are Admin/HR
-    if current_user.id != user_id and current_user.role not in ["Admin", "HR"]:
+    if current_user.id != user_id and current_user.role not in ADMIN_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions"
@@ -212,6 +220,7 @@ def update_user(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
+        invalidate_cached_user(user_id)
         return updated_user
     except ValueError as e:
         raise HTTPException(
@@ -223,7 +232,7 @@ def update_user(
 @router.delete("/{user_id}")
 def delete_user(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_require_admin),
     user_service: UserService = Depends(get_user_service)
 ) -> dict:
     """
@@ -240,13 +249,6 @@ def delete_user(
     Raises:
         HTTPException: If user not found or insufficient permissions
     """
-    # Only Admin can delete users
-    if current_user.role != "Admin":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions"
-        )
-    
     # Prevent self-deletion
     if current_user.id == user_id:
         raise HTTPException(
@@ -260,15 +262,16 @@ def delete_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
+    invalidate_cached_user(user_id)
     
     return {"message": "User deleted successfully"}
 
 
 @router.get("/available-reviewers", response_model=List[UserResponse])
 def get_available_reviewers(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(_require_admin_hr_mentor),
     user_service: UserService = Depends(get_user_service)
-) -> List[UserResponse]:
+) -> Response:
     """
     Get list of available reviewers (Admin/HR/Mentor only).
     
@@ -277,14 +280,7 @@ def get_available_reviewers(
         user_service: User service instance
         
     Returns:
-        List[UserResponse]: List of available reviewers
+        Response: JSON-encoded list of available reviewers
     """
-    # Only Admin, HR, and Mentor can access this endpoint
-    if current_user.role not in ["Admin", "HR", "Mentor"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Insufficient permissions"
-        )
-    
     reviewers = user_service.get_available_reviewers()
-    return reviewers
+    return Response(content=USER_LIST_ADAPTER.dump_json(reviewers), media_type="application/json")
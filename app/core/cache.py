@@ -0,0 +1,92 @@
+"""
+Redis cache helpers shared across worker processes.
+
+Caching is best-effort: when it is disabled or Redis is unreachable, reads
+behave as misses and writes are skipped, so callers always fall back to the
+database.
+"""
+
+from typing import Optional, Union
+
+import redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """
+    Get the shared Redis client.
+    
+    Returns:
+        Optional[redis.Redis]: Redis client, or None if caching is disabled
+    """
+    global _client
+    if not settings.CACHE_ENABLED:
+        return None
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return _client
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    """
+    Read a cached value.
+    
+    Args:
+        key: Cache key
+    
+    Returns:
+        Optional[bytes]: Cached value, or None on a miss or Redis error
+    """
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return client.get(key)
+    except RedisError as e:
+        logger.warning("Cache read failed", key=key, error=str(e))
+        return None
+
+
+def cache_set(key: str, value: Union[str, bytes], ttl: int) -> None:
+    """
+    Store a value with an expiry.
+    
+    Args:
+        key: Cache key
+        value: Serialized value
+        ttl: Time to live in seconds
+    """
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, value)
+    except RedisError as e:
+        logger.warning("Cache write failed", key=key, error=str(e))
+
+
+def cache_delete(*keys: str) -> None:
+    """
+    Remove cached values.
+    
+    Args:
+        keys: Cache keys to delete
+    """
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except RedisError as e:
+        logger.warning("Cache delete failed", keys=list(keys), error=str(e))
@@ -28,6 +28,8 @@ class Settings(BaseSettings):
     ALGORITHM: str = Field(default="HS256", env="ALGORITHM")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, env="REFRESH_TOKEN_EXPIRE_DAYS")
+    AUTH_CACHE_TTL_SECONDS: int = Field(default=30, env="AUTH_CACHE_TTL_SECONDS")
+    AUTH_CACHE_MAXSIZE: int = Field(default=10000, env="AUTH_CACHE_MAXSIZE")
     
     # Database
     DATABASE_URL: str = Field(
@@ -35,9 +37,28 @@ class Settings(BaseSettings):
         env="DATABASE_URL"
     )
     DATABASE_ECHO: bool = Field(default=False, env="DATABASE_ECHO")
+    DATABASE_POOL_SIZE: int = Field(default=20, env="DATABASE_POOL_SIZE")
+    DATABASE_MAX_OVERFLOW: int = Field(default=20, env="DATABASE_MAX_OVERFLOW")
+    DATABASE_POOL_RECYCLE: int = Field(default=1800, env="DATABASE_POOL_RECYCLE")
+    DATABASE_POOL_TIMEOUT: int = Field(default=10, env="DATABASE_POOL_TIMEOUT")
+    DATABASE_POOL_USE_LIFO: bool = Field(default=True, env="DATABASE_POOL_USE_LIFO")
+    DATABASE_QUERY_CACHE_SIZE: int = Field(default=1200, env="DATABASE_QUERY_CACHE_SIZE")
+    
+    # Worker threads for sync endpoints and dependencies
+    THREADPOOL_SIZE: int = Field(default=40, env="THREADPOOL_SIZE")
     
     # Redis
     REDIS_URL: str = Field(default="redis://localhost:6379", env="REDIS_URL")
+    REDIS_SOCKET_TIMEOUT: float = Field(default=0.5, env="REDIS_SOCKET_TIMEOUT")
+    CACHE_ENABLED: bool = Field(default=False, env="CACHE_ENABLED")
+    
+    # Caching
+    ACTIVE_CYCLE_CACHE_TTL_SECONDS: int = Field(default=60, env="ACTIVE_CYCLE_CACHE_TTL_SECONDS")
+    ACTIVE_CYCLE_REDIS_TTL_SECONDS: int = Field(default=300, env="ACTIVE_CYCLE_REDIS_TTL_SECONDS")
+    USER_CACHE_TTL_SECONDS: int = Field(default=300, env="USER_CACHE_TTL_SECONDS")
+    REVIEWER_POOL_CACHE_TTL_SECONDS: int = Field(default=60, env="REVIEWER_POOL_CACHE_TTL_SECONDS")
+    UNREAD_COUNT_CACHE_TTL_SECONDS: int = Field(default=30, env="UNREAD_COUNT_CACHE_TTL_SECONDS")
+    CYCLE_CACHE_TTL_SECONDS: int = Field(default=300, env="CYCLE_CACHE_TTL_SECONDS")
     
     # CORS
     ALLOWED_HOSTS: List[str] = Field(default=["*"], env="ALLOWED_HOSTS")
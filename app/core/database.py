@@ -3,7 +3,7 @@ Database configuration and session management.
 """
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import raiseload, sessionmaker, Session
 
 from app.core.config import settings
 from app.models import Base
@@ -12,6 +12,22 @@ from app.models import Base
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
+    # Validate pooled connections on checkout so stale ones are replaced
+    pool_pre_ping=True,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    # Replace connections before SQL Server or a firewall drops them as idle
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    # Fail fast instead of queueing requests when the pool is exhausted
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    # Reuse the most recently returned connection; the rest of the pool can
+    # then idle out and be recycled instead of all staying lukewarm
+    pool_use_lifo=settings.DATABASE_POOL_USE_LIFO,
+    # Compiled SQL is cached per statement shape; size the LRU so the optional
+    # filter, cursor and loader-option variants of the queries are not evicted
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    # Send executemany() parameter batches in one round trip (pyodbc)
+    fast_executemany=True,
     # Additional connection parameters for SQL Server
     connect_args={
         "TrustServerCertificate": "yes",
@@ -37,6 +53,34 @@ def get_db() -> Session:
         db.close()
 
 
+def get_session_factory() -> sessionmaker:
+    """
+    Dependency to get the session factory.
+    
+    Endpoints open a session in a narrow ``with`` block so the pooled
+    connection is returned before the response is serialized and sent.
+    
+    Returns:
+        sessionmaker: Session factory
+    """
+    return SessionLocal
+
+
+def strict_loading_options() -> tuple:
+    """
+    Loader options that forbid lazy loads in development and testing.
+    
+    Appended after a query's eager-loading options so that any relationship
+    the caller forgot to load raises instead of silently issuing N+1 queries.
+    
+    Returns:
+        tuple: ``raiseload("*")`` outside production-like environments, else empty
+    """
+    if settings.ENVIRONMENT in ("development", "testing"):
+        return (raiseload("*"),)
+    return ()
+
+
 def init_db() -> None:
     """
     Initialize database tables.
@@ -2,21 +2,38 @@
 Structured logging configuration using structlog.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
+import orjson
 import structlog
 from structlog.stdlib import LoggerFactory
 
 from app.core.config import settings
 
+# Records are handed to a background listener thread, so request handlers
+# never block on writing to stdout.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener: Optional[QueueListener] = None
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson."""
+    return orjson.dumps(obj, default=str).decode()
+
 
 def setup_logging() -> None:
     """
     Setup structured logging configuration.
     """
-    # Configure structlog
+    global _log_listener
+    
+    # Configure structlog; filter_by_level comes first so calls below the
+    # configured level are dropped before any processing
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
@@ -27,7 +44,7 @@ def setup_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps)
         ],
         context_class=dict,
         logger_factory=LoggerFactory(),
@@ -36,11 +53,18 @@ def setup_logging() -> None:
     )
 
     # Configure standard library logging
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
+        handlers=[QueueHandler(_log_queue)],
         level=getattr(logging, settings.LOG_LEVEL.upper()),
     )
+    
+    if _log_listener is None:
+        _log_listener = QueueListener(_log_queue, stream_handler)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
 
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
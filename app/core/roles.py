@@ -0,0 +1,18 @@
+"""
+User role names and the role groups used for authorization.
+"""
+
+EMPLOYEE = "Employee"
+MENTOR = "Mentor"
+HR_LEAD = "HR Lead"
+SYSTEM_ADMINISTRATOR = "System Administrator"
+PEOPLE_COMMITTEE = "People Committee"
+
+# All roles a user can be assigned
+ALL_ROLES = frozenset({EMPLOYEE, MENTOR, HR_LEAD, SYSTEM_ADMINISTRATOR, PEOPLE_COMMITTEE})
+
+# Roles allowed to review employees and write feedback
+REVIEWER_ROLES = frozenset({MENTOR, PEOPLE_COMMITTEE})
+
+# Roles with administrative access
+ADMIN_ROLES = frozenset({SYSTEM_ADMINISTRATOR, HR_LEAD})
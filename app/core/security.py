@@ -3,16 +3,30 @@ Security utilities for authentication and authorization.
 """
 
 import hashlib
-from datetime import datetime, timedelta
+import hmac
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional, Union, Any
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
 
 from app.core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context. New hashes use argon2; bcrypt hashes are still
+# verified and flagged for upgrade.
+pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
+
+# Dedicated pool for password verification so a burst of logins (password
+# hashing is deliberately slow) cannot exhaust the shared request threadpool.
+password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-verify"
+)
+
+# Signing key, encoded once instead of on every encode/decode
+_jwt_key = settings.SECRET_KEY.encode()
 
 
 def create_access_token(
@@ -29,38 +43,33 @@ def create_access_token(
         str: JWT token
     """
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        lifetime = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
-    to_encode = {"exp": expire, "sub": str(subject)}
+    # exp is a plain epoch timestamp, so no datetime objects are needed
+    to_encode = {"exp": int(time.time()) + lifetime, "sub": str(subject)}
     encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        to_encode, _jwt_key, algorithm=settings.ALGORITHM
     )
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[str]:
+def decode_access_token(token: str) -> Optional[dict]:
     """
-    Verify JWT token and return subject.
+    Verify JWT token and return its payload.
     
     Args:
         token: JWT token to verify
         
     Returns:
-        Optional[str]: Token subject if valid, None otherwise
+        Optional[dict]: Token payload if valid, None otherwise
     """
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        return jwt.decode(
+            token, _jwt_key, algorithms=[settings.ALGORITHM]
         )
-        subject: str = payload.get("sub")
-        if subject is None:
-            return None
-        return subject
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
@@ -75,18 +84,36 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches, False otherwise
     """
-    # Try bcrypt first, then fallback to simple SHA-256
-    try:
-        return pwd_context.verify(plain_password, hashed_password)
-    except Exception:
-        # Fallback to simple SHA-256 for compatibility
-        simple_hash = hashlib.sha256(plain_password.encode()).hexdigest()
-        return simple_hash == hashed_password
+    if pwd_context.identify(hashed_password) is not None:
+        try:
+            return pwd_context.verify(plain_password, hashed_password)
+        except ValueError:
+            # A recognized scheme prefix on a corrupt hash must not fail the login with 500
+            return False
+    
+    # Fallback to simple SHA-256 for users seeded by scripts/create_simple_users.py
+    simple_hash = hashlib.sha256(plain_password.encode()).hexdigest()
+    return hmac.compare_digest(simple_hash, hashed_password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced with an argon2 hash.
+    
+    Args:
+        hashed_password: Hashed password
+        
+    Returns:
+        bool: True if the hash uses a deprecated or unknown scheme
+    """
+    if pwd_context.identify(hashed_password) is None:
+        return True
+    return pwd_context.needs_update(hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hash password using bcrypt.
+    Hash password using argon2.
     
     Args:
         password: Plain text password
@@ -95,6 +122,3 @@ def get_password_hash(password: str) -> str:
         str: Hashed password
     """
     return pwd_context.hash(password)
-
-
-
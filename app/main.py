@@ -5,13 +5,17 @@ Main FastAPI application entry point.
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import time
 
+import anyio
+
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.api.v1.api import api_router
 from app.core.database import init_db
+from app.core.security import password_executor
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 # Setup logging
 logger = get_logger(__name__)
@@ -23,6 +27,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -32,12 +37,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let cross-origin clients read the keyset pagination cursor
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Add trusted host middleware
 app.add_middleware(
     TrustedHostMiddleware,
-    allowed_hosts=["*"]  # Configure appropriately for production
+    allowed_hosts=settings.ALLOWED_HOSTS
 )
 
 
@@ -90,7 +97,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         exc_info=True,
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"},
     )
@@ -101,6 +108,9 @@ async def startup_event():
     """Application startup event."""
     logger.info("Application starting up")
     
+    # Size the threadpool that runs sync endpoints and DB-bound dependencies
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    
     # Initialize database tables
     try:
         init_db()
@@ -114,6 +124,7 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event."""
     logger.info("Application shutting down")
+    password_executor.shutdown(wait=False)
 
 
 @app.get("/")
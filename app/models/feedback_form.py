@@ -3,33 +3,47 @@ Feedback Form database model.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Unicode, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 
 from . import Base
+from .functions import utcnow
 
 
 class FeedbackForm(Base):
     """Feedback Form model for database representation."""
     
     __tablename__ = "feedback_forms"
+    __table_args__ = (
+        # The only index leading with reviewer_id: serves the reviewer list
+        # (optionally by employee, status filtered from the included column)
+        # and the one-form-per-reviewer/employee/cycle existence check
+        Index(
+            "IX_feedback_forms_reviewer_employee_cycle",
+            "reviewer_id", "employee_id", "performance_cycle_id",
+            mssql_include=["status"],
+        ),
+        Index("IX_feedback_forms_created_at_id", "created_at", "id"),
+        Index("IX_feedback_forms_employee_cycle", "employee_id", "performance_cycle_id"),
+        Index("IX_feedback_forms_status", "status"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     employee_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     reviewer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     performance_cycle_id = Column(Integer, ForeignKey("performance_cycles.id"), nullable=False)
-    strengths = Column(Text, nullable=False)
-    improvements = Column(Text, nullable=False)
+    # Bounded so SQL Server keeps the text in-row instead of in LOB pages
+    strengths = Column(Unicode(4000), nullable=False)
+    improvements = Column(Unicode(4000), nullable=False)
     overall_rating = Column(String(50), nullable=False)  # tracking_below, tracking_expected, tracking_above
     status = Column(String(50), nullable=False)  # draft, submitted
-    created_at = Column(DateTime(timezone=True), server_default=func.getutcdate())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.getutcdate())
+    created_at = Column(DateTime(timezone=True), server_default=utcnow())
+    updated_at = Column(DateTime(timezone=True), onupdate=datetime.utcnow)
     
     # Relationships
-    employee = relationship("User", foreign_keys=[employee_id], back_populates="received_feedback")
-    reviewer = relationship("User", foreign_keys=[reviewer_id], back_populates="given_feedback")
-    performance_cycle = relationship("PerformanceCycle", back_populates="feedback_forms")
+    employee = relationship("User", foreign_keys=[employee_id], back_populates="received_feedback", lazy="raise_on_sql")
+    reviewer = relationship("User", foreign_keys=[reviewer_id], back_populates="given_feedback", lazy="raise_on_sql")
+    performance_cycle = relationship("PerformanceCycle", back_populates="feedback_forms", lazy="raise_on_sql")
     
     def __repr__(self) -> str:
         return f"<FeedbackForm(id={self.id}, employee_id={self.employee_id}, reviewer_id={self.reviewer_id}, status='{self.status}')>"
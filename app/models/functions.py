@@ -0,0 +1,29 @@
+"""
+Portable SQL functions used by the database models.
+"""
+
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """Current UTC timestamp, rendered for the dialect in use."""
+    
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "mssql")
+def _mssql_utcnow(element, compiler, **kw) -> str:
+    return "SYSUTCDATETIME()"
+
+
+@compiles(utcnow, "postgresql")
+def _postgresql_utcnow(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
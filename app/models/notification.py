@@ -3,17 +3,22 @@ Notification database model.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 
 from . import Base
+from .functions import utcnow
 
 
 class Notification(Base):
     """Notification model for database representation."""
     
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("IX_notifications_created_at_id", "created_at", "id"),
+        Index("IX_notifications_user_id_is_read_created_at", "user_id", "is_read", "created_at", "id"),
+        Index("IX_notifications_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -21,10 +26,10 @@ class Notification(Base):
     message = Column(Text, nullable=False)
     type = Column(String(50), nullable=False)
     is_read = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.getutcdate())
+    created_at = Column(DateTime(timezone=True), server_default=utcnow())
     
     # Relationships
-    user = relationship("User", back_populates="notifications")
+    user = relationship("User", back_populates="notifications", lazy="raise_on_sql")
     
     def __repr__(self) -> str:
         return f"<Notification(id={self.id}, user_id={self.user_id}, type='{self.type}', is_read={self.is_read})>"
@@ -3,17 +3,21 @@ Performance Cycle database model.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index, text
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 
 from . import Base
+from .functions import utcnow
 
 
 class PerformanceCycle(Base):
     """Performance Cycle model for database representation."""
     
     __tablename__ = "performance_cycles"
+    __table_args__ = (
+        # Filtered index: only the (few) active cycles are indexed
+        Index("IX_performance_cycles_active", "status", mssql_where=text("status = 'active'")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -21,12 +25,16 @@ class PerformanceCycle(Base):
     end_date = Column(DateTime, nullable=False)
     status = Column(String(50), nullable=False)  # active, inactive, completed
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.getutcdate())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.getutcdate())
+    created_at = Column(DateTime(timezone=True), server_default=utcnow())
+    updated_at = Column(DateTime(timezone=True), onupdate=datetime.utcnow)
     
     # Relationships
-    reviewer_selections = relationship("ReviewerSelection", back_populates="performance_cycle")
-    feedback_forms = relationship("FeedbackForm", back_populates="performance_cycle")
+    reviewer_selections = relationship(
+        "ReviewerSelection", back_populates="performance_cycle", lazy="raise_on_sql", passive_deletes=True
+    )
+    feedback_forms = relationship(
+        "FeedbackForm", back_populates="performance_cycle", lazy="raise_on_sql", passive_deletes=True
+    )
     
     def __repr__(self) -> str:
         return f"<PerformanceCycle(id={self.id}, name='{self.name}', status='{self.status}')>"
@@ -3,17 +3,21 @@ Reviewer Selection database models.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
 
 from . import Base
+from .functions import utcnow
 
 
 class ReviewerSelection(Base):
     """Reviewer Selection model for database representation."""
     
     __tablename__ = "reviewer_selections"
+    __table_args__ = (
+        # One selection per mentee and cycle
+        Index("IX_reviewer_selections_mentee_cycle", "mentee_id", "performance_cycle_id", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     performance_cycle_id = Column(Integer, ForeignKey("performance_cycles.id"), nullable=False)
@@ -21,13 +25,18 @@ class ReviewerSelection(Base):
     status = Column(String(50), nullable=False)  # pending, approved, sent_back
     submitted_at = Column(DateTime, nullable=True)
     mentor_feedback = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.getutcdate())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.getutcdate())
+    created_at = Column(DateTime(timezone=True), server_default=utcnow())
+    updated_at = Column(DateTime(timezone=True), onupdate=datetime.utcnow)
     
     # Relationships
-    performance_cycle = relationship("PerformanceCycle", back_populates="reviewer_selections")
-    mentee = relationship("User", foreign_keys=[mentee_id], back_populates="reviewer_selections")
-    reviewer_details = relationship("ReviewerSelectionDetail", back_populates="selection", cascade="all, delete-orphan")
+    performance_cycle = relationship("PerformanceCycle", back_populates="reviewer_selections", lazy="raise_on_sql")
+    mentee = relationship("User", foreign_keys=[mentee_id], back_populates="reviewer_selections", lazy="raise_on_sql")
+    # Details are removed by the FK's ON DELETE CASCADE instead of being loaded and deleted one by one
+    reviewer_details = relationship(
+        "ReviewerSelectionDetail", back_populates="selection", cascade="all, delete-orphan", passive_deletes=True,
+        lazy="raise_on_sql"
+    )
+    selected_reviewers = relationship("User", secondary="reviewer_selection_details", viewonly=True, lazy="raise_on_sql")
     
     def __repr__(self) -> str:
         return f"<ReviewerSelection(id={self.id}, mentee_id={self.mentee_id}, status='{self.status}')>"
@@ -39,13 +48,13 @@ class ReviewerSelectionDetail(Base):
     __tablename__ = "reviewer_selection_details"
     
     id = Column(Integer, primary_key=True, index=True)
-    selection_id = Column(Integer, ForeignKey("reviewer_selections.id"), nullable=False)
+    selection_id = Column(Integer, ForeignKey("reviewer_selections.id", ondelete="CASCADE"), nullable=False, index=True)
     reviewer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.getutcdate())
+    created_at = Column(DateTime(timezone=True), server_default=utcnow())
     
     # Relationships
-    selection = relationship("ReviewerSelection", back_populates="reviewer_details")
-    reviewer = relationship("User", foreign_keys=[reviewer_id])
+    selection = relationship("ReviewerSelection", back_populates="reviewer_details", lazy="raise_on_sql")
+    reviewer = relationship("User", foreign_keys=[reviewer_id], lazy="raise_on_sql")
     
     def __repr__(self) -> str:
         return f"<ReviewerSelectionDetail(id={self.id}, selection_id={self.selection_id}, reviewer_id={self.reviewer_id})>"
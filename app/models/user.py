@@ -3,17 +3,23 @@ User database model.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Index
+from sqlalchemy.orm import deferred, relationship
 
 from . import Base
+from .functions import utcnow
 
 
 class User(Base):
     """User model for database representation."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        # User listing filters on role and department
+        Index("IX_users_role_department", "role", "department"),
+        # Reviewer pool: active users of the reviewer roles, optionally by department
+        Index("IX_users_active_role_department", "is_active", "role", "department"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -21,16 +27,28 @@ class User(Base):
     role = Column(String(50), nullable=False)  # Employee, Mentor, HR Lead, System Administrator, People Committee
     department = Column(String(100), nullable=True)
     position = Column(String(100), nullable=True)
-    password_hash = Column(String(255), nullable=False)
+    # Only login needs the hash; every other load of a user leaves it behind
+    password_hash = deferred(Column(String(255), nullable=False))
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.getutcdate())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.getutcdate())
+    created_at = Column(DateTime(timezone=True), server_default=utcnow())
+    updated_at = Column(DateTime(timezone=True), onupdate=datetime.utcnow)
     
     # Relationships
-    reviewer_selections = relationship("ReviewerSelection", back_populates="mentee")
-    received_feedback = relationship("FeedbackForm", foreign_keys="FeedbackForm.employee_id", back_populates="employee")
-    given_feedback = relationship("FeedbackForm", foreign_keys="FeedbackForm.reviewer_id", back_populates="reviewer")
-    notifications = relationship("Notification", back_populates="user")
+    # Collections must be loaded explicitly; an implicit lazy load raises instead
+    # of issuing a query. passive_deletes leaves referencing rows to the FKs, so
+    # deleting a user never loads its collections.
+    reviewer_selections = relationship(
+        "ReviewerSelection", back_populates="mentee", lazy="raise_on_sql", passive_deletes=True
+    )
+    received_feedback = relationship(
+        "FeedbackForm", foreign_keys="FeedbackForm.employee_id", back_populates="employee",
+        lazy="raise_on_sql", passive_deletes=True
+    )
+    given_feedback = relationship(
+        "FeedbackForm", foreign_keys="FeedbackForm.reviewer_id", back_populates="reviewer",
+        lazy="raise_on_sql", passive_deletes=True
+    )
+    notifications = relationship("Notification", back_populates="user", lazy="raise_on_sql", passive_deletes=True)
     
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email='{self.email}', name='{self.name}', role='{self.role}')>"
@@ -2,12 +2,14 @@
 Feedback Form repository for database operations.
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from typing import Iterator, List, Optional
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, exists, insert, select, update
+from sqlalchemy.engine import Row
 
 from app.models.feedback_form import FeedbackForm
 from app.schemas.feedback_form import FeedbackFormCreate, FeedbackFormUpdate
+from app.utils.pagination import paginate_keyset
 
 
 class FeedbackFormRepository:
@@ -26,62 +28,108 @@ class FeedbackFormRepository:
         Returns:
             Optional[FeedbackForm]: Feedback form object if found, None otherwise
         """
-        return self.db.query(FeedbackForm).filter(FeedbackForm.id == form_id).first()
+        return self.db.get(FeedbackForm, form_id)
     
-    def get_by_reviewer_id(self, reviewer_id: int, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[FeedbackForm]:
+    def get_by_reviewer_id(self, reviewer_id: int, skip: int = 0, limit: int = 100, status: Optional[str] = None, employee_id: Optional[int] = None, cursor: Optional[str] = None) -> List[FeedbackForm]:
         """
-        Get feedback forms by reviewer ID.
+        Get feedback forms by reviewer ID, newest first.
         
         Args:
             reviewer_id: Reviewer user ID
             skip: Number of records to skip
             limit: Maximum number of records to return
             status: Filter by status
+            employee_id: Filter by employee ID
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
             List[FeedbackForm]: List of feedback forms
         """
         query = self.db.query(FeedbackForm).filter(FeedbackForm.reviewer_id == reviewer_id)
+        if employee_id:
+            query = query.filter(FeedbackForm.employee_id == employee_id)
         if status:
             query = query.filter(FeedbackForm.status == status)
-        return query.offset(skip).limit(limit).all()
+        query = paginate_keyset(query, FeedbackForm.created_at, FeedbackForm.id, cursor, skip, limit)
+        return query.all()
     
-    def get_by_employee_id(self, employee_id: int, skip: int = 0, limit: int = 100) -> List[FeedbackForm]:
+    def get_by_employee_id(self, employee_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[FeedbackForm]:
         """
-        Get feedback forms by employee ID.
+        Get feedback forms by employee ID, newest first.
         
         Args:
             employee_id: Employee user ID
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
             List[FeedbackForm]: List of feedback forms
         """
-        return self.db.query(FeedbackForm).filter(FeedbackForm.employee_id == employee_id).offset(skip).limit(limit).all()
+        query = self.db.query(FeedbackForm).filter(FeedbackForm.employee_id == employee_id)
+        query = paginate_keyset(query, FeedbackForm.created_at, FeedbackForm.id, cursor, skip, limit)
+        return query.all()
     
-    def get_assigned_employees(self, reviewer_id: int) -> List[dict]:
+    def exists_for_employee_cycle(self, reviewer_id: int, employee_id: int, performance_cycle_id: int) -> bool:
         """
-        Get assigned employees for a reviewer.
+        Check whether a reviewer already has a feedback form for an employee in a cycle.
         
         Args:
             reviewer_id: Reviewer user ID
+            employee_id: Employee user ID
+            performance_cycle_id: Performance cycle ID
+            
+        Returns:
+            bool: True if such a feedback form exists
+        """
+        return self.db.scalar(
+            select(
+                exists().where(
+                    FeedbackForm.reviewer_id == reviewer_id,
+                    FeedbackForm.employee_id == employee_id,
+                    FeedbackForm.performance_cycle_id == performance_cycle_id
+                )
+            )
+        )
+    
+    def get_assigned_employees(self, reviewer_id: int, batch_size: int = 500) -> Iterator[FeedbackForm]:
+        """
+        Stream the feedback forms assigned to a reviewer.
+        
+        Rows are fetched ``batch_size`` at a time, so a reviewer with many
+        assignments does not materialize them all at once.
+        
+        Args:
+            reviewer_id: Reviewer user ID
+            batch_size: Number of rows buffered per fetch
             
         Returns:
-            List[dict]: List of assigned employees with assignment details
+            Iterator[FeedbackForm]: Feedback forms with employee and cycle loaded
         """
         # This would need to be customized based on the reviewer assignment logic
-        # For now, returning employees who have feedback forms from this reviewer
-        return self.db.query(FeedbackForm).filter(FeedbackForm.reviewer_id == reviewer_id).all()
+        # For now, returning employees who have feedback forms from this reviewer.
+        # Employee and cycle are many-to-one, so they are joined into the same
+        # SELECT; that keeps a single round trip and still works with yield_per.
+        stmt = (
+            select(FeedbackForm)
+            .options(
+                joinedload(FeedbackForm.employee),
+                joinedload(FeedbackForm.performance_cycle),
+            )
+            .where(FeedbackForm.reviewer_id == reviewer_id)
+            .order_by(FeedbackForm.id)
+        )
+        return self.db.execute(stmt.execution_options(yield_per=batch_size)).scalars()
     
-    def get_all(self, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[FeedbackForm]:
+    def get_all(self, skip: int = 0, limit: int = 100, status: Optional[str] = None, cursor: Optional[str] = None) -> List[FeedbackForm]:
         """
-        Get all feedback forms with optional filtering.
+        Get all feedback forms with optional filtering, newest first.
         
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
             status: Filter by status
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
             List[FeedbackForm]: List of feedback forms
@@ -89,9 +137,29 @@ class FeedbackFormRepository:
         query = self.db.query(FeedbackForm)
         if status:
             query = query.filter(FeedbackForm.status == status)
-        return query.offset(skip).limit(limit).all()
+        query = paginate_keyset(query, FeedbackForm.created_at, FeedbackForm.id, cursor, skip, limit)
+        return query.all()
     
-    def create(self, form_create: FeedbackFormCreate, reviewer_id: int) -> FeedbackForm:
+    def iter_all(self, status: Optional[str] = None, batch_size: int = 1000) -> Iterator[FeedbackForm]:
+        """
+        Stream all feedback forms in batches.
+        
+        Rows are fetched from the cursor ``batch_size`` at a time, so memory
+        stays bounded regardless of the table size.
+        
+        Args:
+            status: Filter by status
+            batch_size: Number of rows buffered per fetch
+            
+        Returns:
+            Iterator[FeedbackForm]: Feedback forms ordered by ID
+        """
+        stmt = select(FeedbackForm).order_by(FeedbackForm.id)
+        if status:
+            stmt = stmt.where(FeedbackForm.status == status)
+        return self.db.execute(stmt.execution_options(yield_per=batch_size)).scalars()
+    
+    def create(self, form_create: FeedbackFormCreate, reviewer_id: int) -> Row:
         """
         Create a new feedback form.
         
@@ -100,44 +168,60 @@ class FeedbackFormRepository:
             reviewer_id: Reviewer user ID
             
         Returns:
-            FeedbackForm: Created feedback form object
-        """
-        db_form = FeedbackForm(
-            employee_id=form_create.employee_id,
-            reviewer_id=reviewer_id,
-            performance_cycle_id=form_create.performance_cycle_id,
-            strengths=form_create.strengths,
-            improvements=form_create.improvements,
-            overall_rating=form_create.overall_rating,
-            status=form_create.status
+            Row: Created feedback form row, as returned by the INSERT
+        """
+        # The table only has an UPDATE trigger, so SQL Server allows OUTPUT here
+        stmt = (
+            insert(FeedbackForm)
+            .values(
+                employee_id=form_create.employee_id,
+                reviewer_id=reviewer_id,
+                performance_cycle_id=form_create.performance_cycle_id,
+                strengths=form_create.strengths,
+                improvements=form_create.improvements,
+                overall_rating=form_create.overall_rating,
+                status=form_create.status
+            )
+            .returning(*FeedbackForm.__table__.c)
         )
-        self.db.add(db_form)
+        row = self.db.execute(stmt).one()
         self.db.commit()
-        self.db.refresh(db_form)
-        return db_form
+        return row
     
-    def update(self, form_id: int, form_update: FeedbackFormUpdate) -> Optional[FeedbackForm]:
+    def update_draft(self, form_id: int, reviewer_id: int, form_update: FeedbackFormUpdate) -> Optional[FeedbackForm]:
         """
-        Update feedback form information.
+        Update a reviewer's unsubmitted feedback form with a single conditional UPDATE.
         
         Args:
             form_id: Feedback form ID
+            reviewer_id: Reviewer user ID the form must belong to
             form_update: Feedback form update data
             
         Returns:
-            Optional[FeedbackForm]: Updated feedback form object if found, None otherwise
+            Optional[FeedbackForm]: Updated feedback form object, or None if no
+                unsubmitted form of this reviewer matched
         """
-        db_form = self.get_by_id(form_id)
-        if not db_form:
-            return None
+        conditions = (
+            FeedbackForm.id == form_id,
+            FeedbackForm.reviewer_id == reviewer_id,
+            FeedbackForm.status != "submitted",
+        )
+        update_data = form_update.model_dump(exclude_unset=True)
+        if not update_data:
+            return self.db.query(FeedbackForm).filter(*conditions).first()
         
-        update_data = form_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_form, field, value)
+        result = self.db.execute(
+            update(FeedbackForm)
+            .where(*conditions)
+            .values(**update_data)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
+            return None
         
         self.db.commit()
-        self.db.refresh(db_form)
-        return db_form
+        return self.get_by_id(form_id)
     
     def delete(self, form_id: int) -> bool:
         """
@@ -3,10 +3,16 @@ Notification repository for database operations.
 """
 
 from typing import List, Optional
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from app.models.notification import Notification
 from app.schemas.notification import NotificationCreate, NotificationUpdate
+from app.utils.pagination import paginate_keyset
+
+# IDs bound per UPDATE, kept well below SQL Server's 2100 parameter limit
+_MARK_READ_BATCH_SIZE = 500
 
 
 class NotificationRepository:
@@ -25,60 +31,75 @@ class NotificationRepository:
         Returns:
             Optional[Notification]: Notification object if found, None otherwise
         """
-        return self.db.query(Notification).filter(Notification.id == notification_id).first()
+        return self.db.get(Notification, notification_id)
     
-    def get_by_user_id(self, user_id: int, skip: int = 0, limit: int = 100, unread_only: bool = False) -> List[Notification]:
+    def get_by_user_id(self, user_id: int, skip: int = 0, limit: int = 100, unread_only: bool = False, cursor: Optional[str] = None) -> List[Row]:
         """
-        Get notifications by user ID.
+        Get notifications by user ID, newest first.
+        
+        Plain column rows are returned; list responses are built straight
+        from them without going through the identity map.
         
         Args:
             user_id: User ID
             skip: Number of records to skip
             limit: Maximum number of records to return
             unread_only: Filter to unread notifications only
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
-            List[Notification]: List of notifications
+            List[Row]: Notification rows
         """
-        query = self.db.query(Notification).filter(Notification.user_id == user_id)
+        query = self.db.query(*Notification.__table__.c).filter(Notification.user_id == user_id)
         if unread_only:
             query = query.filter(Notification.is_read == False)
-        return query.order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
+        query = paginate_keyset(query, Notification.created_at, Notification.id, cursor, skip, limit)
+        return query.all()
     
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Notification]:
+    def get_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[Row]:
         """
-        Get all notifications.
+        Get all notifications, newest first.
         
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
-            List[Notification]: List of notifications
+            List[Row]: Notification rows
         """
-        return self.db.query(Notification).order_by(Notification.created_at.desc()).offset(skip).limit(limit).all()
+        query = paginate_keyset(
+            self.db.query(*Notification.__table__.c), Notification.created_at, Notification.id, cursor, skip, limit
+        )
+        return query.all()
     
-    def create(self, notification_create: NotificationCreate, user_id: int) -> Notification:
+    def create(self, notification_create: NotificationCreate, user_id: int) -> Row:
         """
         Create a new notification.
         
+        The generated ID and defaults come back via RETURNING, so no SELECT
+        follows the INSERT.
+        
         Args:
             notification_create: Notification creation data
             user_id: User ID
             
         Returns:
-            Notification: Created notification object
+            Row: Created notification row
         """
-        db_notification = Notification(
-            user_id=user_id,
-            title=notification_create.title,
-            message=notification_create.message,
-            type=notification_create.type
+        stmt = (
+            insert(Notification)
+            .values(
+                user_id=user_id,
+                title=notification_create.title,
+                message=notification_create.message,
+                type=notification_create.type
+            )
+            .returning(*Notification.__table__.c)
         )
-        self.db.add(db_notification)
+        row = self.db.execute(stmt).one()
         self.db.commit()
-        self.db.refresh(db_notification)
-        return db_notification
+        return row
     
     def update(self, notification_id: int, notification_update: NotificationUpdate) -> Optional[Notification]:
         """
@@ -95,7 +116,7 @@ class NotificationRepository:
         if not db_notification:
             return None
         
-        update_data = notification_update.dict(exclude_unset=True)
+        update_data = notification_update.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_notification, field, value)
         
@@ -103,24 +124,29 @@ class NotificationRepository:
         self.db.refresh(db_notification)
         return db_notification
     
-    def mark_as_read(self, notification_id: int) -> Optional[Notification]:
+    def mark_as_read(self, notification_id: int, user_id: int) -> Optional[Row]:
         """
-        Mark notification as read.
+        Mark a user's notification as read.
+        
+        Ownership is part of the UPDATE predicate and the new row state comes
+        back via RETURNING, so this is a single statement.
         
         Args:
             notification_id: Notification ID
+            user_id: ID of the user the notification must belong to
             
         Returns:
-            Optional[Notification]: Updated notification object if found, None otherwise
+            Optional[Row]: Updated notification row if found and owned by the user, None otherwise
         """
-        db_notification = self.get_by_id(notification_id)
-        if not db_notification:
-            return None
-        
-        db_notification.is_read = True
+        stmt = (
+            update(Notification)
+            .where(Notification.id == notification_id, Notification.user_id == user_id)
+            .values(is_read=True)
+            .returning(*Notification.__table__.c)
+        )
+        row = self.db.execute(stmt).first()
         self.db.commit()
-        self.db.refresh(db_notification)
-        return db_notification
+        return row
     
     def mark_all_as_read(self, user_id: int) -> int:
         """
@@ -132,30 +158,72 @@ class NotificationRepository:
         Returns:
             int: Number of notifications marked as read
         """
-        result = self.db.query(Notification).filter(
-            Notification.user_id == user_id,
-            Notification.is_read == False
-        ).update({"is_read": True})
+        stmt = (
+            update(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read == False)
+            .values(is_read=True)
+            .execution_options(synchronize_session=False)
+        )
+        result = self.db.execute(stmt)
+        self.db.commit()
+        return result.rowcount
+    
+    def mark_many_as_read(self, notification_ids: List[int], user_id: int) -> int:
+        """
+        Mark several of a user's notifications as read.
+        
+        IDs are sent in batches of bulk UPDATEs committed as one transaction;
+        IDs that do not exist or belong to another user are ignored.
+        
+        Args:
+            notification_ids: Notification IDs
+            user_id: ID of the user the notifications must belong to
+            
+        Returns:
+            int: Number of notifications marked as read
+        """
+        ids = sorted(set(notification_ids))
+        count = 0
+        for start in range(0, len(ids), _MARK_READ_BATCH_SIZE):
+            stmt = (
+                update(Notification)
+                .where(
+                    Notification.id.in_(ids[start:start + _MARK_READ_BATCH_SIZE]),
+                    Notification.user_id == user_id,
+                    Notification.is_read == False
+                )
+                .values(is_read=True)
+                .execution_options(synchronize_session=False)
+            )
+            count += self.db.execute(stmt).rowcount
         self.db.commit()
-        return result
+        return count
     
-    def delete(self, notification_id: int) -> bool:
+    def delete(self, notification_id: int) -> Optional[int]:
         """
         Delete notification by ID.
         
+        The owner is read back from the DELETE itself so callers can drop
+        that user's cached unread count without a prior SELECT.
+        
         Args:
             notification_id: Notification ID
             
         Returns:
-            bool: True if notification was deleted, False if not found
+            Optional[int]: ID of the notification's owner if deleted, None if not found
         """
-        db_notification = self.get_by_id(notification_id)
-        if not db_notification:
-            return False
-        
-        self.db.delete(db_notification)
+        stmt = (
+            delete(Notification)
+            .where(Notification.id == notification_id)
+            .returning(Notification.user_id)
+            .execution_options(synchronize_session=False)
+        )
+        user_id = self.db.execute(stmt).scalar_one_or_none()
+        if user_id is None:
+            self.db.rollback()
+            return None
         self.db.commit()
-        return True
+        return user_id
     
     def get_unread_count(self, user_id: int) -> int:
         """
@@ -167,7 +235,31 @@ class NotificationRepository:
         Returns:
             int: Count of unread notifications
         """
-        return self.db.query(Notification).filter(
-            Notification.user_id == user_id,
-            Notification.is_read == False
-        ).count()
+        # Plain COUNT over the (user_id, is_read, ...) index; Query.count() would
+        # wrap the full row select in a subquery
+        return self.db.scalar(
+            select(func.count()).select_from(Notification).where(
+                Notification.user_id == user_id,
+                Notification.is_read == False
+            )
+        )
+    
+    def has_unread(self, user_id: int) -> bool:
+        """
+        Check whether a user has any unread notification.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            bool: True if at least one notification is unread
+        """
+        # EXISTS stops at the first matching index entry instead of counting them all
+        return self.db.scalar(
+            select(
+                exists().where(
+                    Notification.user_id == user_id,
+                    Notification.is_read == False
+                )
+            )
+        )
@@ -2,13 +2,18 @@
 Performance Cycle repository for database operations.
 """
 
+from datetime import datetime
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, insert, select, update
+from sqlalchemy.engine import Row
 
 from app.models.performance_cycle import PerformanceCycle
 from app.schemas.performance_cycle import PerformanceCycleCreate, PerformanceCycleUpdate
 
+# Built once; executing the same statement object skips rebuilding it per call
+_SELECT_ACTIVE_CYCLE = select(PerformanceCycle).where(PerformanceCycle.status == "active").limit(1)
+
 
 class PerformanceCycleRepository:
     """Repository for performance cycle database operations."""
@@ -26,7 +31,7 @@ class PerformanceCycleRepository:
         Returns:
             Optional[PerformanceCycle]: Performance cycle object if found, None otherwise
         """
-        return self.db.query(PerformanceCycle).filter(PerformanceCycle.id == cycle_id).first()
+        return self.db.get(PerformanceCycle, cycle_id)
     
     def get_active_cycle(self) -> Optional[PerformanceCycle]:
         """
@@ -35,26 +40,51 @@ class PerformanceCycleRepository:
         Returns:
             Optional[PerformanceCycle]: Active performance cycle if found, None otherwise
         """
-        return self.db.query(PerformanceCycle).filter(PerformanceCycle.status == "active").first()
+        return self.db.scalars(_SELECT_ACTIVE_CYCLE).first()
+    
+    def deactivate_active(self, exclude_id: Optional[int] = None) -> int:
+        """
+        Mark every active cycle except ``exclude_id`` inactive with one UPDATE.
+        
+        The statement is not committed; it becomes part of the caller's next
+        create or update, so both changes commit (or roll back) together.
+        
+        Args:
+            exclude_id: Cycle ID to leave untouched
+            
+        Returns:
+            int: Number of cycles deactivated
+        """
+        stmt = (
+            update(PerformanceCycle)
+            .where(PerformanceCycle.status == "active")
+            .values(status="inactive", updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if exclude_id is not None:
+            stmt = stmt.where(PerformanceCycle.id != exclude_id)
+        return self.db.execute(stmt).rowcount
     
-    def get_all(self, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[PerformanceCycle]:
+    def get_all(self, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[Row]:
         """
         Get all performance cycles with optional filtering.
         
+        Columns are selected directly, so no ORM entities are built.
+        
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
             status: Filter by status
             
         Returns:
-            List[PerformanceCycle]: List of performance cycles
+            List[Row]: Performance cycle rows
         """
-        query = self.db.query(PerformanceCycle)
+        stmt = select(*PerformanceCycle.__table__.c)
         if status:
-            query = query.filter(PerformanceCycle.status == status)
-        return query.offset(skip).limit(limit).all()
+            stmt = stmt.where(PerformanceCycle.status == status)
+        return self.db.execute(stmt.order_by(PerformanceCycle.id).offset(skip).limit(limit)).all()
     
-    def create(self, cycle_create: PerformanceCycleCreate) -> PerformanceCycle:
+    def create(self, cycle_create: PerformanceCycleCreate) -> Row:
         """
         Create a new performance cycle.
         
@@ -62,19 +92,22 @@ class PerformanceCycleRepository:
             cycle_create: Performance cycle creation data
             
         Returns:
-            PerformanceCycle: Created performance cycle object
+            Row: Created performance cycle row, as returned by the INSERT
         """
-        db_cycle = PerformanceCycle(
-            name=cycle_create.name,
-            start_date=cycle_create.start_date,
-            end_date=cycle_create.end_date,
-            status=cycle_create.status,
-            description=cycle_create.description
+        stmt = (
+            insert(PerformanceCycle)
+            .values(
+                name=cycle_create.name,
+                start_date=cycle_create.start_date,
+                end_date=cycle_create.end_date,
+                status=cycle_create.status,
+                description=cycle_create.description
+            )
+            .returning(*PerformanceCycle.__table__.c)
         )
-        self.db.add(db_cycle)
+        row = self.db.execute(stmt).one()
         self.db.commit()
-        self.db.refresh(db_cycle)
-        return db_cycle
+        return row
     
     def update(self, cycle_id: int, cycle_update: PerformanceCycleUpdate) -> Optional[PerformanceCycle]:
         """
@@ -87,17 +120,22 @@ class PerformanceCycleRepository:
         Returns:
             Optional[PerformanceCycle]: Updated performance cycle object if found, None otherwise
         """
-        db_cycle = self.get_by_id(cycle_id)
-        if not db_cycle:
-            return None
+        update_data = cycle_update.model_dump(exclude_unset=True)
+        if not update_data:
+            return self.get_by_id(cycle_id)
         
-        update_data = cycle_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_cycle, field, value)
+        result = self.db.execute(
+            update(PerformanceCycle)
+            .where(PerformanceCycle.id == cycle_id)
+            .values(**update_data, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
+            return None
         
         self.db.commit()
-        self.db.refresh(db_cycle)
-        return db_cycle
+        return self.get_by_id(cycle_id)
     
     def delete(self, cycle_id: int) -> bool:
         """
@@ -4,13 +4,20 @@ Reviewer Selection repository for database operations.
 
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, delete, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 
+from app.core.database import strict_loading_options
 from app.models.reviewer_selection import ReviewerSelection, ReviewerSelectionDetail
-from app.models.user import User
 from app.schemas.reviewer_selection import ReviewerSelectionCreate, ReviewerSelectionUpdate
 
+_INSERT_DETAILS = insert(ReviewerSelectionDetail)
+
+# Statuses in which a mentee may still edit their selection
+_EDITABLE_STATUSES = ("pending", "sent_back")
+
 
 class ReviewerSelectionRepository:
     """Repository for reviewer selection database operations."""
@@ -18,6 +25,25 @@ class ReviewerSelectionRepository:
     def __init__(self, db: Session):
         self.db = db
     
+    @staticmethod
+    def _approval_load_options() -> tuple:
+        """
+        Loader options for everything an approval view reads.
+        
+        Everything is joined into a single SELECT. A selection has only a few
+        reviewers, so the duplicated selection columns cost less than a second
+        round trip.
+        
+        Returns:
+            tuple: Eager-loading options for mentee, cycle and selected reviewers
+        """
+        return (
+            joinedload(ReviewerSelection.mentee),
+            joinedload(ReviewerSelection.performance_cycle),
+            joinedload(ReviewerSelection.selected_reviewers),
+            *strict_loading_options(),
+        )
+    
     def get_by_id(self, selection_id: int) -> Optional[ReviewerSelection]:
         """
         Get reviewer selection by ID.
@@ -28,7 +54,25 @@ class ReviewerSelectionRepository:
         Returns:
             Optional[ReviewerSelection]: Reviewer selection object if found, None otherwise
         """
-        return self.db.query(ReviewerSelection).filter(ReviewerSelection.id == selection_id).first()
+        return self.db.get(ReviewerSelection, selection_id)
+    
+    def get_state(self, selection_id: int) -> Optional[Row]:
+        """
+        Get the ownership and status of a reviewer selection.
+        
+        Only the columns needed to explain a rejected write are selected,
+        leaving out the mentor feedback text.
+        
+        Args:
+            selection_id: Reviewer selection ID
+            
+        Returns:
+            Optional[Row]: Row with id, mentee_id and status if found, None otherwise
+        """
+        stmt = select(ReviewerSelection.id, ReviewerSelection.mentee_id, ReviewerSelection.status).where(
+            ReviewerSelection.id == selection_id
+        )
+        return self.db.execute(stmt).first()
     
     def get_by_mentee_id(self, mentee_id: int, cycle_id: Optional[int] = None) -> Optional[ReviewerSelection]:
         """
@@ -39,9 +83,14 @@ class ReviewerSelectionRepository:
             cycle_id: Optional performance cycle ID
             
         Returns:
-            Optional[ReviewerSelection]: Reviewer selection object if found, None otherwise
+            Optional[ReviewerSelection]: Reviewer selection object with its selected
+                reviewers loaded if found, None otherwise
         """
-        query = self.db.query(ReviewerSelection).filter(ReviewerSelection.mentee_id == mentee_id)
+        query = (
+            self.db.query(ReviewerSelection)
+            .options(joinedload(ReviewerSelection.selected_reviewers))
+            .filter(ReviewerSelection.mentee_id == mentee_id)
+        )
         if cycle_id:
             query = query.filter(ReviewerSelection.performance_cycle_id == cycle_id)
         return query.first()
@@ -54,10 +103,38 @@ class ReviewerSelectionRepository:
             mentor_id: Mentor user ID
             
         Returns:
-            List[ReviewerSelection]: List of pending reviewer selections
+            List[ReviewerSelection]: List of pending reviewer selections, with
+                mentee, performance cycle and selected reviewers loaded
         """
         # Note: This would need to be customized based on mentor-mentee relationship logic
-        return self.db.query(ReviewerSelection).filter(ReviewerSelection.status == "pending").all()
+        return (
+            self.db.query(ReviewerSelection)
+            .options(*self._approval_load_options())
+            .filter(ReviewerSelection.status == "pending")
+            .all()
+        )
+    
+    def get_pending_approval(self, selection_id: int, mentor_id: int) -> Optional[ReviewerSelection]:
+        """
+        Get a single pending approval for a mentor.
+        
+        The mentee, selected reviewers and performance cycle are loaded
+        alongside the selection.
+        
+        Args:
+            selection_id: Reviewer selection ID
+            mentor_id: Mentor user ID
+            
+        Returns:
+            Optional[ReviewerSelection]: Pending reviewer selection if found, None otherwise
+        """
+        # Note: scoped like get_pending_approvals until mentor-mentee assignments exist
+        return (
+            self.db.query(ReviewerSelection)
+            .options(*self._approval_load_options())
+            .filter(ReviewerSelection.id == selection_id, ReviewerSelection.status == "pending")
+            .first()
+        )
     
     def get_all(self, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[ReviewerSelection]:
         """
@@ -71,158 +148,217 @@ class ReviewerSelectionRepository:
         Returns:
             List[ReviewerSelection]: List of reviewer selections
         """
-        query = self.db.query(ReviewerSelection)
+        # The page is limited in a subquery before the handful of reviewers per
+        # selection is joined on; SQL Server needs the ORDER BY for OFFSET
+        query = self.db.query(ReviewerSelection).options(joinedload(ReviewerSelection.selected_reviewers))
         if status:
             query = query.filter(ReviewerSelection.status == status)
-        return query.offset(skip).limit(limit).all()
+        return query.order_by(ReviewerSelection.id).offset(skip).limit(limit).all()
     
-    def create(self, selection_create: ReviewerSelectionCreate, mentee_id: int) -> ReviewerSelection:
+    def create(self, selection_create: ReviewerSelectionCreate, mentee_id: int) -> Optional[ReviewerSelection]:
         """
         Create a new reviewer selection.
         
+        A mentee's second selection for a cycle is rejected by the unique
+        index on (mentee_id, performance_cycle_id), not by a prior SELECT.
+        
         Args:
             selection_create: Reviewer selection creation data
             mentee_id: Mentee user ID
             
         Returns:
-            ReviewerSelection: Created reviewer selection object
-        """
-        # Create the main selection record
-        db_selection = ReviewerSelection(
-            performance_cycle_id=selection_create.performance_cycle_id,
-            mentee_id=mentee_id,
-            status="pending",
-            submitted_at=datetime.utcnow()
-        )
-        self.db.add(db_selection)
-        self.db.flush()  # Get the ID without committing
+            Optional[ReviewerSelection]: Created reviewer selection object, or None if the
+                mentee already has a selection for the cycle
+        """
+        # Create the main selection record; only the generated ID is needed back
+        try:
+            selection_id = self.db.execute(
+                insert(ReviewerSelection)
+                .values(
+                    performance_cycle_id=selection_create.performance_cycle_id,
+                    mentee_id=mentee_id,
+                    status="pending",
+                    submitted_at=datetime.utcnow()
+                )
+                .returning(ReviewerSelection.id)
+            ).scalar_one()
+        except IntegrityError:
+            self.db.rollback()
+            return None
         
         # Create reviewer detail records
-        for reviewer_id in selection_create.selected_reviewers:
-            detail = ReviewerSelectionDetail(
-                selection_id=db_selection.id,
-                reviewer_id=reviewer_id
-            )
-            self.db.add(detail)
+        self._insert_details(selection_id, selection_create.selected_reviewers)
         
         self.db.commit()
-        self.db.refresh(db_selection)
-        return db_selection
+        return self._get_with_reviewers(selection_id)
     
-    def update(self, selection_id: int, selection_update: ReviewerSelectionUpdate) -> Optional[ReviewerSelection]:
+    def update(self, selection_id: int, selection_update: ReviewerSelectionUpdate, mentee_id: int) -> Optional[ReviewerSelection]:
         """
-        Update reviewer selection information.
+        Update a mentee's editable reviewer selection.
+        
+        Ownership and status are part of the UPDATE predicate, so the selection
+        is not read first; the reviewer details are only replaced once the
+        UPDATE has matched.
         
         Args:
             selection_id: Reviewer selection ID
             selection_update: Reviewer selection update data
+            mentee_id: ID of the mentee the selection must belong to
             
         Returns:
-            Optional[ReviewerSelection]: Updated reviewer selection object if found, None otherwise
+            Optional[ReviewerSelection]: Updated reviewer selection object, or None if no
+                editable selection of the mentee matched
         """
-        db_selection = self.get_by_id(selection_id)
-        if not db_selection:
-            return None
+        update_data = selection_update.model_dump(exclude_unset=True)
+        selected_reviewers = update_data.pop("selected_reviewers", None)
+        # Only mapped columns can be set; e.g. comments has no column to land in
+        values = {field: value for field, value in update_data.items() if field in ReviewerSelection.__table__.c}
         
-        update_data = selection_update.dict(exclude_unset=True)
-        
-        # Handle selected_reviewers separately
-        if "selected_reviewers" in update_data:
-            # Delete existing reviewer details
-            self.db.query(ReviewerSelectionDetail).filter(
-                ReviewerSelectionDetail.selection_id == selection_id
-            ).delete()
-            
-            # Create new reviewer details
-            for reviewer_id in update_data["selected_reviewers"]:
-                detail = ReviewerSelectionDetail(
-                    selection_id=selection_id,
-                    reviewer_id=reviewer_id
-                )
-                self.db.add(detail)
-            
-            del update_data["selected_reviewers"]
+        result = self.db.execute(
+            update(ReviewerSelection)
+            .where(
+                ReviewerSelection.id == selection_id,
+                ReviewerSelection.mentee_id == mentee_id,
+                ReviewerSelection.status.in_(_EDITABLE_STATUSES)
+            )
+            .values(**values, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
+            return None
         
-        # Update other fields
-        for field, value in update_data.items():
-            setattr(db_selection, field, value)
+        if selected_reviewers is not None:
+            self.db.execute(
+                delete(ReviewerSelectionDetail)
+                .where(ReviewerSelectionDetail.selection_id == selection_id)
+                .execution_options(synchronize_session=False)
+            )
+            self._insert_details(selection_id, selected_reviewers)
         
         self.db.commit()
-        self.db.refresh(db_selection)
-        return db_selection
+        return self._get_with_reviewers(selection_id)
+    
+    def _insert_details(self, selection_id: int, reviewer_ids: List[int]) -> None:
+        """
+        Insert the reviewer detail rows of a selection in one statement.
+        
+        Args:
+            selection_id: Reviewer selection ID
+            reviewer_ids: Selected reviewer user IDs
+        """
+        if not reviewer_ids:
+            return
+        # One timestamp for the batch, so no server default is evaluated per row
+        now = datetime.utcnow()
+        self.db.execute(
+            _INSERT_DETAILS,
+            [
+                {"selection_id": selection_id, "reviewer_id": reviewer_id, "created_at": now}
+                for reviewer_id in reviewer_ids
+            ]
+        )
     
     def approve(self, selection_id: int, mentor_feedback: Optional[str] = None) -> Optional[ReviewerSelection]:
         """
-        Approve a reviewer selection.
+        Approve a pending reviewer selection.
         
         Args:
             selection_id: Reviewer selection ID
             mentor_feedback: Optional mentor feedback
             
         Returns:
-            Optional[ReviewerSelection]: Updated reviewer selection object if found, None otherwise
+            Optional[ReviewerSelection]: Updated reviewer selection object if found and pending, None otherwise
         """
-        db_selection = self.get_by_id(selection_id)
-        if not db_selection:
-            return None
-        
-        db_selection.status = "approved"
-        db_selection.mentor_feedback = mentor_feedback
-        
-        self.db.commit()
-        self.db.refresh(db_selection)
-        return db_selection
+        return self._resolve_pending(selection_id, "approved", mentor_feedback)
     
     def send_back(self, selection_id: int, mentor_feedback: str) -> Optional[ReviewerSelection]:
         """
-        Send back a reviewer selection for revision.
+        Send back a pending reviewer selection for revision.
         
         Args:
             selection_id: Reviewer selection ID
             mentor_feedback: Mentor feedback
             
         Returns:
-            Optional[ReviewerSelection]: Updated reviewer selection object if found, None otherwise
+            Optional[ReviewerSelection]: Updated reviewer selection object if found and pending, None otherwise
         """
-        db_selection = self.get_by_id(selection_id)
-        if not db_selection:
-            return None
+        return self._resolve_pending(selection_id, "sent_back", mentor_feedback)
+    
+    def _resolve_pending(self, selection_id: int, status: str, mentor_feedback: Optional[str]) -> Optional[ReviewerSelection]:
+        """
+        Move a pending selection to a new status with a single conditional UPDATE.
         
-        db_selection.status = "sent_back"
-        db_selection.mentor_feedback = mentor_feedback
+        The table's update trigger rules out OUTPUT/RETURNING on SQL Server, so
+        the updated row is read back only when the UPDATE matched.
+        
+        Args:
+            selection_id: Reviewer selection ID
+            status: New status
+            mentor_feedback: Mentor feedback
+            
+        Returns:
+            Optional[ReviewerSelection]: Updated reviewer selection object, or None if no pending selection matched
+        """
+        result = self.db.execute(
+            update(ReviewerSelection)
+            .where(ReviewerSelection.id == selection_id, ReviewerSelection.status == "pending")
+            .values(status=status, mentor_feedback=mentor_feedback)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
+            return None
         
         self.db.commit()
-        self.db.refresh(db_selection)
-        return db_selection
+        return self._get_with_reviewers(selection_id)
     
-    def delete(self, selection_id: int) -> bool:
+    def _get_with_reviewers(self, selection_id: int) -> Optional[ReviewerSelection]:
         """
-        Delete reviewer selection by ID.
+        Reload a selection together with its selected reviewers.
+        
+        The selection and its reviewers come back in one joined SELECT, and
+        already-loaded state is overwritten with the committed row.
         
         Args:
             selection_id: Reviewer selection ID
             
         Returns:
-            bool: True if reviewer selection was deleted, False if not found
+            Optional[ReviewerSelection]: Reviewer selection object if found, None otherwise
         """
-        db_selection = self.get_by_id(selection_id)
-        if not db_selection:
-            return False
-        
-        self.db.delete(db_selection)
-        self.db.commit()
-        return True
+        return self.db.get(
+            ReviewerSelection,
+            selection_id,
+            options=[joinedload(ReviewerSelection.selected_reviewers)],
+            populate_existing=True
+        )
     
-    def get_selected_reviewers(self, selection_id: int) -> List[User]:
+    def delete(self, selection_id: int, mentee_id: int) -> bool:
         """
-        Get selected reviewers for a selection.
+        Delete a mentee's pending reviewer selection.
+        
+        A single conditional DELETE; the reviewer details go with it through
+        the foreign key's ON DELETE CASCADE.
         
         Args:
             selection_id: Reviewer selection ID
+            mentee_id: ID of the mentee the selection must belong to
             
         Returns:
-            List[User]: List of selected reviewers
+            bool: True if the selection was deleted, False if no pending selection of the mentee matched
         """
-        return self.db.query(User).join(ReviewerSelectionDetail).filter(
-            ReviewerSelectionDetail.selection_id == selection_id
-        ).all()
+        result = self.db.execute(
+            delete(ReviewerSelection)
+            .where(
+                ReviewerSelection.id == selection_id,
+                ReviewerSelection.mentee_id == mentee_id,
+                ReviewerSelection.status == "pending"
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
+            return False
+        
+        self.db.commit()
+        return True
@@ -2,13 +2,50 @@
 User repository for database operations.
 """
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional
+from sqlalchemy import and_, bindparam, delete, insert, select, update
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.roles import REVIEWER_ROLES
+from app.core.security import get_password_hash, password_executor, password_needs_rehash, verify_password
+
+# Columns backing UserResponse (everything but the password hash)
+USER_RESPONSE_COLUMNS = (
+    User.id,
+    User.email,
+    User.name,
+    User.role,
+    User.department,
+    User.position,
+    User.is_active,
+    User.created_at,
+    User.updated_at,
+)
+
+# Fixed-shape statements are built once and reused for every call
+_SELECT_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
+_SELECT_LOGIN_BY_EMAIL = _SELECT_BY_EMAIL.options(undefer(User.password_hash))
+_SELECT_AVAILABLE_REVIEWERS = select(*USER_RESPONSE_COLUMNS).where(
+    User.is_active == True,
+    User.role.in_(bindparam("reviewer_roles", value=sorted(REVIEWER_ROLES), expanding=True))
+)
+
+# IDs per IN list, well under SQL Server's 2100 bind parameter limit
+_ID_BATCH_SIZE = 500
+
+
+# Verified against when the user is missing or inactive, so failed logins take
+# as long as a real password check. Hashed on first use, not at import time.
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Return the hash used for logins without a usable account."""
+    return get_password_hash("not-a-real-password")
 
 
 class UserRepository:
@@ -27,7 +64,25 @@ class UserRepository:
         Returns:
             Optional[User]: User object if found, None otherwise
         """
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.get(User, user_id)
+    
+    def get_many_by_ids(self, user_ids: Iterable[int]) -> Dict[int, User]:
+        """
+        Get several users by ID with one IN query per batch of IDs.
+        
+        Args:
+            user_ids: User IDs; duplicates are ignored
+            
+        Returns:
+            Dict[int, User]: Users keyed by ID; unknown IDs are absent
+        """
+        ids = list(set(user_ids))
+        users: Dict[int, User] = {}
+        for start in range(0, len(ids), _ID_BATCH_SIZE):
+            batch = ids[start:start + _ID_BATCH_SIZE]
+            for user in self.db.scalars(select(User).where(User.id.in_(batch))):
+                users[user.id] = user
+        return users
     
     def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -39,12 +94,15 @@ class UserRepository:
         Returns:
             Optional[User]: User object if found, None otherwise
         """
-        return self.db.query(User).filter(User.email == email).first()
+        return self.db.scalars(_SELECT_BY_EMAIL, {"email": email}).first()
     
-    def get_all(self, skip: int = 0, limit: int = 100, role: Optional[str] = None, department: Optional[str] = None) -> List[User]:
+    def get_all(self, skip: int = 0, limit: int = 100, role: Optional[str] = None, department: Optional[str] = None) -> List[Row]:
         """
         Get all users with optional filtering.
         
+        Only the columns exposed in user responses are selected; no ORM
+        entities are built.
+        
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
@@ -52,83 +110,154 @@ class UserRepository:
             department: Filter by department
             
         Returns:
-            List[User]: List of users
+            List[Row]: User rows keyed by column name
         """
-        query = self.db.query(User)
+        stmt = select(*USER_RESPONSE_COLUMNS)
         if role:
-            query = query.filter(User.role == role)
+            stmt = stmt.where(User.role == role)
         if department:
-            query = query.filter(User.department == department)
-        return query.offset(skip).limit(limit).all()
+            stmt = stmt.where(User.department == department)
+        stmt = stmt.order_by(User.id).offset(skip).limit(limit)
+        return self.db.execute(stmt).all()
     
-    def get_available_reviewers(self, exclude_user_id: Optional[int] = None, department: Optional[str] = None) -> List[User]:
+    def get_available_reviewers(self, exclude_user_id: Optional[int] = None, department: Optional[str] = None) -> Iterator[Row]:
         """
-        Get available reviewers (Mentors and People Committee members).
+        Stream available reviewers (Mentors and People Committee members).
+        
+        Like get_all, only the response columns are selected, so password
+        hashes never leave the database. The pool is unbounded, so rows are
+        fetched 200 at a time rather than materialized up front.
         
         Args:
             exclude_user_id: User ID to exclude from results
             department: Filter by department
             
         Returns:
-            List[User]: List of available reviewers
+            Iterator[Row]: Reviewer rows keyed by column name
         """
-        query = self.db.query(User).filter(
-            User.is_active == True,
-            User.role.in_(["Mentor", "People Committee"])
-        )
+        stmt = _SELECT_AVAILABLE_REVIEWERS
         if exclude_user_id:
-            query = query.filter(User.id != exclude_user_id)
+            stmt = stmt.where(User.id != exclude_user_id)
         if department:
-            query = query.filter(User.department == department)
-        return query.all()
+            stmt = stmt.where(User.department == department)
+        return iter(self.db.execute(stmt.execution_options(yield_per=200)))
     
-    def create(self, user_create: UserCreate) -> User:
+    def create(self, user_create: UserCreate) -> Row:
         """
         Create a new user.
         
+        The generated ID and created_at come back from the INSERT itself
+        (the users trigger only fires on UPDATE, so OUTPUT is allowed).
+        
         Args:
             user_create: User creation data
             
         Returns:
-            User: Created user object
+            Row: Created user row (response columns)
+            
+        Raises:
+            IntegrityError: If the email is already taken; the session is rolled back
         """
         hashed_password = get_password_hash(user_create.password)
-        db_user = User(
-            email=user_create.email,
-            name=user_create.name,
-            role=user_create.role,
-            department=user_create.department,
-            position=user_create.position,
-            password_hash=hashed_password,
-            is_active=user_create.is_active
+        stmt = (
+            insert(User)
+            .values(
+                email=user_create.email,
+                name=user_create.name,
+                role=user_create.role,
+                department=user_create.department,
+                position=user_create.position,
+                password_hash=hashed_password,
+                is_active=user_create.is_active
+            )
+            .returning(*USER_RESPONSE_COLUMNS)
         )
-        self.db.add(db_user)
+        try:
+            row = self.db.execute(stmt).one()
+        except IntegrityError:
+            self.db.rollback()
+            raise
         self.db.commit()
-        self.db.refresh(db_user)
-        return db_user
+        return row
     
-    def update(self, user_id: int, user_update: UserUpdate) -> Optional[User]:
+    def create_many(self, users_create: List[UserCreate], batch_size: int = 500) -> List[int]:
+        """
+        Create several users in one transaction.
+        
+        Passwords are hashed in parallel on the password executor (argon2 and
+        bcrypt release the GIL), then rows are sent as multi-row INSERTs of up
+        to ``batch_size`` users, with the generated IDs returned by the same
+        statements.
+        
+        Args:
+            users_create: User creation data
+            batch_size: Maximum number of users per INSERT
+            
+        Returns:
+            List[int]: IDs of the created users, in input order
+        """
+        password_hashes = password_executor.map(
+            get_password_hash, [user_create.password for user_create in users_create]
+        )
+        rows = [
+            {
+                "email": user_create.email,
+                "name": user_create.name,
+                "role": user_create.role,
+                "department": user_create.department,
+                "position": user_create.position,
+                "password_hash": password_hash,
+                "is_active": user_create.is_active,
+            }
+            for user_create, password_hash in zip(users_create, password_hashes)
+        ]
+        stmt = insert(User).returning(User.id, sort_by_parameter_order=True)
+        
+        user_ids: List[int] = []
+        for start in range(0, len(rows), batch_size):
+            user_ids.extend(self.db.scalars(stmt, rows[start:start + batch_size]))
+        self.db.commit()
+        return user_ids
+    
+    def update(self, user_id: int, user_update: UserUpdate) -> Optional[Row]:
         """
         Update user information.
         
+        The change is a single UPDATE; the users table's update trigger rules
+        out RETURNING on SQL Server, so the response columns are read back
+        with one SELECT instead of loading and refreshing an entity.
+        
         Args:
             user_id: User ID
             user_update: User update data
             
         Returns:
-            Optional[User]: Updated user object if found, None otherwise
+            Optional[Row]: Updated user row (response columns) if found, None otherwise
+            
+        Raises:
+            IntegrityError: If the new email is already taken; the session is rolled back
         """
-        db_user = self.get_by_id(user_id)
-        if not db_user:
-            return None
+        select_updated = select(*USER_RESPONSE_COLUMNS).where(User.id == user_id)
+        update_data = user_update.model_dump(exclude_unset=True)
+        if not update_data:
+            return self.db.execute(select_updated).first()
         
-        update_data = user_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_user, field, value)
+        try:
+            result = self.db.execute(
+                update(User)
+                .where(User.id == user_id)
+                .values(**update_data, updated_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+        except IntegrityError:
+            self.db.rollback()
+            raise
+        if result.rowcount == 0:
+            self.db.rollback()
+            return None
         
         self.db.commit()
-        self.db.refresh(db_user)
-        return db_user
+        return self.db.execute(select_updated).first()
     
     def delete(self, user_id: int) -> bool:
         """
@@ -140,18 +269,22 @@ class UserRepository:
         Returns:
             bool: True if user was deleted, False if not found
         """
-        db_user = self.get_by_id(user_id)
-        if not db_user:
-            return False
-        
-        self.db.delete(db_user)
+        # Rows referencing the user are guarded by the FKs, so nothing has to be
+        # loaded first
+        result = self.db.execute(
+            delete(User).where(User.id == user_id).execution_options(synchronize_session=False)
+        )
         self.db.commit()
-        return True
+        return result.rowcount > 0
     
     def authenticate(self, email: str, password: str) -> Optional[User]:
         """
         Authenticate user with email and password.
         
+        Legacy bcrypt and SHA-256 hashes are upgraded to argon2 on a
+        successful login. Unknown and inactive users still cost one password
+        verification, which keeps response times uniform.
+        
         Args:
             email: User email
             password: User password
@@ -159,9 +292,15 @@ class UserRepository:
         Returns:
             Optional[User]: User object if authentication successful, None otherwise
         """
-        user = self.get_by_email(email)
+        # The deferred password hash is loaded together with the user
+        user = self.db.scalars(_SELECT_LOGIN_BY_EMAIL, {"email": email}).first()
         if not user or not user.is_active:
+            verify_password(password, _dummy_password_hash())
             return None
         if not verify_password(password, user.password_hash):
             return None
+        if password_needs_rehash(user.password_hash):
+            user.password_hash = get_password_hash(password)
+            self.db.commit()
+            self.db.refresh(user)
         return user
@@ -3,8 +3,14 @@ Feedback Form Pydantic schemas for data validation and serialization.
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+
+OverallRating = Literal["tracking_below", "tracking_expected", "tracking_above"]
+FeedbackFormStatus = Literal["draft", "submitted"]
+
+# Matches the NVARCHAR(4000) strengths/improvements columns
+FEEDBACK_TEXT_MAX_LENGTH = 4000
 
 
 class FeedbackFormBase(BaseModel):
@@ -12,10 +18,10 @@ class FeedbackFormBase(BaseModel):
     
     employee_id: int
     performance_cycle_id: int
-    strengths: str = Field(..., min_length=1)
-    improvements: str = Field(..., min_length=1)
-    overall_rating: str = Field(..., pattern="^(tracking_below|tracking_expected|tracking_above)$")
-    status: str = Field(..., pattern="^(draft|submitted)$")
+    strengths: str = Field(..., min_length=1, max_length=FEEDBACK_TEXT_MAX_LENGTH)
+    improvements: str = Field(..., min_length=1, max_length=FEEDBACK_TEXT_MAX_LENGTH)
+    overall_rating: OverallRating
+    status: FeedbackFormStatus
 
 
 class FeedbackFormCreate(FeedbackFormBase):
@@ -26,10 +32,10 @@ class FeedbackFormCreate(FeedbackFormBase):
 class FeedbackFormUpdate(BaseModel):
     """Schema for updating feedback form information."""
     
-    strengths: Optional[str] = Field(None, min_length=1)
-    improvements: Optional[str] = Field(None, min_length=1)
-    overall_rating: Optional[str] = Field(None, pattern="^(tracking_below|tracking_expected|tracking_above)$")
-    status: Optional[str] = Field(None, pattern="^(draft|submitted)$")
+    strengths: Optional[str] = Field(None, min_length=1, max_length=FEEDBACK_TEXT_MAX_LENGTH)
+    improvements: Optional[str] = Field(None, min_length=1, max_length=FEEDBACK_TEXT_MAX_LENGTH)
+    overall_rating: Optional[OverallRating] = None
+    status: Optional[FeedbackFormStatus] = None
 
 
 class FeedbackFormInDB(FeedbackFormBase):
@@ -56,3 +62,6 @@ class FeedbackFormResponse(FeedbackFormBase):
     model_config = {
         "from_attributes": True
     }
+
+
+FEEDBACK_FORM_LIST_ADAPTER = TypeAdapter(List[FeedbackFormResponse])
@@ -3,8 +3,8 @@ Notification Pydantic schemas for data validation and serialization.
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class NotificationBase(BaseModel):
@@ -29,6 +29,12 @@ class NotificationUpdate(BaseModel):
     is_read: Optional[bool] = None
 
 
+class NotificationMarkRead(BaseModel):
+    """Schema for marking several notifications as read."""
+    
+    ids: List[int] = Field(..., min_length=1, max_length=1000)
+
+
 class NotificationInDB(NotificationBase):
     """Schema for notification data in database."""
     
@@ -53,3 +59,6 @@ class NotificationResponse(NotificationBase):
     model_config = {
         "from_attributes": True
     }
+
+
+NOTIFICATION_LIST_ADAPTER = TypeAdapter(List[NotificationResponse])
@@ -3,8 +3,10 @@ Performance Cycle Pydantic schemas for data validation and serialization.
 """
 
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+
+CycleStatus = Literal["active", "inactive", "completed"]
 
 
 class PerformanceCycleBase(BaseModel):
@@ -13,7 +15,7 @@ class PerformanceCycleBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
     start_date: date
     end_date: date
-    status: str = Field(..., pattern="^(active|inactive|completed)$")
+    status: CycleStatus
     description: Optional[str] = None
 
 
@@ -28,7 +30,7 @@ class PerformanceCycleUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     start_date: Optional[date] = None
     end_date: Optional[date] = None
-    status: Optional[str] = Field(None, pattern="^(active|inactive|completed)$")
+    status: Optional[CycleStatus] = None
     description: Optional[str] = None
 
 
@@ -54,3 +56,6 @@ class PerformanceCycleResponse(PerformanceCycleBase):
     model_config = {
         "from_attributes": True
     }
+
+
+PERFORMANCE_CYCLE_LIST_ADAPTER = TypeAdapter(List[PerformanceCycleResponse])
@@ -3,8 +3,10 @@ User Pydantic schemas for data validation and serialization.
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
+from typing import List, Literal, Optional
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
+
+UserRole = Literal["Employee", "Mentor", "HR Lead", "System Administrator", "People Committee"]
 
 
 class UserBase(BaseModel):
@@ -12,7 +14,7 @@ class UserBase(BaseModel):
     
     email: EmailStr
     name: str = Field(..., min_length=1, max_length=255)
-    role: str = Field(..., pattern="^(Employee|Mentor|HR Lead|System Administrator|People Committee)$")
+    role: UserRole
     department: Optional[str] = Field(None, max_length=100)
     position: Optional[str] = Field(None, max_length=100)
     is_active: bool = True
@@ -29,7 +31,7 @@ class UserUpdate(BaseModel):
     
     email: Optional[EmailStr] = None
     name: Optional[str] = Field(None, min_length=1, max_length=255)
-    role: Optional[str] = Field(None, pattern="^(Employee|Mentor|HR Lead|System Administrator|People Committee)$")
+    role: Optional[UserRole] = None
     department: Optional[str] = Field(None, max_length=100)
     position: Optional[str] = Field(None, max_length=100)
     is_active: Optional[bool] = None
@@ -58,3 +60,7 @@ class UserResponse(UserBase):
     model_config = {
         "from_attributes": True
     }
+
+
+# Built once per process; services validate and endpoints serialize lists with it
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
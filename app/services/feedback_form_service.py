@@ -2,13 +2,14 @@
 Feedback Form service for business logic operations.
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
+import orjson
 from sqlalchemy.orm import Session
 
 from app.repositories.feedback_form_repository import FeedbackFormRepository
 from app.repositories.performance_cycle_repository import PerformanceCycleRepository
 from app.repositories.user_repository import UserRepository
-from app.schemas.feedback_form import FeedbackFormCreate, FeedbackFormUpdate, FeedbackFormResponse
+from app.schemas.feedback_form import FeedbackFormCreate, FeedbackFormUpdate, FeedbackFormResponse, FEEDBACK_FORM_LIST_ADAPTER
 from app.utils.exceptions import (
     FeedbackFormNotFoundException, 
     ValidationException,
@@ -41,9 +42,9 @@ class FeedbackFormService:
         form = self.repository.get_by_id(form_id)
         if not form:
             raise FeedbackFormNotFoundException(f"Feedback form with ID {form_id} not found")
-        return FeedbackFormResponse.from_orm(form)
+        return FeedbackFormResponse.model_validate(form)
     
-    def get_forms_by_reviewer(self, reviewer_id: int, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[FeedbackFormResponse]:
+    def get_forms_by_reviewer(self, reviewer_id: int, skip: int = 0, limit: int = 100, status: Optional[str] = None, employee_id: Optional[int] = None, cursor: Optional[str] = None) -> List[FeedbackFormResponse]:
         """
         Get feedback forms by reviewer ID.
         
@@ -52,14 +53,18 @@ class FeedbackFormService:
             skip: Number of records to skip
             limit: Maximum number of records to return
             status: Filter by status
+            employee_id: Filter by employee ID
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
             List[FeedbackFormResponse]: List of feedback forms
         """
-        forms = self.repository.get_by_reviewer_id(reviewer_id, skip=skip, limit=limit, status=status)
-        return [FeedbackFormResponse.from_orm(form) for form in forms]
+        forms = self.repository.get_by_reviewer_id(
+            reviewer_id, skip=skip, limit=limit, status=status, employee_id=employee_id, cursor=cursor
+        )
+        return FEEDBACK_FORM_LIST_ADAPTER.validate_python(forms, from_attributes=True)
     
-    def get_forms_by_employee(self, employee_id: int, skip: int = 0, limit: int = 100) -> List[FeedbackFormResponse]:
+    def get_forms_by_employee(self, employee_id: int, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[FeedbackFormResponse]:
         """
         Get feedback forms by employee ID.
         
@@ -67,12 +72,13 @@ class FeedbackFormService:
             employee_id: Employee user ID
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
             List[FeedbackFormResponse]: List of feedback forms
         """
-        forms = self.repository.get_by_employee_id(employee_id, skip=skip, limit=limit)
-        return [FeedbackFormResponse.from_orm(form) for form in forms]
+        forms = self.repository.get_by_employee_id(employee_id, skip=skip, limit=limit, cursor=cursor)
+        return FEEDBACK_FORM_LIST_ADAPTER.validate_python(forms, from_attributes=True)
     
     def get_assigned_employees(self, reviewer_id: int) -> List[dict]:
         """
@@ -84,17 +90,16 @@ class FeedbackFormService:
         Returns:
             List[dict]: List of assigned employees with assignment details
         """
-        assigned_employees = self.repository.get_assigned_employees(reviewer_id)
         result = []
         
-        for assignment in assigned_employees:
-            # Get employee details
-            employee = self.user_repository.get_by_id(assignment.employee_id)
+        # Forms are consumed as they stream in; only the plain dicts are kept
+        for assignment in self.repository.get_assigned_employees(reviewer_id):
+            # Employee and cycle are eager-loaded by the repository
+            employee = assignment.employee
             if not employee:
                 continue
             
-            # Get performance cycle details
-            cycle = self.cycle_repository.get_by_id(assignment.performance_cycle_id)
+            cycle = assignment.performance_cycle
             
             assignment_data = {
                 "id": assignment.id,
@@ -148,13 +153,11 @@ class FeedbackFormService:
             raise ValidationException(f"Employee {employee.name} is not active")
         
         # Check if reviewer already has a feedback form for this employee in this cycle
-        existing_forms = self.repository.get_by_reviewer_id(reviewer_id)
-        for form in existing_forms:
-            if form.employee_id == form_create.employee_id and form.performance_cycle_id == form_create.performance_cycle_id:
-                raise ValidationException("You already have a feedback form for this employee in this performance cycle")
+        if self.repository.exists_for_employee_cycle(reviewer_id, form_create.employee_id, form_create.performance_cycle_id):
+            raise ValidationException("You already have a feedback form for this employee in this performance cycle")
         
         form = self.repository.create(form_create, reviewer_id)
-        return FeedbackFormResponse.from_orm(form)
+        return FeedbackFormResponse.model_validate(form)
     
     def update_form(self, form_id: int, form_update: FeedbackFormUpdate, reviewer_id: int) -> FeedbackFormResponse:
         """
@@ -172,23 +175,18 @@ class FeedbackFormService:
             FeedbackFormNotFoundException: If feedback form not found
             ValidationException: If validation fails
         """
+        # Ownership and status are enforced by the UPDATE itself
+        updated_form = self.repository.update_draft(form_id, reviewer_id, form_update)
+        if updated_form:
+            return FeedbackFormResponse.model_validate(updated_form)
+        
+        # Nothing matched; report why
         form = self.repository.get_by_id(form_id)
         if not form:
             raise FeedbackFormNotFoundException(f"Feedback form with ID {form_id} not found")
-        
-        # Check authorization
         if form.reviewer_id != reviewer_id:
             raise ValidationException("You can only update your own feedback forms")
-        
-        # Check if form can be updated
-        if form.status == "submitted":
-            raise ValidationException("Cannot update submitted feedback forms")
-        
-        updated_form = self.repository.update(form_id, form_update)
-        if not updated_form:
-            raise FeedbackFormNotFoundException(f"Feedback form with ID {form_id} not found")
-        
-        return FeedbackFormResponse.from_orm(updated_form)
+        raise ValidationException("Cannot update submitted feedback forms")
     
     def delete_form(self, form_id: int, reviewer_id: int) -> bool:
         """
@@ -218,7 +216,7 @@ class FeedbackFormService:
         
         return self.repository.delete(form_id)
     
-    def get_all_forms(self, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[FeedbackFormResponse]:
+    def get_all_forms(self, skip: int = 0, limit: int = 100, status: Optional[str] = None, cursor: Optional[str] = None) -> List[FeedbackFormResponse]:
         """
         Get all feedback forms with optional filtering.
         
@@ -226,9 +224,23 @@ class FeedbackFormService:
             skip: Number of records to skip
             limit: Maximum number of records to return
             status: Filter by status
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
             List[FeedbackFormResponse]: List of feedback forms
         """
-        forms = self.repository.get_all(skip=skip, limit=limit, status=status)
-        return [FeedbackFormResponse.from_orm(form) for form in forms]
+        forms = self.repository.get_all(skip=skip, limit=limit, status=status, cursor=cursor)
+        return FEEDBACK_FORM_LIST_ADAPTER.validate_python(forms, from_attributes=True)
+    
+    def export_forms(self, status: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Export all feedback forms as newline-delimited JSON.
+        
+        Args:
+            status: Filter by status
+            
+        Yields:
+            bytes: One JSON-encoded feedback form per line
+        """
+        for form in self.repository.iter_all(status=status):
+            yield orjson.dumps(FeedbackFormResponse.model_validate(form).model_dump()) + b"\n"
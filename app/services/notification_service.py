@@ -5,11 +5,18 @@ Notification service for business logic operations.
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_delete, cache_get, cache_set
+from app.core.config import settings
 from app.repositories.notification_repository import NotificationRepository
-from app.schemas.notification import NotificationCreate, NotificationUpdate, NotificationResponse
+from app.schemas.notification import NotificationCreate, NotificationUpdate, NotificationResponse, NOTIFICATION_LIST_ADAPTER
 from app.utils.exceptions import NotificationNotFoundException, ValidationException
 
 
+def unread_count_cache_key(user_id: int) -> str:
+    """Build the Redis key holding a user's unread notification count."""
+    return f"notifications:unread:{user_id}"
+
+
 class NotificationService:
     """Service for notification business logic operations."""
     
@@ -32,9 +39,9 @@ class NotificationService:
         notification = self.repository.get_by_id(notification_id)
         if not notification:
             raise NotificationNotFoundException(f"Notification with ID {notification_id} not found")
-        return NotificationResponse.from_orm(notification)
+        return NotificationResponse.model_validate(notification)
     
-    def get_user_notifications(self, user_id: int, skip: int = 0, limit: int = 100, unread_only: bool = False) -> List[NotificationResponse]:
+    def get_user_notifications(self, user_id: int, skip: int = 0, limit: int = 100, unread_only: bool = False, cursor: Optional[str] = None) -> List[NotificationResponse]:
         """
         Get notifications for a user.
         
@@ -43,12 +50,15 @@ class NotificationService:
             skip: Number of records to skip
             limit: Maximum number of records to return
             unread_only: Filter to unread notifications only
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
             List[NotificationResponse]: List of notifications
         """
-        notifications = self.repository.get_by_user_id(user_id, skip=skip, limit=limit, unread_only=unread_only)
-        return [NotificationResponse.from_orm(notification) for notification in notifications]
+        notifications = self.repository.get_by_user_id(
+            user_id, skip=skip, limit=limit, unread_only=unread_only, cursor=cursor
+        )
+        return NOTIFICATION_LIST_ADAPTER.validate_python(notifications, from_attributes=True)
     
     def create_notification(self, notification_create: NotificationCreate, user_id: int) -> NotificationResponse:
         """
@@ -62,7 +72,8 @@ class NotificationService:
             NotificationResponse: Created notification data
         """
         notification = self.repository.create(notification_create, user_id)
-        return NotificationResponse.from_orm(notification)
+        cache_delete(unread_count_cache_key(user_id))
+        return NotificationResponse.model_validate(notification)
     
     def update_notification(self, notification_id: int, notification_update: NotificationUpdate) -> NotificationResponse:
         """
@@ -81,25 +92,28 @@ class NotificationService:
         notification = self.repository.update(notification_id, notification_update)
         if not notification:
             raise NotificationNotFoundException(f"Notification with ID {notification_id} not found")
-        return NotificationResponse.from_orm(notification)
+        cache_delete(unread_count_cache_key(notification.user_id))
+        return NotificationResponse.model_validate(notification)
     
-    def mark_as_read(self, notification_id: int) -> NotificationResponse:
+    def mark_as_read(self, notification_id: int, user_id: int) -> NotificationResponse:
         """
-        Mark notification as read.
+        Mark a user's notification as read.
         
         Args:
             notification_id: Notification ID
+            user_id: ID of the user the notification must belong to
             
         Returns:
             NotificationResponse: Updated notification data
             
         Raises:
-            NotificationNotFoundException: If notification not found
+            NotificationNotFoundException: If notification not found or owned by another user
         """
-        notification = self.repository.mark_as_read(notification_id)
+        notification = self.repository.mark_as_read(notification_id, user_id)
         if not notification:
             raise NotificationNotFoundException(f"Notification with ID {notification_id} not found")
-        return NotificationResponse.from_orm(notification)
+        cache_delete(unread_count_cache_key(user_id))
+        return NotificationResponse.model_validate(notification)
     
     def mark_all_as_read(self, user_id: int) -> int:
         """
@@ -111,7 +125,24 @@ class NotificationService:
         Returns:
             int: Number of notifications marked as read
         """
-        return self.repository.mark_all_as_read(user_id)
+        count = self.repository.mark_all_as_read(user_id)
+        cache_delete(unread_count_cache_key(user_id))
+        return count
+    
+    def mark_many_as_read(self, user_id: int, notification_ids: List[int]) -> int:
+        """
+        Mark several of a user's notifications as read.
+        
+        Args:
+            user_id: User ID
+            notification_ids: Notification IDs
+            
+        Returns:
+            int: Number of notifications marked as read
+        """
+        count = self.repository.mark_many_as_read(notification_ids, user_id)
+        cache_delete(unread_count_cache_key(user_id))
+        return count
     
     def delete_notification(self, notification_id: int) -> bool:
         """
@@ -123,30 +154,62 @@ class NotificationService:
         Returns:
             bool: True if notification was deleted, False if not found
         """
-        return self.repository.delete(notification_id)
+        user_id = self.repository.delete(notification_id)
+        if user_id is None:
+            return False
+        cache_delete(unread_count_cache_key(user_id))
+        return True
     
     def get_unread_count(self, user_id: int) -> int:
         """
         Get count of unread notifications for a user.
         
+        The count is cached briefly in Redis and dropped whenever the user's
+        notifications change.
+        
         Args:
             user_id: User ID
             
         Returns:
             int: Count of unread notifications
         """
-        return self.repository.get_unread_count(user_id)
+        cached = cache_get(unread_count_cache_key(user_id))
+        if cached is not None:
+            return int(cached)
+        
+        count = self.repository.get_unread_count(user_id)
+        cache_set(unread_count_cache_key(user_id), str(count), settings.UNREAD_COUNT_CACHE_TTL_SECONDS)
+        return count
+    
+    def has_unread(self, user_id: int) -> bool:
+        """
+        Check whether a user has any unread notification.
+        
+        A cached unread count answers this directly; otherwise the database
+        is asked for existence only.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            bool: True if at least one notification is unread
+        """
+        cached = cache_get(unread_count_cache_key(user_id))
+        if cached is not None:
+            return int(cached) > 0
+        return self.repository.has_unread(user_id)
     
-    def get_all_notifications(self, skip: int = 0, limit: int = 100) -> List[NotificationResponse]:
+    def get_all_notifications(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[NotificationResponse]:
         """
         Get all notifications (admin only).
         
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            cursor: Keyset cursor of the last row of the previous page
             
         Returns:
             List[NotificationResponse]: List of notifications
         """
-        notifications = self.repository.get_all(skip=skip, limit=limit)
-        return [NotificationResponse.from_orm(notification) for notification in notifications]
+        notifications = self.repository.get_all(skip=skip, limit=limit, cursor=cursor)
+        return NOTIFICATION_LIST_ADAPTER.validate_python(notifications, from_attributes=True)
@@ -2,13 +2,37 @@
 Performance Cycle service for business logic operations.
 """
 
+import threading
 from typing import List, Optional
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_delete, cache_get, cache_set
+from app.core.config import settings
 from app.repositories.performance_cycle_repository import PerformanceCycleRepository
-from app.schemas.performance_cycle import PerformanceCycleCreate, PerformanceCycleUpdate, PerformanceCycleResponse
+from app.schemas.performance_cycle import PerformanceCycleCreate, PerformanceCycleUpdate, PerformanceCycleResponse, PERFORMANCE_CYCLE_LIST_ADAPTER
 from app.utils.exceptions import PerformanceCycleNotFoundException, ValidationException
 
+# The active cycle changes rarely but is polled by every client. Each worker
+# keeps a short-lived local copy, and Redis shares the value across workers so
+# only one of them hits the database per Redis TTL.
+_ACTIVE_CYCLE_KEY = "active"
+ACTIVE_CYCLE_REDIS_KEY = "cycle:active"
+_active_cycle_cache: TTLCache = TTLCache(maxsize=1, ttl=settings.ACTIVE_CYCLE_CACHE_TTL_SECONDS)
+_active_cycle_lock = threading.Lock()
+
+
+def cycle_cache_key(cycle_id: int) -> str:
+    """Build the Redis key holding a performance cycle's cached response data."""
+    return f"cycle:{cycle_id}"
+
+
+def invalidate_active_cycle_cache() -> None:
+    """Drop the cached active performance cycle."""
+    with _active_cycle_lock:
+        _active_cycle_cache.pop(_ACTIVE_CYCLE_KEY, None)
+    cache_delete(ACTIVE_CYCLE_REDIS_KEY)
+
 
 class PerformanceCycleService:
     """Service for performance cycle business logic operations."""
@@ -23,15 +47,35 @@ class PerformanceCycleService:
         Returns:
             Optional[PerformanceCycleResponse]: Active performance cycle if found, None otherwise
         """
-        cycle = self.repository.get_active_cycle()
-        if not cycle:
-            return None
-        return PerformanceCycleResponse.from_orm(cycle)
+        with _active_cycle_lock:
+            if _ACTIVE_CYCLE_KEY in _active_cycle_cache:
+                return _active_cycle_cache[_ACTIVE_CYCLE_KEY]
+        
+        cached = cache_get(ACTIVE_CYCLE_REDIS_KEY)
+        if cached is not None:
+            active_cycle = PerformanceCycleResponse.model_validate_json(cached)
+        else:
+            cycle = self.repository.get_active_cycle()
+            active_cycle = PerformanceCycleResponse.model_validate(cycle) if cycle else None
+            if active_cycle is not None:
+                cache_set(
+                    ACTIVE_CYCLE_REDIS_KEY,
+                    active_cycle.model_dump_json(),
+                    settings.ACTIVE_CYCLE_REDIS_TTL_SECONDS,
+                )
+        
+        with _active_cycle_lock:
+            _active_cycle_cache[_ACTIVE_CYCLE_KEY] = active_cycle
+        return active_cycle
     
     def get_cycle_by_id(self, cycle_id: int) -> PerformanceCycleResponse:
         """
         Get performance cycle by ID.
         
+        Only cycles that are not active are cached in Redis: activating a cycle
+        deactivates the others with one UPDATE that does not report which rows
+        it touched, so an active cycle's cached copy could not be invalidated.
+        
         Args:
             cycle_id: Performance cycle ID
             
@@ -41,10 +85,17 @@ class PerformanceCycleService:
         Raises:
             PerformanceCycleNotFoundException: If performance cycle not found
         """
+        cached = cache_get(cycle_cache_key(cycle_id))
+        if cached is not None:
+            return PerformanceCycleResponse.model_validate_json(cached)
+        
         cycle = self.repository.get_by_id(cycle_id)
         if not cycle:
             raise PerformanceCycleNotFoundException(f"Performance cycle with ID {cycle_id} not found")
-        return PerformanceCycleResponse.from_orm(cycle)
+        cycle_response = PerformanceCycleResponse.model_validate(cycle)
+        if cycle_response.status != "active":
+            cache_set(cycle_cache_key(cycle_id), cycle_response.model_dump_json(), settings.CYCLE_CACHE_TTL_SECONDS)
+        return cycle_response
     
     def get_all_cycles(self, skip: int = 0, limit: int = 100, status: Optional[str] = None) -> List[PerformanceCycleResponse]:
         """
@@ -59,7 +110,7 @@ class PerformanceCycleService:
             List[PerformanceCycleResponse]: List of performance cycles
         """
         cycles = self.repository.get_all(skip=skip, limit=limit, status=status)
-        return [PerformanceCycleResponse.from_orm(cycle) for cycle in cycles]
+        return PERFORMANCE_CYCLE_LIST_ADAPTER.validate_python(cycles, from_attributes=True)
     
     def create_cycle(self, cycle_create: PerformanceCycleCreate) -> PerformanceCycleResponse:
         """
@@ -78,15 +129,14 @@ class PerformanceCycleService:
         if cycle_create.start_date >= cycle_create.end_date:
             raise ValidationException("Start date must be before end date")
         
-        # If creating an active cycle, deactivate other active cycles
+        # If creating an active cycle, deactivate other active cycles in the
+        # same transaction as the insert
         if cycle_create.status == "active":
-            active_cycle = self.repository.get_active_cycle()
-            if active_cycle:
-                # Deactivate the current active cycle
-                self.repository.update(active_cycle.id, PerformanceCycleUpdate(status="inactive"))
+            self.repository.deactivate_active()
         
         cycle = self.repository.create(cycle_create)
-        return PerformanceCycleResponse.from_orm(cycle)
+        invalidate_active_cycle_cache()
+        return PerformanceCycleResponse.model_validate(cycle)
     
     def update_cycle(self, cycle_id: int, cycle_update: PerformanceCycleUpdate) -> PerformanceCycleResponse:
         """
@@ -108,18 +158,18 @@ class PerformanceCycleService:
             if cycle_update.start_date >= cycle_update.end_date:
                 raise ValidationException("Start date must be before end date")
         
+        # If updating to active status, deactivate other active cycles; the
+        # update commits both, or rolls both back if the cycle does not exist
+        if cycle_update.status == "active":
+            self.repository.deactivate_active(exclude_id=cycle_id)
+        
         cycle = self.repository.update(cycle_id, cycle_update)
         if not cycle:
             raise PerformanceCycleNotFoundException(f"Performance cycle with ID {cycle_id} not found")
         
-        # If updating to active status, deactivate other active cycles
-        if cycle_update.status == "active":
-            active_cycle = self.repository.get_active_cycle()
-            if active_cycle and active_cycle.id != cycle_id:
-                # Deactivate the current active cycle
-                self.repository.update(active_cycle.id, PerformanceCycleUpdate(status="inactive"))
-        
-        return PerformanceCycleResponse.from_orm(cycle)
+        cache_delete(cycle_cache_key(cycle_id))
+        invalidate_active_cycle_cache()
+        return PerformanceCycleResponse.model_validate(cycle)
     
     def delete_cycle(self, cycle_id: int) -> bool:
         """
@@ -131,4 +181,8 @@ class PerformanceCycleService:
         Returns:
             bool: True if performance cycle was deleted, False if not found
         """
-        return self.repository.delete(cycle_id)
+        deleted = self.repository.delete(cycle_id)
+        if deleted:
+            cache_delete(cycle_cache_key(cycle_id))
+            invalidate_active_cycle_cache()
+        return deleted
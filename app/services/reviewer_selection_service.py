@@ -5,6 +5,8 @@ Reviewer Selection service for business logic operations.
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
+from app.core.roles import REVIEWER_ROLES
+from app.models.reviewer_selection import ReviewerSelection
 from app.repositories.reviewer_selection_repository import ReviewerSelectionRepository
 from app.repositories.performance_cycle_repository import PerformanceCycleRepository
 from app.repositories.user_repository import UserRepository
@@ -47,14 +49,8 @@ class ReviewerSelectionService:
         if not selection:
             return None
         
-        # Get selected reviewers
-        selected_reviewers = self.repository.get_selected_reviewers(selection.id)
-        reviewer_responses = [UserResponse.from_orm(reviewer) for reviewer in selected_reviewers]
-        
-        # Create response with selected reviewers
-        response_data = ReviewerSelectionResponse.from_orm(selection)
-        response_data.selected_reviewers = reviewer_responses
-        return response_data
+        # selected_reviewers is read through the model relationship
+        return ReviewerSelectionResponse.model_validate(selection)
     
     def create_selection(self, selection_create: ReviewerSelectionCreate, mentee_id: int) -> ReviewerSelectionResponse:
         """
@@ -81,30 +77,15 @@ class ReviewerSelectionService:
             raise ValidationException("Can only submit reviewer selections for active performance cycles")
         
         # Validate all reviewers exist and are available
-        for reviewer_id in selection_create.selected_reviewers:
-            reviewer = self.user_repository.get_by_id(reviewer_id)
-            if not reviewer:
-                raise UserNotFoundException(f"Reviewer with ID {reviewer_id} not found")
-            if not reviewer.is_active:
-                raise ValidationException(f"Reviewer {reviewer.name} is not active")
-            if reviewer.role not in ["Mentor", "People Committee"]:
-                raise ValidationException(f"User {reviewer.name} is not eligible as a reviewer")
-        
-        # Check if user already has a selection for this cycle
-        existing_selection = self.repository.get_by_mentee_id(mentee_id, selection_create.performance_cycle_id)
-        if existing_selection:
-            raise ValidationException("You already have a reviewer selection for this performance cycle")
+        self._validate_reviewers(selection_create.selected_reviewers)
         
+        # A duplicate for this cycle is rejected by the database's unique index
         selection = self.repository.create(selection_create, mentee_id)
+        if not selection:
+            raise ValidationException("You already have a reviewer selection for this performance cycle")
         
-        # Get selected reviewers for response
-        selected_reviewers = self.repository.get_selected_reviewers(selection.id)
-        reviewer_responses = [UserResponse.from_orm(reviewer) for reviewer in selected_reviewers]
-        
-        # Create response with selected reviewers
-        response_data = ReviewerSelectionResponse.from_orm(selection)
-        response_data.selected_reviewers = reviewer_responses
-        return response_data
+        # selected_reviewers is read through the model relationship
+        return ReviewerSelectionResponse.model_validate(selection)
     
     def update_selection(self, selection_id: int, selection_update: ReviewerSelectionUpdate, mentee_id: int) -> ReviewerSelectionResponse:
         """
@@ -123,41 +104,47 @@ class ReviewerSelectionService:
             ValidationException: If validation fails
             UserNotFoundException: If any reviewer not found
         """
-        selection = self.repository.get_by_id(selection_id)
-        if not selection:
-            raise ReviewerSelectionNotFoundException(f"Reviewer selection with ID {selection_id} not found")
-        
-        # Check authorization
-        if selection.mentee_id != mentee_id:
-            raise ValidationException("You can only update your own reviewer selection")
-        
-        # Check if selection can be updated
-        if selection.status != "pending" and selection.status != "sent_back":
-            raise ValidationException("Can only update pending or sent back selections")
-        
         # Validate reviewers if provided
         if selection_update.selected_reviewers:
-            for reviewer_id in selection_update.selected_reviewers:
-                reviewer = self.user_repository.get_by_id(reviewer_id)
-                if not reviewer:
-                    raise UserNotFoundException(f"Reviewer with ID {reviewer_id} not found")
-                if not reviewer.is_active:
-                    raise ValidationException(f"Reviewer {reviewer.name} is not active")
-                if reviewer.role not in ["Mentor", "People Committee"]:
-                    raise ValidationException(f"User {reviewer.name} is not eligible as a reviewer")
+            self._validate_reviewers(selection_update.selected_reviewers)
         
-        updated_selection = self.repository.update(selection_id, selection_update)
+        # Ownership and status are checked by the UPDATE; the selection is
+        # only read to explain a miss
+        updated_selection = self.repository.update(selection_id, selection_update, mentee_id)
         if not updated_selection:
-            raise ReviewerSelectionNotFoundException(f"Reviewer selection with ID {selection_id} not found")
+            selection = self.repository.get_state(selection_id)
+            if not selection:
+                raise ReviewerSelectionNotFoundException(f"Reviewer selection with ID {selection_id} not found")
+            if selection.mentee_id != mentee_id:
+                raise ValidationException("You can only update your own reviewer selection")
+            raise ValidationException("Can only update pending or sent back selections")
+        
+        # selected_reviewers is read through the model relationship
+        return ReviewerSelectionResponse.model_validate(updated_selection)
+    
+    def _validate_reviewers(self, reviewer_ids: List[int]) -> None:
+        """
+        Check that every selected reviewer exists, is active and may review.
         
-        # Get selected reviewers for response
-        selected_reviewers = self.repository.get_selected_reviewers(updated_selection.id)
-        reviewer_responses = [UserResponse.from_orm(reviewer) for reviewer in selected_reviewers]
+        All reviewers are fetched in one query; errors are reported for the
+        first offending ID in the submitted order.
         
-        # Create response with selected reviewers
-        response_data = ReviewerSelectionResponse.from_orm(updated_selection)
-        response_data.selected_reviewers = reviewer_responses
-        return response_data
+        Args:
+            reviewer_ids: Selected reviewer user IDs
+            
+        Raises:
+            UserNotFoundException: If a reviewer is not found
+            ValidationException: If a reviewer is inactive or not eligible
+        """
+        reviewers = self.user_repository.get_many_by_ids(reviewer_ids)
+        for reviewer_id in reviewer_ids:
+            reviewer = reviewers.get(reviewer_id)
+            if not reviewer:
+                raise UserNotFoundException(f"Reviewer with ID {reviewer_id} not found")
+            if not reviewer.is_active:
+                raise ValidationException(f"Reviewer {reviewer.name} is not active")
+            if reviewer.role not in REVIEWER_ROLES:
+                raise ValidationException(f"User {reviewer.name} is not eligible as a reviewer")
     
     def get_pending_approvals(self, mentor_id: int) -> List[dict]:
         """
@@ -170,35 +157,51 @@ class ReviewerSelectionService:
             List[dict]: List of pending approvals with details
         """
         pending_selections = self.repository.get_pending_approvals(mentor_id)
-        approvals = []
+        return [
+            self._approval_data(selection)
+            for selection in pending_selections
+            if selection.mentee
+        ]
+    
+    def get_approval_by_id(self, selection_id: int, mentor_id: int) -> Optional[dict]:
+        """
+        Get a single pending approval for a mentor.
         
-        for selection in pending_selections:
-            # Get mentee details
-            mentee = self.user_repository.get_by_id(selection.mentee_id)
-            if not mentee:
-                continue
-            
-            # Get selected reviewers
-            selected_reviewers = self.repository.get_selected_reviewers(selection.id)
-            reviewer_responses = [UserResponse.from_orm(reviewer) for reviewer in selected_reviewers]
-            
-            # Get performance cycle details
-            cycle = self.cycle_repository.get_by_id(selection.performance_cycle_id)
+        Args:
+            selection_id: Reviewer selection ID
+            mentor_id: Mentor user ID
             
-            approval_data = {
-                "id": selection.id,
-                "mentee": UserResponse.from_orm(mentee),
-                "selected_reviewers": reviewer_responses,
-                "status": selection.status,
-                "submitted_at": selection.submitted_at,
-                "performance_cycle": {
-                    "id": cycle.id,
-                    "name": cycle.name
-                } if cycle else None
-            }
-            approvals.append(approval_data)
+        Returns:
+            Optional[dict]: Approval details if found, None otherwise
+        """
+        selection = self.repository.get_pending_approval(selection_id, mentor_id)
+        if not selection or not selection.mentee:
+            return None
+        return self._approval_data(selection)
+    
+    @staticmethod
+    def _approval_data(selection: ReviewerSelection) -> dict:
+        """
+        Build the approval view of an eager-loaded reviewer selection.
         
-        return approvals
+        Args:
+            selection: Reviewer selection with mentee, cycle and reviewers loaded
+            
+        Returns:
+            dict: Approval details
+        """
+        cycle = selection.performance_cycle
+        return {
+            "id": selection.id,
+            "mentee": UserResponse.model_validate(selection.mentee),
+            "selected_reviewers": [UserResponse.model_validate(reviewer) for reviewer in selection.selected_reviewers],
+            "status": selection.status,
+            "submitted_at": selection.submitted_at,
+            "performance_cycle": {
+                "id": cycle.id,
+                "name": cycle.name
+            } if cycle else None
+        }
     
     def approve_selection(self, selection_id: int, approval_request: MentorApprovalRequest) -> ReviewerSelectionResponse:
         """
@@ -215,25 +218,12 @@ class ReviewerSelectionService:
             ReviewerSelectionNotFoundException: If reviewer selection not found
             ValidationException: If validation fails
         """
-        selection = self.repository.get_by_id(selection_id)
-        if not selection:
-            raise ReviewerSelectionNotFoundException(f"Reviewer selection with ID {selection_id} not found")
-        
-        if selection.status != "pending":
-            raise ValidationException("Can only approve pending selections")
-        
         approved_selection = self.repository.approve(selection_id, approval_request.comments)
         if not approved_selection:
-            raise ReviewerSelectionNotFoundException(f"Reviewer selection with ID {selection_id} not found")
-        
-        # Get selected reviewers for response
-        selected_reviewers = self.repository.get_selected_reviewers(approved_selection.id)
-        reviewer_responses = [UserResponse.from_orm(reviewer) for reviewer in selected_reviewers]
+            self._raise_not_pending(selection_id, "Can only approve pending selections")
         
-        # Create response with selected reviewers
-        response_data = ReviewerSelectionResponse.from_orm(approved_selection)
-        response_data.selected_reviewers = reviewer_responses
-        return response_data
+        # selected_reviewers is read through the model relationship
+        return ReviewerSelectionResponse.model_validate(approved_selection)
     
     def send_back_selection(self, selection_id: int, send_back_request: MentorSendBackRequest) -> ReviewerSelectionResponse:
         """
@@ -250,25 +240,28 @@ class ReviewerSelectionService:
             ReviewerSelectionNotFoundException: If reviewer selection not found
             ValidationException: If validation fails
         """
-        selection = self.repository.get_by_id(selection_id)
-        if not selection:
-            raise ReviewerSelectionNotFoundException(f"Reviewer selection with ID {selection_id} not found")
-        
-        if selection.status != "pending":
-            raise ValidationException("Can only send back pending selections")
-        
         sent_back_selection = self.repository.send_back(selection_id, send_back_request.feedback)
         if not sent_back_selection:
-            raise ReviewerSelectionNotFoundException(f"Reviewer selection with ID {selection_id} not found")
+            self._raise_not_pending(selection_id, "Can only send back pending selections")
         
-        # Get selected reviewers for response
-        selected_reviewers = self.repository.get_selected_reviewers(sent_back_selection.id)
-        reviewer_responses = [UserResponse.from_orm(reviewer) for reviewer in selected_reviewers]
+        # selected_reviewers is read through the model relationship
+        return ReviewerSelectionResponse.model_validate(sent_back_selection)
+    
+    def _raise_not_pending(self, selection_id: int, message: str) -> None:
+        """
+        Explain why a pending-only transition matched no selection.
         
-        # Create response with selected reviewers
-        response_data = ReviewerSelectionResponse.from_orm(sent_back_selection)
-        response_data.selected_reviewers = reviewer_responses
-        return response_data
+        Args:
+            selection_id: Reviewer selection ID
+            message: Error message for a selection that exists but is not pending
+            
+        Raises:
+            ReviewerSelectionNotFoundException: If reviewer selection not found
+            ValidationException: If the selection is not pending
+        """
+        if not self.repository.get_state(selection_id):
+            raise ReviewerSelectionNotFoundException(f"Reviewer selection with ID {selection_id} not found")
+        raise ValidationException(message)
     
     def delete_selection(self, selection_id: int, mentee_id: int) -> bool:
         """
@@ -284,16 +277,12 @@ class ReviewerSelectionService:
         Raises:
             ValidationException: If user is not authorized to delete the selection
         """
-        selection = self.repository.get_by_id(selection_id)
+        if self.repository.delete(selection_id, mentee_id):
+            return True
+        
+        selection = self.repository.get_state(selection_id)
         if not selection:
             return False
-        
-        # Check authorization
         if selection.mentee_id != mentee_id:
             raise ValidationException("You can only delete your own reviewer selection")
-        
-        # Check if selection can be deleted
-        if selection.status != "pending":
-            raise ValidationException("Can only delete pending selections")
-        
-        return self.repository.delete(selection_id)
+        raise ValidationException("Can only delete pending selections")
@@ -3,12 +3,28 @@ User service for business logic operations.
 """
 
 from typing import List, Optional
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core.cache import cache_delete, cache_get, cache_set, get_redis
+from app.core.config import settings
+from app.core.roles import ALL_ROLES, EMPLOYEE, HR_LEAD, MENTOR, PEOPLE_COMMITTEE, SYSTEM_ADMINISTRATOR
 from app.repositories.user_repository import UserRepository
-from app.schemas.user import UserCreate, UserUpdate, UserResponse
+from app.schemas.user import UserCreate, UserUpdate, UserResponse, USER_LIST_ADAPTER
 from app.utils.exceptions import UserNotFoundException, UserAlreadyExistsException, ValidationException
 
+# Redis key holding the full pool of active reviewers
+AVAILABLE_REVIEWERS_CACHE_KEY = "reviewers:available"
+
+_INVALID_ROLE_MESSAGE = "Invalid role. Must be one of: " + ", ".join(
+    (EMPLOYEE, MENTOR, HR_LEAD, SYSTEM_ADMINISTRATOR, PEOPLE_COMMITTEE)
+)
+
+
+def user_cache_key(user_id: int) -> str:
+    """Build the Redis key holding a user's cached response data."""
+    return f"user:{user_id}"
+
 
 class UserService:
     """Service for user business logic operations."""
@@ -20,6 +36,9 @@ class UserService:
         """
         Get user by ID.
         
+        The user is served from Redis when cached, which spares the per-request
+        lookup done by authentication across all workers.
+        
         Args:
             user_id: User ID
             
@@ -29,10 +48,16 @@ class UserService:
         Raises:
             UserNotFoundException: If user not found
         """
+        cached = cache_get(user_cache_key(user_id))
+        if cached is not None:
+            return UserResponse.model_validate_json(cached)
+        
         user = self.repository.get_by_id(user_id)
         if not user:
             raise UserNotFoundException(f"User with ID {user_id} not found")
-        return UserResponse.from_orm(user)
+        user_response = UserResponse.model_validate(user)
+        cache_set(user_cache_key(user_id), user_response.model_dump_json(), settings.USER_CACHE_TTL_SECONDS)
+        return user_response
     
     def get_user_by_email(self, email: str) -> UserResponse:
         """
@@ -50,7 +75,7 @@ class UserService:
         user = self.repository.get_by_email(email)
         if not user:
             raise UserNotFoundException(f"User with email {email} not found")
-        return UserResponse.from_orm(user)
+        return UserResponse.model_validate(user)
     
     def get_users(self, skip: int = 0, limit: int = 100, role: Optional[str] = None, department: Optional[str] = None) -> List[UserResponse]:
         """
@@ -65,13 +90,18 @@ class UserService:
         Returns:
             List[UserResponse]: List of users
         """
-        users = self.repository.get_all(skip=skip, limit=limit, role=role, department=department)
-        return [UserResponse.from_orm(user) for user in users]
+        rows = self.repository.get_all(skip=skip, limit=limit, role=role, department=department)
+        # Rows come straight from the users table, so validation can be skipped
+        return [UserResponse.model_construct(**row._mapping) for row in rows]
     
     def get_available_reviewers(self, exclude_user_id: Optional[int] = None, department: Optional[str] = None) -> List[UserResponse]:
         """
         Get available reviewers (Mentors and People Committee members).
         
+        With Redis enabled, the whole reviewer pool is cached and filtered in
+        memory, so every caller shares one cache entry regardless of its
+        filters. Without Redis, the filters are applied in SQL.
+        
         Args:
             exclude_user_id: User ID to exclude from results
             department: Filter by department
@@ -79,8 +109,28 @@ class UserService:
         Returns:
             List[UserResponse]: List of available reviewers
         """
-        reviewers = self.repository.get_available_reviewers(exclude_user_id=exclude_user_id, department=department)
-        return [UserResponse.from_orm(reviewer) for reviewer in reviewers]
+        if get_redis() is None:
+            return USER_LIST_ADAPTER.validate_python(
+                self.repository.get_available_reviewers(exclude_user_id, department), from_attributes=True
+            )
+        
+        cached = cache_get(AVAILABLE_REVIEWERS_CACHE_KEY)
+        if cached is not None:
+            reviewers = USER_LIST_ADAPTER.validate_json(cached)
+        else:
+            # The adapter consumes the streamed rows directly; no intermediate row list
+            reviewers = USER_LIST_ADAPTER.validate_python(self.repository.get_available_reviewers(), from_attributes=True)
+            cache_set(
+                AVAILABLE_REVIEWERS_CACHE_KEY,
+                USER_LIST_ADAPTER.dump_json(reviewers),
+                settings.REVIEWER_POOL_CACHE_TTL_SECONDS
+            )
+        
+        return [
+            reviewer for reviewer in reviewers
+            if (not exclude_user_id or reviewer.id != exclude_user_id)
+            and (not department or reviewer.department == department)
+        ]
     
     def create_user(self, user_create: UserCreate) -> UserResponse:
         """
@@ -96,22 +146,21 @@ class UserService:
             UserAlreadyExistsException: If user with same email already exists
             ValidationException: If validation fails
         """
-        # Check if user with same email already exists
-        existing_user = self.repository.get_by_email(user_create.email)
-        if existing_user:
-            raise UserAlreadyExistsException(f"User with email {user_create.email} already exists")
-        
         # Validate password strength
         if len(user_create.password) < 8:
             raise ValidationException("Password must be at least 8 characters long")
         
         # Validate role
-        valid_roles = ["Employee", "Mentor", "HR Lead", "System Administrator", "People Committee"]
-        if user_create.role not in valid_roles:
-            raise ValidationException(f"Invalid role. Must be one of: {', '.join(valid_roles)}")
+        if user_create.role not in ALL_ROLES:
+            raise ValidationException(_INVALID_ROLE_MESSAGE)
         
-        user = self.repository.create(user_create)
-        return UserResponse.from_orm(user)
+        # A duplicate email is rejected by the unique constraint on users.email
+        try:
+            user = self.repository.create(user_create)
+        except IntegrityError:
+            raise UserAlreadyExistsException(f"User with email {user_create.email} already exists")
+        cache_delete(AVAILABLE_REVIEWERS_CACHE_KEY)
+        return UserResponse.model_validate(user)
     
     def update_user(self, user_id: int, user_update: UserUpdate) -> UserResponse:
         """
@@ -128,27 +177,21 @@ class UserService:
             UserNotFoundException: If user not found
             UserAlreadyExistsException: If user with same email already exists
         """
-        user = self.repository.get_by_id(user_id)
-        if not user:
-            raise UserNotFoundException(f"User with ID {user_id} not found")
-        
-        # Check if email is being updated and if it already exists
-        if user_update.email and user_update.email != user.email:
-            existing_user = self.repository.get_by_email(user_update.email)
-            if existing_user:
-                raise UserAlreadyExistsException(f"User with email {user_update.email} already exists")
-        
         # Validate role if being updated
         if user_update.role:
-            valid_roles = ["Employee", "Mentor", "HR Lead", "System Administrator", "People Committee"]
-            if user_update.role not in valid_roles:
-                raise ValidationException(f"Invalid role. Must be one of: {', '.join(valid_roles)}")
+            if user_update.role not in ALL_ROLES:
+                raise ValidationException(_INVALID_ROLE_MESSAGE)
         
-        updated_user = self.repository.update(user_id, user_update)
+        # Existence and email uniqueness are both settled by the UPDATE itself
+        try:
+            updated_user = self.repository.update(user_id, user_update)
+        except IntegrityError:
+            raise UserAlreadyExistsException(f"User with email {user_update.email} already exists")
         if not updated_user:
             raise UserNotFoundException(f"User with ID {user_id} not found")
         
-        return UserResponse.from_orm(updated_user)
+        cache_delete(user_cache_key(user_id), AVAILABLE_REVIEWERS_CACHE_KEY)
+        return UserResponse.model_validate(updated_user)
     
     def delete_user(self, user_id: int) -> bool:
         """
@@ -160,7 +203,10 @@ class UserService:
         Returns:
             bool: True if user was deleted, False if not found
         """
-        return self.repository.delete(user_id)
+        deleted = self.repository.delete(user_id)
+        if deleted:
+            cache_delete(user_cache_key(user_id), AVAILABLE_REVIEWERS_CACHE_KEY)
+        return deleted
     
     def authenticate_user(self, email: str, password: str) -> Optional[UserResponse]:
         """
@@ -176,4 +222,4 @@ class UserService:
         user = self.repository.authenticate(email, password)
         if not user:
             return None
-        return UserResponse.from_orm(user)
+        return UserResponse.model_validate(user)
@@ -2,20 +2,36 @@
 Custom exception classes for the application.
 """
 
+from typing import Optional, Tuple
+
 from fastapi import HTTPException, status
 
+# Message templates, one per identifier argument in signature order
+_USER_NOT_FOUND_TEMPLATES: Tuple[str, ...] = (
+    "User with ID {} not found",
+    "User with email {} not found",
+    "User with username {} not found",
+)
+_USER_EXISTS_TEMPLATES: Tuple[str, ...] = (
+    "User with email {} already exists",
+    "User with username {} already exists",
+)
+
+
+def _format_detail(templates: Tuple[str, ...], values: tuple, default: str) -> str:
+    """Format the template of the first identifier that was given."""
+    for value, template in zip(values, templates):
+        if value:
+            return template.format(value)
+    return default
+
 
 class UserNotFoundException(HTTPException):
     """Exception raised when user is not found."""
     
-    def __init__(self, user_id: int = None, email: str = None, username: str = None):
-        detail = "User not found"
-        if user_id:
-            detail = f"User with ID {user_id} not found"
-        elif email:
-            detail = f"User with email {email} not found"
-        elif username:
-            detail = f"User with username {username} not found"
+    def __init__(self, detail: Optional[str] = None, user_id: int = None, email: str = None, username: str = None):
+        if detail is None:
+            detail = _format_detail(_USER_NOT_FOUND_TEMPLATES, (user_id, email, username), "User not found")
         
         super().__init__(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -26,12 +42,9 @@ class UserNotFoundException(HTTPException):
 class UserAlreadyExistsException(HTTPException):
     """Exception raised when user already exists."""
     
-    def __init__(self, email: str = None, username: str = None):
-        detail = "User already exists"
-        if email:
-            detail = f"User with email {email} already exists"
-        elif username:
-            detail = f"User with username {username} already exists"
+    def __init__(self, detail: Optional[str] = None, email: str = None, username: str = None):
+        if detail is None:
+            detail = _format_detail(_USER_EXISTS_TEMPLATES, (email, username), "User already exists")
         
         super().__init__(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,102 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor encodes the ``(created_at, id)`` pair of the last row of a page.
+The next page is selected with a range predicate on an index over those
+columns instead of OFFSET, so the cost of a page does not grow with its
+depth.
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from app.utils.exceptions import ValidationException
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode the position of a row as an opaque cursor.
+    
+    Args:
+        created_at: Creation timestamp of the row
+        row_id: Primary key of the row
+    
+    Returns:
+        str: URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string
+    
+    Returns:
+        Tuple[datetime, int]: Creation timestamp and primary key
+    
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except ValueError:
+        raise ValidationException("Invalid pagination cursor")
+
+
+def paginate_keyset(query: Query, created_column: Any, id_column: Any, cursor: Optional[str], skip: int, limit: int) -> Query:
+    """
+    Order a query newest first and restrict it to one page.
+    
+    With a cursor the page starts right after the cursor row; without one
+    the legacy offset is applied.
+    
+    Args:
+        query: Query to paginate
+        created_column: Creation timestamp column
+        id_column: Primary key column
+        cursor: Cursor of the last row of the previous page
+        skip: Number of records to skip when no cursor is given
+        limit: Maximum number of records to return
+    
+    Returns:
+        Query: Paginated query
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        # SQL Server has no row-value comparison, so expand (a, b) < (x, y)
+        query = query.filter(
+            or_(
+                created_column < created_at,
+                and_(created_column == created_at, id_column < row_id),
+            )
+        )
+        skip = 0
+    return query.order_by(created_column.desc(), id_column.desc()).offset(skip).limit(limit)
+
+
+def next_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    """
+    Build the cursor for the page following ``items``.
+    
+    Args:
+        items: Rows of the current page, newest first
+        limit: Requested page size
+    
+    Returns:
+        Optional[str]: Cursor for the next page, or None if this was the last page
+    """
+    if len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
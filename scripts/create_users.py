@@ -2,8 +2,13 @@
 """
 Script to create users for the Performance Review System.
 This creates an admin user and sample users for testing.
+
+Tables are created by init_db() when the application starts; pass
+--bootstrap-schema to create them here instead when seeding a fresh
+database before the app has run.
 """
 
+import argparse
 import sys
 import os
 from pathlib import Path
@@ -12,117 +17,116 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 from app.core.database import SessionLocal, engine
-from app.core.security import get_password_hash
 from app.models.user import User
-from app.core.config import settings
+from app.repositories.user_repository import UserRepository
+from app.schemas.user import UserCreate
 
-def create_all_users():
-    """Create admin user and sample users."""
-    
-    # Create database tables if they don't exist
+# (label, password, user row) for every seeded user; the admin comes first
+ADMIN_USER = (
+    "🔐 ADMIN USER",
+    "Admin@123",
+    {
+        "email": "admin@kedaara.com",
+        "name": "System Administrator",
+        "role": "System Administrator",
+        "department": "IT",
+        "position": "System Administrator",
+    },
+)
+SAMPLE_USERS = [
+    (
+        "👥 HR LEAD",
+        "HR@123",
+        {
+            "email": "hr.lead@kedaara.com",
+            "name": "HR Lead",
+            "role": "HR Lead",
+            "department": "Human Resources",
+            "position": "HR Lead",
+        },
+    ),
+    (
+        "👤 EMPLOYEE",
+        "Emp@123",
+        {
+            "email": "employee@kedaara.com",
+            "name": "John Employee",
+            "role": "Employee",
+            "department": "Engineering",
+            "position": "Software Developer",
+        },
+    ),
+    (
+        "🎓 MENTOR",
+        "Mentor@123",
+        {
+            "email": "mentor@kedaara.com",
+            "name": "Sarah Mentor",
+            "role": "Mentor",
+            "department": "Engineering",
+            "position": "Senior Developer",
+        },
+    ),
+    (
+        "🏛️  PEOPLE COMMITTEE",
+        "Committee@123",
+        {
+            "email": "committee@kedaara.com",
+            "name": "Mike Committee",
+            "role": "People Committee",
+            "department": "Management",
+            "position": "Committee Member",
+        },
+    ),
+]
+
+
+def bootstrap_schema():
+    """Create any missing tables (fresh databases only)."""
     from app.models import Base
     Base.metadata.create_all(bind=engine)
+
+
+def create_all_users(include_samples=True):
+    """Create the admin user and, optionally, the sample users."""
+    
+    seed_users = [ADMIN_USER] + (SAMPLE_USERS if include_samples else [])
     
     db = SessionLocal()
     try:
         print("🚀 Creating users for Performance Review System...")
         print("=" * 60)
         
-        # Create admin user
-        admin_user = User(
-            email="admin@kedaara.com",
-            name="System Administrator",
-            role="System Administrator",
-            department="IT",
-            position="System Administrator",
-            password_hash=get_password_hash("Admin@123"),
-            is_active=True
-        )
-        
-        # Create sample users
-        hr_lead = User(
-            email="hr.lead@kedaara.com",
-            name="HR Lead",
-            role="HR Lead",
-            department="Human Resources",
-            position="HR Lead",
-            password_hash=get_password_hash("HR@123"),
-            is_active=True
-        )
-        
-        employee = User(
-            email="employee@kedaara.com",
-            name="John Employee",
-            role="Employee",
-            department="Engineering",
-            position="Software Developer",
-            password_hash=get_password_hash("Emp@123"),
-            is_active=True
-        )
-        
-        mentor = User(
-            email="mentor@kedaara.com",
-            name="Sarah Mentor",
-            role="Mentor",
-            department="Engineering",
-            position="Senior Developer",
-            password_hash=get_password_hash("Mentor@123"),
-            is_active=True
-        )
-        
-        committee_member = User(
-            email="committee@kedaara.com",
-            name="Mike Committee",
-            role="People Committee",
-            department="Management",
-            position="Committee Member",
-            password_hash=get_password_hash("Committee@123"),
-            is_active=True
-        )
-        
-        # Add all users
-        users = [admin_user, hr_lead, employee, mentor, committee_member]
-        
-        for user in users:
-            existing_user = db.query(User).filter(User.email == user.email).first()
-            if not existing_user:
-                db.add(user)
-                print(f"✅ Created user: {user.email} ({user.role})")
+        # One lookup for all emails, so re-runs never hash passwords of existing users
+        emails = [user["email"] for _, _, user in seed_users]
+        existing_emails = set(db.scalars(select(User.email).where(User.email.in_(emails))))
+        missing = []
+        for _, password, user in seed_users:
+            if user["email"] not in existing_emails:
+                missing.append((password, user))
+                print(f"✅ Created user: {user['email']} ({user['role']})")
             else:
-                print(f"⚠️  User already exists: {user.email}")
+                print(f"⚠️  User already exists: {user['email']}")
         
-        db.commit()
+        # UserRepository.create_many hashes the passwords in parallel and
+        # inserts the rows in bulk. model_construct skips validation because
+        # the sample passwords predate UserCreate's 8-character minimum.
+        if missing:
+            UserRepository(db).create_many(
+                [UserCreate.model_construct(**user, password=password, is_active=True) for password, user in missing]
+            )
         
         print("\n" + "=" * 60)
         print("📋 LOGIN CREDENTIALS")
         print("=" * 60)
-        print()
-        print("🔐 ADMIN USER:")
-        print(f"   Email: admin@kedaara.com")
-        print(f"   Password: Admin@123")
-        print(f"   Role: System Administrator")
-        print()
-        print("👥 HR LEAD:")
-        print(f"   Email: hr.lead@kedaara.com")
-        print(f"   Password: HR@123")
-        print(f"   Role: HR Lead")
-        print()
-        print("👤 EMPLOYEE:")
-        print(f"   Email: employee@kedaara.com")
-        print(f"   Password: Emp@123")
-        print(f"   Role: Employee")
-        print()
-        print("🎓 MENTOR:")
-        print(f"   Email: mentor@kedaara.com")
-        print(f"   Password: Mentor@123")
-        print(f"   Role: Mentor")
-        print()
-        print("🏛️  PEOPLE COMMITTEE:")
-        print(f"   Email: committee@kedaara.com")
-        print(f"   Password: Committee@123")
-        print(f"   Role: People Committee")
+        for label, password, user in seed_users:
+            print()
+            print(f"{label}:")
+            print(f"   Email: {user['email']}")
+            print(f"   Password: {password}")
+            print(f"   Role: {user['role']}")
         print()
         print("=" * 60)
         print("⚠️  IMPORTANT:")
@@ -138,4 +142,11 @@ def create_all_users():
         db.close()
 
 if __name__ == "__main__":
-    create_all_users()
+    parser = argparse.ArgumentParser(description="Create users for the Performance Review System.")
+    parser.add_argument("--admin-only", action="store_true", help="Create only the admin user")
+    parser.add_argument("--bootstrap-schema", action="store_true", help="Create missing tables before seeding")
+    args = parser.parse_args()
+    
+    if args.bootstrap_schema:
+        bootstrap_schema()
+    create_all_users(include_samples=not args.admin_only)
@@ -5,13 +5,14 @@ Test script to verify database connection.
 
 import sys
 import os
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
 # Add the app directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.core.config import settings
+from app.core.database import engine
 
 
 def test_database_connection():
@@ -20,29 +21,20 @@ def test_database_connection():
     print(f"Database URL: {settings.database_url}")
     
     try:
-        # Create engine
-        engine = create_engine(
-            settings.database_url,
-            echo=True,  # Enable SQL logging for debugging
-            connect_args={
-                "TrustServerCertificate": "yes",
-                "Encrypt": "yes",
-            }
-        )
+        # Use the application's pooled engine so its settings are what gets tested
+        # SQL logging is opt-in (SQL_ECHO=1) so routine runs skip the formatting cost
+        engine.echo = os.getenv("SQL_ECHO") == "1"
         
         # Test connection
         with engine.connect() as connection:
             print("✅ Successfully connected to database!")
             
-            # Test a simple query
-            result = connection.execute(text("SELECT @@VERSION as version"))
-            version = result.fetchone()
-            print(f"✅ SQL Server Version: {version[0]}")
-            
-            # Test database name
-            result = connection.execute(text("SELECT DB_NAME() as database_name"))
-            db_name = result.fetchone()
-            print(f"✅ Connected to database: {db_name[0]}")
+            # Read server version and database name in one round trip
+            version, db_name = connection.execute(
+                text("SELECT @@VERSION AS version, DB_NAME() AS database_name")
+            ).one()
+            print(f"✅ SQL Server Version: {version}")
+            print(f"✅ Connected to database: {db_name}")
             
             # Test if we can create tables (check permissions)
             print("✅ Database connection test completed successfully!")
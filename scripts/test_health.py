@@ -6,6 +6,9 @@ Test script to verify health endpoints.
 import requests
 import json
 
+# One keep-alive connection is reused for every request the script makes
+session = requests.Session()
+
 def test_health_endpoints():
     """Test health check endpoints."""
     
@@ -16,7 +19,7 @@ def test_health_endpoints():
     
     # Test basic health check
     try:
-        response = requests.get(f"{base_url}/api/v1/health")
+        response = session.get(f"{base_url}/api/v1/health")
         print(f"\n🔍 Basic Health Check:")
         print(f"   Status Code: {response.status_code}")
         if response.status_code == 200:
@@ -33,7 +36,7 @@ def test_health_endpoints():
     
     # Test detailed health check
     try:
-        response = requests.get(f"{base_url}/api/v1/health/detailed")
+        response = session.get(f"{base_url}/api/v1/health/detailed")
         print(f"\n🔍 Detailed Health Check:")
         print(f"   Status Code: {response.status_code}")
         if response.status_code == 200:
@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
 """
 Test script to verify login functionality for all users.
+
+With --concurrency the script instead drives the login endpoint as a small
+load test and reports latency percentiles.
 """
 
-import requests
+import argparse
+import asyncio
 import json
+import statistics
+import time
+
+import httpx
 
 # Test credentials
 test_users = [
@@ -40,83 +48,129 @@ test_users = [
     }
 ]
 
-def test_login():
-    """Test login for all users."""
+async def test_login():
+    """Test login for all users concurrently."""
     
     base_url = "http://localhost:8000"
-    login_url = f"{base_url}/api/v1/auth/login"
     
     print("🔐 Testing Login Functionality")
     print("=" * 50)
     
-    for user in test_users:
-        print(f"\n👤 Testing: {user['name']} ({user['role']})")
-        print(f"   Email: {user['email']}")
+    # All users are tested at once over one client; each report is printed
+    # as a block so the output does not interleave
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        reports = await asyncio.gather(*(login_and_probe(client, user) for user in test_users))
+    
+    for lines in reports:
+        print("\n" + "\n".join(lines))
+    
+    print("\n" + "=" * 50)
+    print("🎯 Login Testing Complete!")
+
+async def login_and_probe(client, user):
+    """Log in as one user and probe a protected endpoint; returns the report lines."""
+    lines = [
+        f"👤 Testing: {user['name']} ({user['role']})",
+        f"   Email: {user['email']}",
+    ]
+    
+    try:
+        # Make login request
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"email": user["email"], "password": user["password"]}
+        )
         
-        try:
-            # Prepare login data
-            login_data = {
-                "email": user["email"],
-                "password": user["password"]
-            }
+        if response.status_code == 200:
+            # Login successful
+            result = response.json()
+            lines.append(f"   ✅ Login SUCCESSFUL!")
+            lines.append(f"   🔑 Access Token: {result['access_token'][:50]}...")
+            lines.append(f"   📋 Token Type: {result['token_type']}")
+            lines.append(f"   👤 User ID: {result['user']['id']}")
+            lines.append(f"   🏷️  User Role: {result['user']['role']}")
             
-            # Make login request
-            response = requests.post(
-                login_url,
-                json=login_data,
-                headers={"Content-Type": "application/json"}
-            )
+            # Test a protected endpoint
+            lines.append(await test_protected_endpoint(client, result['access_token']))
             
-            if response.status_code == 200:
-                # Login successful
-                result = response.json()
-                print(f"   ✅ Login SUCCESSFUL!")
-                print(f"   🔑 Access Token: {result['access_token'][:50]}...")
-                print(f"   📋 Token Type: {result['token_type']}")
-                print(f"   👤 User ID: {result['user']['id']}")
-                print(f"   🏷️  User Role: {result['user']['role']}")
-                
-                # Test a protected endpoint
-                test_protected_endpoint(base_url, result['access_token'], user['name'])
+        else:
+            # Login failed
+            lines.append(f"   ❌ Login FAILED!")
+            lines.append(f"   📊 Status Code: {response.status_code}")
+            try:
+                error_detail = response.json()
+                lines.append(f"   📝 Error: {error_detail.get('detail', 'Unknown error')}")
+            except ValueError:
+                lines.append(f"   📝 Error: {response.text}")
                 
-            else:
-                # Login failed
-                print(f"   ❌ Login FAILED!")
-                print(f"   📊 Status Code: {response.status_code}")
-                try:
-                    error_detail = response.json()
-                    print(f"   📝 Error: {error_detail.get('detail', 'Unknown error')}")
-                except:
-                    print(f"   📝 Error: {response.text}")
-                    
-        except requests.exceptions.ConnectionError:
-            print(f"   ❌ Connection Error: Make sure the server is running on {base_url}")
-            break
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
+    except httpx.ConnectError:
+        lines.append(f"   ❌ Connection Error: Make sure the server is running on {client.base_url}")
+    except Exception as e:
+        lines.append(f"   ❌ Error: {str(e)}")
     
-    print("\n" + "=" * 50)
-    print("🎯 Login Testing Complete!")
+    return lines
 
-def test_protected_endpoint(base_url, token, user_name):
-    """Test accessing a protected endpoint."""
+async def test_protected_endpoint(client, token):
+    """Test accessing a protected endpoint; returns the report line."""
     try:
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-        
         # Test getting user profile
-        profile_url = f"{base_url}/api/v1/users/me"
-        response = requests.get(profile_url, headers=headers)
+        response = await client.get("/api/v1/users/me", headers={"Authorization": f"Bearer {token}"})
         
         if response.status_code == 200:
-            print(f"   🔒 Protected endpoint test: ✅ SUCCESS")
-        else:
-            print(f"   🔒 Protected endpoint test: ❌ FAILED (Status: {response.status_code})")
+            return f"   🔒 Protected endpoint test: ✅ SUCCESS"
+        return f"   🔒 Protected endpoint test: ❌ FAILED (Status: {response.status_code})"
             
     except Exception as e:
-        print(f"   🔒 Protected endpoint test: ❌ ERROR - {str(e)}")
+        return f"   🔒 Protected endpoint test: ❌ ERROR - {str(e)}"
+
+async def load_test_login(concurrency, rounds):
+    """Log in as every test user ``rounds`` times from ``concurrency`` concurrent clients."""
+    
+    base_url = "http://localhost:8000"
+    latencies = []
+    failures = 0
+    
+    async def worker(client):
+        nonlocal failures
+        for _ in range(rounds):
+            for user in test_users:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/api/v1/auth/login",
+                        json={"email": user["email"], "password": user["password"]}
+                    )
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append(time.perf_counter() - started)
+                if not ok:
+                    failures += 1
+    
+    print(f"🚀 Load testing login: {concurrency} clients x {rounds} rounds x {len(test_users)} users")
+    print("=" * 50)
+    
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    started = time.perf_counter()
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    
+    # quantiles(n=100) yields the 1st..99th percentile cut points
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    print(f"   Requests: {len(latencies)} ({failures} failed) in {elapsed:.2f}s")
+    print(f"   Throughput: {len(latencies) / elapsed:.1f} req/s")
+    print(f"   Latency p50: {percentiles[49] * 1000:.1f} ms")
+    print(f"   Latency p95: {percentiles[94] * 1000:.1f} ms")
+    print(f"   Latency p99: {percentiles[98] * 1000:.1f} ms")
 
 if __name__ == "__main__":
-    test_login()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, help="Run as a load test with this many concurrent clients")
+    parser.add_argument("--rounds", type=int, default=10, help="Logins per user and client in load-test mode")
+    args = parser.parse_args()
+    
+    if args.concurrency:
+        asyncio.run(load_test_login(args.concurrency, args.rounds))
+    else:
+        asyncio.run(test_login())
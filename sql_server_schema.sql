@@ -57,7 +57,7 @@ CREATE TABLE reviewer_selection_details (
     selection_id INT NOT NULL,
     reviewer_id INT NOT NULL,
     created_at DATETIME2 DEFAULT GETUTCDATE(),
-    FOREIGN KEY (selection_id) REFERENCES reviewer_selections(id),
+    FOREIGN KEY (selection_id) REFERENCES reviewer_selections(id) ON DELETE CASCADE,
     FOREIGN KEY (reviewer_id) REFERENCES users(id)
 );
 GO
@@ -68,8 +68,8 @@ CREATE TABLE feedback_forms (
     employee_id INT NOT NULL,
     reviewer_id INT NOT NULL,
     performance_cycle_id INT NOT NULL,
-    strengths NVARCHAR(MAX) NOT NULL,
-    improvements NVARCHAR(MAX) NOT NULL,
+    strengths NVARCHAR(4000) NOT NULL,
+    improvements NVARCHAR(4000) NOT NULL,
     overall_rating NVARCHAR(50) NOT NULL, -- tracking_below, tracking_expected, tracking_above
     status NVARCHAR(50) NOT NULL, -- draft, submitted
     created_at DATETIME2 DEFAULT GETUTCDATE(),
@@ -95,16 +95,22 @@ GO
 
 -- Create indexes for better performance
 CREATE INDEX IX_users_email ON users(email);
-CREATE INDEX IX_users_role ON users(role);
+CREATE INDEX IX_users_role_department ON users(role, department);
+CREATE INDEX IX_users_active_role_department ON users(is_active, role, department);
 CREATE INDEX IX_performance_cycles_status ON performance_cycles(status);
-CREATE INDEX IX_reviewer_selections_mentee_id ON reviewer_selections(mentee_id);
+CREATE INDEX IX_performance_cycles_active ON performance_cycles(status) WHERE status = 'active';
 CREATE INDEX IX_reviewer_selections_cycle_id ON reviewer_selections(performance_cycle_id);
+CREATE UNIQUE INDEX IX_reviewer_selections_mentee_cycle ON reviewer_selections(mentee_id, performance_cycle_id);
 CREATE INDEX IX_reviewer_selection_details_selection_id ON reviewer_selection_details(selection_id);
-CREATE INDEX IX_feedback_forms_employee_id ON feedback_forms(employee_id);
-CREATE INDEX IX_feedback_forms_reviewer_id ON feedback_forms(reviewer_id);
+CREATE INDEX IX_feedback_forms_reviewer_employee_cycle ON feedback_forms(reviewer_id, employee_id, performance_cycle_id) INCLUDE (status);
 CREATE INDEX IX_feedback_forms_cycle_id ON feedback_forms(performance_cycle_id);
-CREATE INDEX IX_notifications_user_id ON notifications(user_id);
+CREATE INDEX IX_feedback_forms_created_at_id ON feedback_forms(created_at, id);
+CREATE INDEX IX_feedback_forms_employee_cycle ON feedback_forms(employee_id, performance_cycle_id);
+CREATE INDEX IX_feedback_forms_status ON feedback_forms(status);
 CREATE INDEX IX_notifications_is_read ON notifications(is_read);
+CREATE INDEX IX_notifications_created_at_id ON notifications(created_at, id);
+CREATE INDEX IX_notifications_user_id_is_read_created_at ON notifications(user_id, is_read, created_at DESC, id DESC);
+CREATE INDEX IX_notifications_user_id_created_at_id ON notifications(user_id, created_at DESC, id DESC);
 GO
 
 -- Create triggers to update the updated_at column
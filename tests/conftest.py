@@ -2,28 +2,72 @@
 Pytest configuration and fixtures.
 """
 
+import os
+
+# Sign test tokens with a fixed HS256 key, whatever the local .env says;
+# settings and the encoded signing key are read when the app is imported
+os.environ["SECRET_KEY"] = "test-secret-key-for-the-pytest-suite-only"
+os.environ["ALGORITHM"] = "HS256"
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.api.dependencies import _token_cache
+from app.services.performance_cycle_service import _active_cycle_cache
+from app.core.database import Base, get_db, get_session_factory
 from app.core.config import settings
+from app.core.roles import EMPLOYEE, SYSTEM_ADMINISTRATOR
+from app.core.security import create_access_token, pwd_context
+from app.schemas.user import UserCreate
+from app.services.user_service import UserService
 
+# Hash test passwords with the cheapest argon2/bcrypt settings; hashing is by
+# far the largest CPU cost of the user and auth tests. Hashes made this way
+# still verify normally and are not flagged for rehashing.
+pwd_context.update(argon2__time_cost=1, argon2__memory_cost=8, argon2__parallelism=1, bcrypt__rounds=4)
 
-# Create in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
+# Create a shared-cache in-memory SQLite database for testing, one per
+# pytest-xdist worker so parallel workers never see each other's data
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+SQLALCHEMY_DATABASE_URL = f"sqlite+pysqlite:///file:kedaara_{XDIST_WORKER}?mode=memory&cache=shared&uri=true"
+
+# mode=memory would otherwise select SingletonThreadPool; request a real pool
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    poolclass=QueuePool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# pysqlite manages transactions itself and breaks SAVEPOINT; hand transaction
+# control to SQLAlchemy so each test can run inside a rolled-back transaction
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+# The test database is throwaway: skip durability work and enforce foreign
+# keys, which SQLite leaves off by default
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.executescript(
+        "PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; PRAGMA temp_store=MEMORY; PRAGMA foreign_keys=ON;"
+    )
+    cursor.close()
+
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
 def override_get_db():
     """Override database dependency for testing."""
     try:
@@ -33,49 +77,154 @@ def override_get_db():
         db.close()
 
 
-# Override the database dependency
-app.dependency_overrides[get_db] = override_get_db
+@pytest.fixture(scope="session", autouse=True)
+def _override_db():
+    """Point the app's database dependencies at the test database for the session."""
+    previous = app.dependency_overrides.copy()
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+    yield
+    app.dependency_overrides = previous
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema():
+    """
+    Create the schema once for the whole test session.
+    
+    A shared-cache in-memory database is discarded when its last connection
+    closes, so one connection is held open until the session ends.
+    """
+    keepalive = engine.connect()
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+    keepalive.close()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="function", autouse=True)
 def db():
-    """Database session fixture."""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    """
+    Database session fixture.
+    
+    The test runs inside one outer transaction that is rolled back at the
+    end. The fixture session and the sessions handed to endpoints join it
+    through SAVEPOINTs, so their commits and rollbacks stay inside the test.
+    It is autouse so that tests which only call endpoints are isolated too.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session_factory = sessionmaker(
+        autocommit=False, autoflush=False, bind=connection, join_transaction_mode="create_savepoint"
+    )
+    
+    def override_get_db_in_transaction():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    previous = app.dependency_overrides.copy()
+    app.dependency_overrides[get_db] = override_get_db_in_transaction
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    # Seeded objects stay loaded after commit; endpoint sessions keep the app's expiry
+    db = session_factory(expire_on_commit=False)
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
-
-
-@pytest.fixture(scope="function")
+        app.dependency_overrides = previous
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(autouse=True)
+def _clear_process_caches():
+    """
+    Empty the in-process auth and active-cycle caches after each test.
+    
+    Rolled-back tests reuse primary keys, so a token minted in one test can
+    be identical to one from an earlier test and must not resolve to its
+    cached user.
+    """
+    yield
+    _token_cache.clear()
+    _active_cycle_cache.clear()
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Test client fixture."""
+    """
+    Test client fixture, shared by the whole session.
+    
+    The client holds no per-test state; isolation comes from the overridden
+    database dependencies. It is not entered as a context manager, so the
+    startup/shutdown handlers (real database init, executor shutdown) never run.
+    """
     return TestClient(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_user_data():
     """Test user data fixture."""
     return {
         "email": "test@example.com",
-        "username": "testuser",
-        "full_name": "Test User",
+        "name": "Test User",
+        "role": EMPLOYEE,
         "password": "testpassword123",
-        "is_active": True,
-        "is_superuser": False
+        "is_active": True
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_superuser_data():
     """Test superuser data fixture."""
     return {
         "email": "admin@example.com",
-        "username": "admin",
-        "full_name": "Admin User",
+        "name": "Admin User",
+        "role": SYSTEM_ADMINISTRATOR,
         "password": "adminpassword123",
-        "is_active": True,
-        "is_superuser": True
+        "is_active": True
     }
+
+
+@pytest.fixture(scope="session")
+def test_user_create(test_user_data):
+    """Validated test user creation data, built once per session."""
+    return UserCreate(**test_user_data)
+
+
+@pytest.fixture(scope="session")
+def test_superuser_create(test_superuser_data):
+    """Validated test superuser creation data, built once per session."""
+    return UserCreate(**test_superuser_data)
+
+
+@pytest.fixture(scope="session")
+def superuser_headers(schema, test_superuser_create):
+    """
+    Authorization headers of a System Administrator, created once per session.
+    
+    The superuser is committed outside the per-test transactions, so it
+    survives their rollbacks and is hashed and signed only once.
+    """
+    session = TestingSessionLocal(expire_on_commit=False)
+    try:
+        superuser = UserService(session).create_user(test_superuser_create)
+    finally:
+        session.close()
+    token = create_access_token(subject=superuser.id)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def user_service(db):
+    """User service bound to the test's session."""
+    return UserService(db)
+
+
+@pytest.fixture
+def regular_user(user_service, test_user_create):
+    """Regular user created inside the test's transaction."""
+    return user_service.create_user(test_user_create)
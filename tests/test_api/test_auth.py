@@ -4,24 +4,21 @@ Tests for authentication endpoints.
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
 
 from app.services.user_service import UserService
 from app.schemas.user import UserCreate
 
 
-def test_login_success(client: TestClient, db: Session, test_user_data: dict):
+def test_login_success(client: TestClient, user_service: UserService, test_user_data: dict, test_user_create: UserCreate):
     """Test successful login."""
     # Create user first
-    user_service = UserService(db)
-    user_create = UserCreate(**test_user_data)
-    user_service.create_user(user_create)
+    user_service.create_user(test_user_create)
     
     # Test login
     response = client.post(
         "/api/v1/auth/login",
         json={
-            "username": test_user_data["username"],
+            "email": test_user_data["email"],
             "password": test_user_data["password"]
         }
     )
@@ -37,31 +34,29 @@ def test_login_invalid_credentials(client: TestClient):
     response = client.post(
         "/api/v1/auth/login",
         json={
-            "username": "nonexistent",
+            "email": "nonexistent@example.com",
             "password": "wrongpassword"
         }
     )
     
     assert response.status_code == 401
-    assert "Incorrect username or password" in response.json()["detail"]
+    assert "Incorrect email or password" in response.json()["detail"]
 
 
-def test_login_inactive_user(client: TestClient, db: Session, test_user_data: dict):
+def test_login_inactive_user(client: TestClient, user_service: UserService, test_user_data: dict, test_user_create: UserCreate):
     """Test login with inactive user."""
-    # Create inactive user
-    user_service = UserService(db)
-    test_user_data["is_active"] = False
-    user_create = UserCreate(**test_user_data)
+    # Create inactive user; the shared data is session-scoped, so copy instead of mutating
+    user_create = test_user_create.model_copy(update={"is_active": False})
     user_service.create_user(user_create)
     
     # Test login
     response = client.post(
         "/api/v1/auth/login",
         json={
-            "username": test_user_data["username"],
+            "email": test_user_data["email"],
             "password": test_user_data["password"]
         }
     )
     
     assert response.status_code == 401
-    assert "Incorrect username or password" in response.json()["detail"]
+    assert "Incorrect email or password" in response.json()["detail"]
@@ -0,0 +1,81 @@
+"""
+Tests for notification endpoints.
+"""
+
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.security import create_access_token
+from app.models import Notification
+from app.schemas.user import UserResponse
+from app.utils.pagination import NEXT_CURSOR_HEADER
+
+
+def get_auth_headers(token: str):
+    """Get authorization headers."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+def create_notifications(db: Session, user_id: int, count: int) -> None:
+    """Create notifications for a user, one minute apart."""
+    now = datetime.utcnow()
+    db.add_all(
+        Notification(
+            user_id=user_id,
+            title=f"Notification {i}",
+            message="Message",
+            type="info",
+            is_read=False,
+            created_at=now + timedelta(minutes=i),
+        )
+        for i in range(count)
+    )
+    db.commit()
+
+
+def test_notifications_cursor_round_trip(client: TestClient, db: Session, regular_user: UserResponse):
+    """The X-Next-Cursor header continues the listing without overlap."""
+    create_notifications(db, regular_user.id, 3)
+    headers = get_auth_headers(create_access_token(subject=regular_user.id))
+    
+    first = client.get(
+        "/api/v1/notifications/",
+        params={"limit": 2},
+        headers={**headers, "Origin": "http://frontend.example.com"}
+    )
+    
+    assert first.status_code == 200
+    assert [n["title"] for n in first.json()] == ["Notification 2", "Notification 1"]
+    assert NEXT_CURSOR_HEADER in first.headers["access-control-expose-headers"]
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+    
+    second = client.get("/api/v1/notifications/", params={"limit": 2, "cursor": cursor}, headers=headers)
+    
+    assert second.status_code == 200
+    assert [n["title"] for n in second.json()] == ["Notification 0"]
+    assert NEXT_CURSOR_HEADER not in second.headers
+
+
+def test_notifications_malformed_cursor(client: TestClient, regular_user: UserResponse):
+    """A cursor that does not decode is rejected with 422."""
+    headers = get_auth_headers(create_access_token(subject=regular_user.id))
+    
+    response = client.get("/api/v1/notifications/", params={"cursor": "not-a-cursor"}, headers=headers)
+    
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+def test_has_unread(client: TestClient, db: Session, regular_user: UserResponse):
+    """The badge dot endpoint reports whether any notification is unread."""
+    headers = get_auth_headers(create_access_token(subject=regular_user.id))
+    
+    response = client.get("/api/v1/notifications/has-unread", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"has_unread": False}
+    
+    create_notifications(db, regular_user.id, 1)
+    response = client.get("/api/v1/notifications/has-unread", headers=headers)
+    assert response.json() == {"has_unread": True}
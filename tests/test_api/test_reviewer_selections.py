@@ -0,0 +1,75 @@
+"""
+Tests for reviewer selection endpoints.
+"""
+
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.security import create_access_token, get_password_hash
+from app.models import PerformanceCycle, ReviewerSelection, ReviewerSelectionDetail, User
+
+
+def get_auth_headers(token: str):
+    """Get authorization headers."""
+    return {"Authorization": f"Bearer {token}"}
+
+
+def create_user(db: Session, email: str, role: str) -> User:
+    """Create a user directly in the database."""
+    user = User(
+        email=email,
+        name=email.split("@")[0],
+        role=role,
+        password_hash=get_password_hash("password123"),
+        is_active=True,
+        created_at=datetime.utcnow(),
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def test_pending_approvals_loads_relations_eagerly(client: TestClient, db: Session):
+    """Pending approvals must not rely on lazy loading (raiseload is active in testing)."""
+    mentor = create_user(db, "mentor@example.com", "Mentor")
+    mentee = create_user(db, "mentee@example.com", "Employee")
+    reviewer = create_user(db, "reviewer@example.com", "People Committee")
+    
+    now = datetime.utcnow()
+    cycle = PerformanceCycle(
+        name="H1",
+        start_date=now,
+        end_date=now + timedelta(days=90),
+        status="active",
+        created_at=now,
+    )
+    db.add(cycle)
+    db.commit()
+    
+    selection = ReviewerSelection(
+        performance_cycle_id=cycle.id,
+        mentee_id=mentee.id,
+        status="pending",
+        submitted_at=now,
+        created_at=now,
+    )
+    db.add(selection)
+    db.commit()
+    db.add(ReviewerSelectionDetail(selection_id=selection.id, reviewer_id=reviewer.id, created_at=now))
+    db.commit()
+    
+    token = create_access_token(subject=mentor.id)
+    response = client.get(
+        "/api/v1/reviewer-selections/mentor/approvals/pending",
+        headers=get_auth_headers(token)
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["mentee"]["id"] == mentee.id
+    assert [r["id"] for r in data[0]["selected_reviewers"]] == [reviewer.id]
+    assert data[0]["performance_cycle"]["id"] == cycle.id